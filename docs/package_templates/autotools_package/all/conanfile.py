@@ -45,6 +45,12 @@ class PackageConan(ConanFile):
     def _settings_build(self):
         return getattr(self, "settings_build", self.settings)
 
+    # ccache is used as compiler launcher when it is in the build context (e.g. in the [tool_requires] of the profile)
+    @property
+    def _ccache(self):
+        ccache = self.dependencies.build.get("ccache")
+        return ccache.conf_info.get("user.ccache:launcher", check_type=str) if ccache else None
+
     # no exports_sources attribute, but export_sources(self) method instead
     # this allows finer grain exportation of patches per version
     def export_sources(self):
@@ -144,6 +150,16 @@ class PackageConan(ConanFile):
             env.define("STRIP", ":")
             env.vars(self).save_script("conanbuild_msvc")
 
+        # If ccache is in the build context, wrap the compilers with it
+        if self._ccache and not is_msvc(self):
+            compilers_by_conf = self.conf.get("tools.build:compiler_executables", default={}, check_type=dict)
+            buildenv_vars = VirtualBuildEnv(self).vars()
+            env = Environment()
+            for var, key, default in (("CC", "c", "cc"), ("CXX", "cpp", "c++")):
+                compiler = compilers_by_conf.get(key) or buildenv_vars.get(var, default)
+                env.define(var, f"{unix_path(self, self._ccache)} {compiler}")
+            env.vars(self).save_script("conanbuild_ccache")
+
     def build(self):
         # apply patches listed in conandata.yml
         apply_conandata_patches(self)
@@ -32,10 +32,13 @@ class PackageConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        # lto is the standard link time optimization option of CMake projects, see docs/adding_packages/conanfile_attributes.md
+        "lto": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "lto": False,
     }
 
     @property
@@ -51,6 +54,12 @@ class PackageConan(ConanFile):
             "apple-clang": "10",
         }
 
+    # ccache is used as compiler launcher when it is in the build context (e.g. in the [tool_requires] of the profile)
+    @property
+    def _ccache(self):
+        ccache = self.dependencies.build.get("ccache")
+        return ccache.conf_info.get("user.ccache:launcher", check_type=str) if ccache else None
+
     # no exports_sources attribute, but export_sources(self) method instead
     # this allows finer grain exportation of patches per version
     def export_sources(self):
@@ -75,6 +84,11 @@ class PackageConan(ConanFile):
         # prefer self.requires method instead of requires attribute
         self.requires("dependency/0.8.1")
 
+    def package_id(self):
+        # lto=False builds the same binaries as before the option existed, keep their package IDs
+        if not self.info.options.lto:
+            del self.info.options.lto
+
     def validate(self):
         # validate the minimum cpp standard supported. For C++ projects only
         if self.settings.compiler.cppstd:
@@ -110,6 +124,12 @@ class PackageConan(ConanFile):
             tc.variables["DEPENDENCY_LIBPATH"] = self.dependencies["dependency"].cpp_info.libdirs
         # cache_variables should be used sparingly, example setting cmake policies
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0077"] = "NEW"
+        tc.variables["CMAKE_INTERPROCEDURAL_OPTIMIZATION"] = self.options.lto
+        # CMAKE_INTERPROCEDURAL_OPTIMIZATION is ignored by projects requiring CMake < 3.9 without this policy
+        tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0069"] = "NEW"
+        if self._ccache:
+            tc.variables["CMAKE_C_COMPILER_LAUNCHER"] = self._ccache.replace("\\", "/")
+            tc.variables["CMAKE_CXX_COMPILER_LAUNCHER"] = self._ccache.replace("\\", "/")
         tc.generate()
         # In case there are dependencies listed on requirements, CMakeDeps should be used
         tc = CMakeDeps(self)
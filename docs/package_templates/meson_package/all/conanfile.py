@@ -54,6 +54,12 @@ class PackageConan(ConanFile):
             "apple-clang": "10",
         }
 
+    # ccache is used as compiler launcher when it is in the build context (e.g. in the [tool_requires] of the profile)
+    @property
+    def _ccache(self):
+        ccache = self.dependencies.build.get("ccache")
+        return ccache.conf_info.get("user.ccache:launcher", check_type=str) if ccache else None
+
     # no exports_sources attribute, but export_sources(self) method instead
     # this allows finer grain exportation of patches per version
     def export_sources(self):
@@ -113,6 +119,14 @@ class PackageConan(ConanFile):
         # Meson project options may vary their types
         tc.project_options["tests"] = False
         tc.generate()
+        # Meson runs the compilers with the commands of the machine file, prefix them with ccache
+        if self._ccache:
+            ccache = self._ccache.replace("\\", "/")
+            for filename in (MesonToolchain.native_filename, MesonToolchain.cross_filename):
+                machine_file = os.path.join(self.generators_folder, filename)
+                if os.path.isfile(machine_file):
+                    replace_in_file(self, machine_file, f"\nc = '{tc.c}'", f"\nc = ['{ccache}', '{tc.c}']", strict=False)
+                    replace_in_file(self, machine_file, f"\ncpp = '{tc.cpp}'", f"\ncpp = ['{ccache}', '{tc.cpp}']", strict=False)
         # In case there are dependencies listed on requirements, PkgConfigDeps should be used
         tc = PkgConfigDeps(self)
         tc.generate()
@@ -0,0 +1,209 @@
+"""
+Measure the time taken by each stage of the linters over the recipes listed in benchmark_recipes.txt:
+
+- yaml: strictyaml validation of the conandata.yml and config.yml files (the reference backend)
+- astroid: building the recipe module and inferring its imports and base classes, as pylint does
+- transforms: time spent in the astroid transforms of transform_conanfile.py and transform_imports.py,
+  including their predicates, which are evaluated for every class and module built
+- walk: walking the recipe module the way pylint does, without any checker
+- checker:<name>: each BaseChecker of the conanv2_transition plugin, walking the recipe module
+
+Each group of stages runs in its own process, so its peak RSS is reported. Save the results as a baseline
+and compare a later run to flag the stages which got slower:
+
+    python3 linter/benchmark.py --output baseline.json
+    python3 linter/benchmark.py --compare baseline.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+
+LINTER_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_FILE = os.path.join(LINTER_DIR, "benchmark_recipes.txt")
+PLUGINS = ["linter.conanv2_transition", "linter.check_performance", "linter.transform_conanfile", "linter.transform_imports"]
+
+
+def sample_folders():
+    with open(SAMPLE_FILE, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+def _peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def bench_yaml(folders):
+    from conandata_yaml_linter import lint_file as lint_conandata
+    from config_yaml_linter import lint_file as lint_config
+
+    timings = []
+    files = [(lint_conandata, os.path.join(folder, "conandata.yml")) for folder in folders] + \
+            [(lint_config, os.path.join(os.path.dirname(folder), "config.yml")) for folder in sorted(set(folders))]
+    for lint_file, path in files:
+        if os.path.isfile(path):
+            start = time.perf_counter()
+            lint_file(path)
+            timings.append(time.perf_counter() - start)
+    return {"yaml": timings}, _peak_rss_mb()
+
+
+def _timed(function, elapsed):
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed[0] += time.perf_counter() - start
+    return wrapper
+
+
+def _build_recipe(path):
+    """Build the module of a recipe and infer what pylint would infer first: imports and base classes"""
+    import astroid
+
+    module = astroid.MANAGER.ast_from_file(path, "conanfile", source=True)
+    for node in module.nodes_of_class((astroid.ImportFrom, astroid.ClassDef)):
+        try:
+            if isinstance(node, astroid.ImportFrom):
+                node.do_import_module(node.modname)
+            else:
+                list(node.ancestors())
+        except astroid.AstroidError:
+            pass
+    return module
+
+
+def bench_astroid(folders):
+    import astroid
+    import linter.transform_conanfile  # noqa: F401, registers the transforms
+    import linter.transform_imports  # noqa: F401
+
+    # Wrap the transforms of this folder before any module is built
+    transforms_elapsed = [0.0]
+    for transforms in astroid.MANAGER._transform.transforms.values():
+        for i, (transform, predicate) in enumerate(transforms):
+            if transform.__module__.startswith("linter."):
+                transforms[i] = (_timed(transform, transforms_elapsed),
+                                 predicate and _timed(predicate, transforms_elapsed))
+
+    timings = defaultdict(list)
+    for folder in folders:
+        transforms_elapsed[0] = 0.0
+        start = time.perf_counter()
+        _build_recipe(os.path.join(folder, "conanfile.py"))
+        timings["astroid"].append(time.perf_counter() - start - transforms_elapsed[0])
+        timings["transforms"].append(transforms_elapsed[0])
+    return timings, _peak_rss_mb()
+
+
+def bench_checkers(folders):
+    from pylint.lint import PyLinter
+    from pylint.utils import ASTWalker
+
+    linter = PyLinter()
+    linter.load_default_plugins()
+    linter.load_plugin_modules(PLUGINS)
+    # Walking the module without any checker, the cost of each checker is its time above this one
+    walkers = {"walk": ASTWalker(linter)}
+    for checker in linter.get_checkers():
+        if type(checker).__module__.startswith("linter."):
+            checker.add_message = lambda *args, **kwargs: None
+            walker = ASTWalker(linter)
+            walker.add_checker(checker)
+            walkers[f"checker:{type(checker).__name__}"] = walker
+
+    timings = defaultdict(list)
+    for folder in folders:
+        module = _build_recipe(os.path.join(folder, "conanfile.py"))
+        for name, walker in sorted(walkers.items()):
+            start = time.perf_counter()
+            walker.walk(module)
+            timings[name].append(time.perf_counter() - start)
+    return timings, _peak_rss_mb()
+
+
+def percentile(values, percent):
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
+
+
+def run(folders):
+    results = {}
+    # A new process for each group of stages, to measure its own peak memory
+    context = multiprocessing.get_context("spawn")
+    for bench in (bench_yaml, bench_astroid, bench_checkers):
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            timings, peak_rss = executor.submit(bench, folders).result()
+        for stage, values in timings.items():
+            results[stage] = {
+                "files": len(values),
+                "total_ms": sum(values) * 1000,
+                "p50_ms": percentile(values, 50) * 1000,
+                "p90_ms": percentile(values, 90) * 1000,
+                "p99_ms": percentile(values, 99) * 1000,
+                "max_ms": max(values) * 1000,
+                "peak_rss_mb": peak_rss,
+            }
+    return results
+
+
+def print_results(results, baseline=None, threshold=0.0):
+    columns = ["files", "total_ms", "p50_ms", "p90_ms", "p99_ms", "max_ms", "peak_rss_mb"]
+    print(f"{'stage':<48}" + "".join(f"{column:>13}" for column in columns))
+    regressions = []
+    for stage, result in results.items():
+        line = f"{stage:<48}" + "".join(f"{result[column]:>13.2f}" for column in columns[1:])
+        line = f"{stage:<48}{result['files']:>13}" + line[48:]
+        previous = (baseline or {}).get(stage)
+        if previous:
+            change = (result["total_ms"] - previous["total_ms"]) / max(previous["total_ms"], 1e-6)
+            line += f"  {change:+.1%}"
+            if change > threshold:
+                regressions.append(stage)
+                line += "  REGRESSION"
+        print(line)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the time taken by each stage of the linters.")
+    parser.add_argument("--output", help="save the results to this JSON file, to be used as baseline.")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare the results to a previous run.")
+    parser.add_argument("--threshold", type=float, default=10,
+                        help="increase of the total time of a stage, in percent, reported as a regression "
+                             "(default: 10).")
+    args = parser.parse_args()
+
+    results = run(sample_folders())
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "stages": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["stages"]
+    regressions = print_results(results, baseline, args.threshold / 100)
+    if regressions:
+        print(f"{len(regressions)} stages slower than the baseline by more than {args.threshold}%", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
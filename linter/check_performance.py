@@ -0,0 +1,154 @@
+"""
+
+Pylint plugin/rules for the performance of conanfiles in Conan Center Index
+
+"""
+
+from pylint.checkers import BaseChecker
+from pylint.interfaces import IAstroidChecker
+from pylint.lint import PyLinter
+from astroid import nodes
+
+
+# Methods evaluated for every recipe of the dependency graph, each time it is resolved
+GRAPH_METHODS = ["config_options", "configure", "validate", "requirements", "build_requirements", "package_id"]
+
+SUBPROCESS_FUNCTIONS = ["run", "call", "check_call", "check_output", "Popen", "getoutput", "getstatusoutput"]
+OS_SUBPROCESS_FUNCTIONS = ["system", "popen", "spawnl", "spawnlp", "spawnv", "spawnvp", "execl", "execlp", "execv",
+                           "execvp"]
+
+# Modules not already imported by Conan when it loads a recipe, measured with Conan 1.59: importing them is paid
+#   by every recipe of the graph
+HEAVY_MODULES = ["pkg_resources", "setuptools", "unittest", "numpy", "scipy", "pandas", "lxml", "tkinter",
+                 "matplotlib"]
+
+
+def _call_name(node: nodes.Call):
+    """(prefix, name) of the function called, the prefix being the name of the object the function belongs to"""
+    func = node.func
+    if isinstance(func, nodes.Name):
+        return None, func.name
+    if isinstance(func, nodes.Attribute):
+        return func.expr.name if isinstance(func.expr, nodes.Name) else "", func.attrname
+    return None, None
+
+
+def _is_collect_libs(node: nodes.Call) -> bool:
+    return _call_name(node)[1] == "collect_libs"
+
+
+def _is_file_read(node: nodes.Call) -> bool:
+    prefix, name = _call_name(node)
+    if name in ("read_text", "read_bytes") and prefix is not None:
+        return True
+    if name not in ("open", "load") or prefix not in (None, "tools", "files", "io", "codecs"):
+        return False
+    return not _reads_recipe_file(node)
+
+
+def _reads_recipe_file(node: nodes.Call) -> bool:
+    """The files of the recipe are part of it, the ones of the package must be read by every consumer"""
+    for arg in node.args[:2]:  # open(path), load(self, path)
+        if "recipe_folder" in arg.as_string():
+            return True
+        if isinstance(arg, nodes.Name):
+            _, assignments = arg.lookup(arg.name)
+            if any("recipe_folder" in assignment.statement().as_string() for assignment in assignments):
+                return True
+    return False
+
+
+def _is_subprocess(node: nodes.Call) -> bool:
+    prefix, name = _call_name(node)
+    return (prefix == "self" and name == "run") or \
+           (prefix == "subprocess" and name in SUBPROCESS_FUNCTIONS) or \
+           (prefix == "os" and name in OS_SUBPROCESS_FUNCTIONS)
+
+
+class Performance(BaseChecker):
+    """
+       Recipes should not slow down the resolution of the dependency graph, or the consumers of their packages
+    """
+
+    __implements__ = IAstroidChecker
+
+    name = "conan-performance"
+    msgs = {
+        "W9015": (
+            "collect_libs() is called by %s",
+            "conan-package-info-collect-libs",
+            "package_info() is evaluated by every consumer of the package, and collect_libs() lists the files of the "
+            "package folder each time. List the libraries explicitly: they are known when writing the recipe.",
+        ),
+        "W9016": (
+            "%s reads a file",
+            "conan-package-info-read-file",
+            "package_info() is evaluated by every consumer of the package, and reading a file of the package folder "
+            "each time is slow. Write the information into the recipe, or compute it once in package().",
+        ),
+        "W9017": (
+            "%s runs a subprocess",
+            "conan-subprocess-in-graph-method",
+            "config_options(), configure(), validate(), requirements(), build_requirements() and package_id() are "
+            "evaluated every time the dependency graph is resolved, running a process there slows down every "
+            "`conan install`. Move it to build() or package(), or cache its result.",
+        ),
+        "C9018": (
+            "Module %s is heavy to import, import it where it is used",
+            "conan-heavy-module-import",
+            "The modules imported at the top of the recipe are imported every time the recipe is loaded, even "
+            "when the package is already built. Import the modules not already loaded by Conan in the method using "
+            "them.",
+        ),
+    }
+
+    def visit_classdef(self, node: nodes.ClassDef) -> None:
+        if node.basenames != ['ConanFile']:
+            return
+        methods = {method.name: method for method in node.body if isinstance(method, nodes.FunctionDef)}
+        if "package_info" in methods:
+            for call, path in self._reachable_calls(methods, "package_info"):
+                if _is_collect_libs(call):
+                    self.add_message("conan-package-info-collect-libs", node=call, args=(path,))
+                elif _is_file_read(call):
+                    self.add_message("conan-package-info-read-file", node=call, args=(path,))
+        reported = set()
+        for method in GRAPH_METHODS:
+            if method in methods:
+                for call, path in self._reachable_calls(methods, method):
+                    if _is_subprocess(call) and call not in reported:
+                        reported.add(call)
+                        self.add_message("conan-subprocess-in-graph-method", node=call, args=(path,))
+
+    @staticmethod
+    def _reachable_calls(methods, name):
+        """Calls of a method, and of the methods and properties of the recipe it uses (with the path to them)"""
+        pending = [(name, f"{name}()")]
+        visited = set()
+        while pending:
+            name, path = pending.pop()
+            if name in visited:
+                continue
+            visited.add(name)
+            for child in methods[name].nodes_of_class((nodes.Call, nodes.Attribute)):
+                if isinstance(child, nodes.Call):
+                    yield child, path
+                elif isinstance(child.expr, nodes.Name) and child.expr.name == "self" and child.attrname in methods:
+                    pending.append((child.attrname, f"{path} -> {child.attrname}"))
+
+    def visit_import(self, node: nodes.Import) -> None:
+        if isinstance(node.scope(), nodes.Module):
+            for name, _ in node.names:
+                self._check_heavy_module(node, name)
+
+    def visit_importfrom(self, node: nodes.ImportFrom) -> None:
+        if isinstance(node.scope(), nodes.Module) and not node.level:
+            self._check_heavy_module(node, node.modname)
+
+    def _check_heavy_module(self, node, modname):
+        if modname.split(".")[0] in HEAVY_MODULES:
+            self.add_message("conan-heavy-module-import", node=node, args=(modname,))
+
+
+def register(linter: PyLinter) -> None:
+    linter.register_checker(Performance(linter))
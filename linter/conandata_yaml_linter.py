@@ -10,72 +10,82 @@ from strictyaml import (
     Enum,
     Any,
 )
-from yaml_linting import file_path
+from yaml_linting import Annotation, add_batch_arguments, cache_from_arguments, run_linter
+import pyyaml_document
+from pyyaml_document import MAPPING, SCALAR, SEQUENCE, PyYAMLDocument, UnsupportedDocument
 
 
 CONANDATA_YAML_URL = "https://github.com/conan-io/conan-center-index/blob/master/docs/adding_packages/conandata_yml_format.md"
 
 
+patch_types = ["official", "conan", "portability", "bugfix", "vulnerability"]
+patch_fields = Map(
+    {
+        "patch_file": Str(),
+        "patch_description": Str(),
+        "patch_type": Enum(patch_types),
+        Optional("patch_source"): Str(),
+        # No longer required for v2 recipes with layouts
+        Optional("base_path"): Str(),
+    }
+)
+schema = Map(
+    {
+        "sources": MapPattern(Str(), Any(), minimum_keys=1),
+        Optional("patches"): MapPattern(Str(), Seq(Any()), minimum_keys=1),
+    }
+)
+# Keys of the schemas above, for the pyyaml backend
+schema_keys = ["sources", "patches"]
+patch_keys = ["patch_file", "patch_description", "patch_type", "patch_source", "base_path"]
+patch_required_keys = ["patch_file", "patch_description", "patch_type"]
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate Conan's 'conandata.yaml' file to ConanCenterIndex's requirements."
     )
+    add_batch_arguments(parser)
     parser.add_argument(
-        "path",
-        nargs="?",
-        type=file_path,
-        help="file to validate.",
+        "--backend",
+        choices=["strictyaml", "pyyaml"],
+        default="strictyaml",
+        help="'strictyaml' is the reference implementation, 'pyyaml' uses the much faster libyaml parser"
+             " and reports the same annotations (default: strictyaml).",
     )
     args = parser.parse_args()
 
-    patch_fields = Map(
-        {
-            "patch_file": Str(),
-            "patch_description": Str(),
-            "patch_type": Enum(
-                ["official", "conan", "portability", "bugfix", "vulnerability"]
-            ),
-            Optional("patch_source"): Str(),
-            # No longer required for v2 recipes with layouts
-            Optional("base_path"): Str(),
-        }
-    )
-    schema = Map(
-        {
-            "sources": MapPattern(Str(), Any(), minimum_keys=1),
-            Optional("patches"): MapPattern(Str(), Seq(Any()), minimum_keys=1),
-        }
-    )
+    lint_function = lint_file_pyyaml if args.backend == "pyyaml" else lint_file
+    cache = cache_from_arguments(args, __file__, pyyaml_document.__file__, variant=args.backend)
+    run_linter(lint_function, args.paths, args.jobs, cache)
+
 
-    with open(args.path, encoding="utf-8") as f:
+def lint_file(path):
+    annotations = []
+
+    with open(path, encoding="utf-8") as f:
         content = f.read()
 
     try:
         parsed = load(content, schema)
     except YAMLValidationError as error:
-        pretty_print_yaml_validate_error(args, error) # Error when "source" is missing or when "patches" has no versions
-        return
+        annotations.append(yaml_validate_error(error)) # Error when "source" is missing or when "patches" has no versions
+        return annotations
     except BaseException as error:
-        pretty_print_yaml_validate_error(args, error) # YAML could not be parsed
-        return
+        annotations.append(yaml_validate_error(error)) # YAML could not be parsed
+        return annotations
 
     if "patches" in parsed:
         for version in parsed["patches"]:
             patches = parsed["patches"][version]
             if version not in parsed["sources"]:
-                print(
-                    f"::warning file={args.path},line={patches.start_line},endline={patches.end_line},"
-                    f"title=conandata.yml inconsistency"
-                    f"::Patch(es) are listed for version `{version}`, but there is source for this version."
-                    f" You should either remove `{version}` from the `patches` section, or add it to the"
-                    f" `sources` section"
-                )
+                annotations.append(missing_source_warning(version, patches.start_line, patches.end_line))
             for i, patch in enumerate(patches):
                 # Individual report errors for each patch object
                 try:
                     parsed["patches"][version][i].revalidate(patch_fields)
                 except YAMLValidationError as error:
-                    pretty_print_yaml_validate_warning(args, error) # Warning when patch fields are not followed
+                    annotations.append(yaml_validate_warning(error)) # Warning when patch fields are not followed
                     continue
 
                 # Make sure `patch_source` exists where it's encouraged
@@ -84,40 +94,135 @@ def main():
                     type in ["official", "bugfix", "vulnerability"]
                     and not "patch_source" in patch
                 ):
-                    print(
-                        f"::warning file={args.path},line={type.start_line},endline={type.end_line},"
-                        f"title=conandata.yml schema warning"
-                        f"::'patch_type' should have 'patch_source' as per {CONANDATA_YAML_URL}#patch_type"
-                        " it is expected to have a source (e.g. a URL) to where it originates from to help with"
-                        " reviewing and consumers to evaluate patches"
-                    )
+                    annotations.append(patch_source_warning(type.start_line, type.end_line))
 
                 # v2 migrations suggestion
                 if "base_path" in parsed["patches"][version][i]:
                     base_path = parsed["patches"][version][i]["base_path"]
-                    print(
-                        f"::notice file={args.path},line={base_path.start_line},endline={base_path.end_line},"
-                        f"title=conandata.yml v2 migration suggestion"
-                        "::'base_path' should not be required once a recipe has been upgraded to take advantage of"
-                        " layouts (see https://docs.conan.io/en/latest/reference/conanfile/tools/layout.html) and"
-                        " the new helper (see https://docs.conan.io/en/latest/reference/conanfile/tools/files/patches.html#conan-tools-files-apply-conandata-patches)"
-                    )
-
-
-def pretty_print_yaml_validate_error(args, error):
-    snippet = error.context_mark.get_snippet().replace("\n", "%0A")
-    print(
-        f"::error file={args.path},line={error.context_mark.line},endline={error.problem_mark.line+1},"
-        f"title=conandata.yml schema error"
-        f"::Schema outlined in {CONANDATA_YAML_URL}#patches-fields is not followed.%0A%0A{error.problem} in %0A{snippet}%0A"
+                    annotations.append(base_path_notice(base_path.start_line, base_path.end_line))
+
+    return annotations
+
+
+def lint_file_pyyaml(path):
+    """Same annotations as `lint_file`, validating the document parsed with PyYAML's C parser"""
+    try:
+        return _lint_document(PyYAMLDocument.load(path))
+    except UnsupportedDocument:
+        return lint_file(path) # strictyaml reports the errors, or the lines could not be reproduced
+
+
+def _lint_document(document):
+    annotations = []
+
+    root = document.root
+    if root.kind != MAPPING or any(key not in schema_keys for key in root):
+        raise UnsupportedDocument("not following the schema")
+    sources = root.get("sources")
+    if sources is None or sources.kind != MAPPING:
+        raise UnsupportedDocument("not following the schema")
+    all_patches = root.get("patches")
+    if all_patches is None:
+        return annotations
+    if all_patches.kind != MAPPING or any(patches.kind != SEQUENCE for _, patches in all_patches.value):
+        raise UnsupportedDocument("not following the schema")
+
+    for version_node, patches in all_patches.value:
+        version = version_node.value
+        if version not in sources:
+            annotations.append(missing_source_warning(version, document.start_line(patches), document.end_line(patches)))
+        for patch in patches.value:
+            # Individual report errors for each patch object, as `revalidate(patch_fields)` would do
+            error = _patch_fields_error(patch)
+            if error:
+                node, problem = error
+                annotations.append(schema_annotation(
+                    "warning", "conandata.yml schema warning",
+                    document.start_line(node) - 1, document.end_line(node), problem, document.snippet(node)
+                ))
+                continue
+
+            type = patch.get("patch_type")
+            if (
+                type.value in ["official", "bugfix", "vulnerability"]
+                and not "patch_source" in patch
+            ):
+                annotations.append(patch_source_warning(document.start_line(type), document.end_line(type)))
+
+            if "base_path" in patch:
+                base_path = patch.get("base_path")
+                annotations.append(base_path_notice(document.start_line(base_path), document.end_line(base_path)))
+
+    return annotations
+
+
+def _patch_fields_error(patch):
+    """First node and problem strictyaml would report when validating the patch against `patch_fields`"""
+    if patch.kind != MAPPING:
+        return patch, f"found {patch.found()}"
+    for key, value in patch.value:
+        if key.value not in patch_keys:
+            return key, f"unexpected key not in schema '{key.value}'"
+        if value.kind != SCALAR:
+            return value, f"found {value.found()}"
+        if key.value == "patch_type" and value.value not in patch_types:
+            return value, f"found {value.found()}"
+    missing = sorted(set(patch_required_keys).difference(patch))
+    if missing:
+        return patch, "required key(s) '{0}' not found".format("', '".join(missing))
+    return None
+
+
+def missing_source_warning(version, start_line, end_line):
+    return Annotation(
+        "warning", start_line, end_line,
+        "conandata.yml inconsistency",
+        f"Patch(es) are listed for version `{version}`, but there is source for this version."
+        f" You should either remove `{version}` from the `patches` section, or add it to the"
+        f" `sources` section"
+    )
+
+
+def patch_source_warning(start_line, end_line):
+    return Annotation(
+        "warning", start_line, end_line,
+        "conandata.yml schema warning",
+        f"'patch_type' should have 'patch_source' as per {CONANDATA_YAML_URL}#patch_type"
+        " it is expected to have a source (e.g. a URL) to where it originates from to help with"
+        " reviewing and consumers to evaluate patches"
+    )
+
+
+def base_path_notice(start_line, end_line):
+    return Annotation(
+        "notice", start_line, end_line,
+        "conandata.yml v2 migration suggestion",
+        "'base_path' should not be required once a recipe has been upgraded to take advantage of"
+        " layouts (see https://docs.conan.io/en/latest/reference/conanfile/tools/layout.html) and"
+        " the new helper (see https://docs.conan.io/en/latest/reference/conanfile/tools/files/patches.html#conan-tools-files-apply-conandata-patches)"
+    )
+
+
+def schema_annotation(level, title, context_line, problem_line, problem, snippet):
+    snippet = snippet.replace("\n", "%0A")
+    return Annotation(
+        level, context_line, problem_line, title,
+        f"Schema outlined in {CONANDATA_YAML_URL}#patches-fields is not followed.%0A%0A{problem} in %0A{snippet}%0A"
+    )
+
+
+def yaml_validate_error(error):
+    snippet = error.context_mark.get_snippet() # Before the lines, dumping the document moves its comments around
+    return schema_annotation(
+        "error", "conandata.yml schema error",
+        error.context_mark.line, error.problem_mark.line+1, error.problem, snippet
     )
     
-def pretty_print_yaml_validate_warning(args, error):
-    snippet = error.context_mark.get_snippet().replace("\n", "%0A")
-    print(
-        f"::warning file={args.path},line={error.context_mark.line},endline={error.problem_mark.line+1},"
-        f"title=conandata.yml schema warning"
-        f"::Schema outlined in {CONANDATA_YAML_URL}#patches-fields is not followed.%0A%0A{error.problem} in %0A{snippet}%0A"
+def yaml_validate_warning(error):
+    snippet = error.context_mark.get_snippet() # Before the lines, dumping the document moves its comments around
+    return schema_annotation(
+        "warning", "conandata.yml schema warning",
+        error.context_mark.line, error.problem_mark.line+1, error.problem, snippet
     )
 
 
@@ -0,0 +1,308 @@
+# Generated by linter/generate_conanfile_stubs.py from Conan 1.59.0, do not edit.
+#   Classes of the fields Conan injects into ConanFile instances, only read by astroid
+#   in transform_conanfile.py, this module is not meant to be imported.
+# pylint: skip-file
+
+from collections import OrderedDict, defaultdict
+from typing import Any
+
+
+CONAN_VERSION = "1.59.0"
+
+
+class ConanInfo(object):
+    env_values: Any
+    full_options: Any
+    full_requires: Any
+    full_settings: Any
+    invalid: Any
+    options: Any
+    python_requires: Any
+    recipe_hash: Any
+    requires: Any
+    settings: Any
+
+    def copy(self):
+        ...
+
+    @staticmethod
+    def create(settings, options, prefs_direct, prefs_indirect, default_package_id_mode, python_requires, default_python_requires_id_mode):
+        ...
+
+    @staticmethod
+    def loads(text):
+        ...
+
+    def dumps(self):
+        ...
+
+    def clone(self):
+        ...
+
+    def __eq__(self, other):
+        ...
+
+    def __ne__(self, other):
+        ...
+
+    @staticmethod
+    def load_file(conan_info_path):
+        ...
+
+    @staticmethod
+    def load_from_package(package_folder):
+        ...
+
+    def package_id(self):
+        ...
+
+    def serialize_min(self):
+        ...
+
+    def header_only(self):
+        ...
+
+    clear = header_only
+
+    def msvc_compatible(self):
+        ...
+
+    def apple_clang_compatible(self):
+        ...
+
+    def vs_toolset_compatible(self):
+        ...
+
+    def vs_toolset_incompatible(self):
+        ...
+
+    def discard_build_settings(self):
+        ...
+
+    def include_build_settings(self):
+        ...
+
+    def default_std_matching(self):
+        ...
+
+    def default_std_non_matching(self):
+        ...
+
+    def shared_library_package_id(self):
+        ...
+
+    def parent_compatible(self, *_, **kwargs):
+        ...
+
+    def base_compatible(self):
+        ...
+
+
+class RecipeBuildRequires(OrderedDict):
+    _default_context: Any
+
+    def __init__(self, conanfile, default_context):
+        ...
+
+    def add(self, build_require, context, force_host_context=False):
+        ...
+
+    def __call__(self, build_require, force_host_context=False):
+        ...
+
+    def __str__(self):
+        ...
+
+
+class FileCopier(object):
+    _copied: Any
+    _dst_folder: Any
+    _src_folders: Any
+
+    def __init__(self, source_folders, root_destination_folder):
+        ...
+
+    def report(self, output):
+        ...
+
+    def __call__(self, pattern, dst='', src='', keep_path=True, links=False, symlinks=None, excludes=None, ignore_case=True):
+        ...
+
+    def _copy(self, base_src, pattern, src, dst, symlinks, ignore_case, excludes, keep_path, excluded_folders):
+        ...
+
+    @staticmethod
+    def _filter_files(src, pattern, links, excludes, ignore_case, excluded_folders):
+        ...
+
+    @staticmethod
+    def link_folders(src, dst, linked_folders):
+        ...
+
+    @staticmethod
+    def _copy_files(files, src, dst, keep_path, symlinks):
+        ...
+
+
+class FileImporter(object):
+    _conanfile: Any
+    _dst_folder: Any
+    copied_files: Any
+
+    def __init__(self, conanfile, dst_folder):
+        ...
+
+    def __call__(self, pattern, dst='', src='', root_package=None, folder=False, ignore_case=True, excludes=None, keep_path=True):
+        ...
+
+
+class PyRequires(object):
+    _pyrequires: Any
+    _transitive: Any
+
+    def __init__(self):
+        ...
+
+    def update_transitive(self, conanfile):
+        ...
+
+    def all_items(self):
+        ...
+
+    def all_refs(self):
+        ...
+
+    def items(self):
+        ...
+
+    def __getitem__(self, item):
+        ...
+
+    def __setitem__(self, key, value):
+        ...
+
+
+class Conf(object):
+    _values: Any
+
+    boolean_false_expressions = None
+
+    def __init__(self):
+        ...
+
+    def __bool__(self):
+        ...
+
+    __nonzero__ = __bool__
+
+    def __repr__(self):
+        ...
+
+    def __eq__(self, other):
+        ...
+
+    def __ne__(self, other):
+        ...
+
+    def __getitem__(self, name):
+        ...
+
+    def __setitem__(self, name, value):
+        ...
+
+    def __delitem__(self, name):
+        ...
+
+    def items(self):
+        ...
+
+    @property
+    def sha(self):
+        ...
+
+    @staticmethod
+    def _get_boolean_value(value):
+        ...
+
+    def get(self, conf_name, default=None, check_type=None):
+        ...
+
+    def pop(self, conf_name, default=None):
+        ...
+
+    @staticmethod
+    def _validate_lower_case(name):
+        ...
+
+    def copy(self):
+        ...
+
+    def dumps(self):
+        ...
+
+    def define(self, name, value):
+        ...
+
+    def define_path(self, name, value):
+        ...
+
+    def unset(self, name):
+        ...
+
+    def update(self, name, value):
+        ...
+
+    def update_path(self, name, value):
+        ...
+
+    def append(self, name, value):
+        ...
+
+    def append_path(self, name, value):
+        ...
+
+    def prepend(self, name, value):
+        ...
+
+    def prepend_path(self, name, value):
+        ...
+
+    def remove(self, name, value):
+        ...
+
+    def compose_conf(self, other):
+        ...
+
+    def filter_user_modules(self):
+        ...
+
+    def set_relative_base_folder(self, folder):
+        ...
+
+
+class Settings(object):
+    os = None
+    arch = None
+    compiler = None
+    build_type = None
+
+
+class UserInfoBuild(defaultdict):
+    pass
+
+
+# The types of Conan 1 at runtime: conan_data is the dict loaded from conandata.yml, python_requires is always a
+#   PyRequires (a `python_requires = "..."` attribute of the recipe shadows it), conf is a Conf
+conan_data = dict()
+recipe_folder = str()
+build_requires = RecipeBuildRequires()
+tool_requires = RecipeBuildRequires()
+info = ConanInfo()
+info_build = ConanInfo()
+user_info_build = UserInfoBuild()
+copy = FileCopier()
+copy_deps = FileImporter()
+python_requires = PyRequires()
+settings_build = Settings()
+settings_target = Settings()
+conf = Conf()
@@ -1,36 +1,37 @@
 import argparse
 from strictyaml import load, Map, Str, YAMLValidationError, MapPattern
-from yaml_linting import file_path
+from yaml_linting import Annotation, add_batch_arguments, cache_from_arguments, run_linter
+
+
+schema = Map(
+    {"versions": MapPattern(Str(), Map({"folder": Str()}), minimum_keys=1)}
+)
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Validate ConanCenterIndex's 'config.yaml' file."
     )
-    parser.add_argument(
-        "path",
-        nargs="?",
-        type=file_path,
-        help="file to validate.",
-    )
+    add_batch_arguments(parser)
     args = parser.parse_args()
 
-    schema = Map(
-        {"versions": MapPattern(Str(), Map({"folder": Str()}), minimum_keys=1)}
-    )
+    run_linter(lint_file, args.paths, args.jobs, cache_from_arguments(args, __file__))
+
 
-    with open(args.path) as f:
+def lint_file(path):
+    with open(path) as f:
         content = f.read()
 
     try:
         load(content, schema)
     except YAMLValidationError as error:
         e = error.__str__().replace("\n", "%0A")
-        print(
-            f"::error file={args.path},line={error.context_mark.line},endline={error.problem_mark.line},"
-            f"title=config.yml schema error"
-            f"::{e}\n"
-        )
+        return [Annotation(
+            "error", error.context_mark.line, error.problem_mark.line,
+            "config.yml schema error",
+            f"{e}\n"
+        )]
+    return []
 
 
 if __name__ == "__main__":
@@ -0,0 +1,282 @@
+"""
+Run the ConanCenter checks of the pylint plugin (E9xxx messages) without pylint.
+
+These checks are only syntactic, so they are implemented again here over Python's `ast`, with a single pass
+per file and no inference, which is fast enough to be used as a pre-commit gate over the whole index:
+
+    python3 linter/fast_conan_checks.py --rcfile=linter/pylintrc_recipe "recipes/*/*/conanfile.py"
+
+The messages are printed in the JSON format of `pylint --output-format=json`. The pylint plugin
+(conanv2_transition.py) remains the reference, the v2 linter workflow checks that both report the same.
+"""
+
+import argparse
+import ast
+import bisect
+import configparser
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from yaml_linting import expand_paths
+
+
+# Same as the `msgs` of the checkers in check_*.py
+MESSAGES = {
+    "E9004": ("conan-bad-name", "Reference name should be all lowercase"),
+    "E9005": ("conan-missing-name", "Missing name attribute"),
+    "E9006": (
+        "conan-import-conanfile",
+        "Import ConanFile from new module: `from conan import ConanFile`. Old import is deprecated in Conan v2.",
+    ),
+    "E9007": ("conan-test-no-name", "No 'name' attribute in test_package conanfile"),
+    "E9008": (
+        "conan-import-errors",
+        "Import errors from new module: `from conan import errors`. Old import is deprecated in Conan v2.",
+    ),
+    "E9009": (
+        "conan-import-error-conanexception",
+        "Import ConanException from new module: `from conan.errors import ConanException`. "
+        "Old import is deprecated in Conan v2.",
+    ),
+    "E9010": (
+        "conan-import-error-conaninvalidconfiguration",
+        "Import ConanInvalidConfiguration from new module: `from conan.errors import ConanInvalidConfiguration`. "
+        "Old import is deprecated in Conan v2.",
+    ),
+    "E9011": (
+        "conan-import-tools",
+        "Import tools following pattern 'from conan.tools.xxxx import yyyyy' "
+        "(https://docs.conan.io/en/latest/reference/conanfile/tools.html).",
+    ),
+    "E9012": ("conan-missing-layout-src-folder", "layout is missing `src_folder` argument which should be to `src`"),
+    "E9013": ("conan-layout-src-folder-is-src", "layout should set `src_folder` to `src`"),
+    "E9014": ("conan-forced-version", "Recipe should not contain version attribute"),
+}
+
+LAYOUTS = ["cmake_layout", "bazel_layout", "basic_layout"]
+LAYOUTS_PATTERN = re.compile("|".join(LAYOUTS).encode())
+
+# Statements which may contain classes or imports, they are always visited
+COMPOUND_STATEMENTS = (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef, ast.If, ast.For, ast.AsyncFor, ast.While,
+                       ast.Try, ast.With, ast.AsyncWith, ast.ExceptHandler, ast.ImportFrom)
+
+
+def enabled_messages(rcfile):
+    """Message ids left enabled by the `disable` and `enable` options of a pylint rcfile"""
+    enabled = set(MESSAGES)
+    if not rcfile:
+        return enabled
+    config = configparser.ConfigParser(inline_comment_prefixes=("#",))
+    config.read(rcfile)
+
+    def names(option):
+        value = config.get("MESSAGES CONTROL", option, fallback="")
+        return {name.strip() for name in value.replace("\n", ",").split(",") if name.strip()}
+
+    for option in ("disable", "enable"):
+        selected = names(option)
+        ids = {msgid for msgid, (symbol, _) in MESSAGES.items()
+               if "all" in selected or msgid in selected or symbol in selected}
+        enabled = enabled - ids if option == "disable" else enabled | ids
+    return enabled
+
+
+def module_name(path):
+    """Name given by pylint to the module of a file: its name, prefixed by the packages containing it"""
+    path = Path(path).resolve()
+    parts = [path.stem]
+    folder = path.parent
+    while (folder / "__init__.py").is_file():
+        parts.insert(0, folder.name)
+        folder = folder.parent
+    return ".".join(parts)
+
+
+def _const_as_string(node):
+    """Equivalent to astroid's `as_string()` for the constant values compared by the checkers"""
+    if isinstance(node, ast.Constant):
+        return repr(node.value)
+    if isinstance(node, ast.Name):
+        return node.id
+    return None
+
+
+class ConanChecksVisitor(ast.NodeVisitor):
+    def __init__(self, path, lines, enabled, layout_lines):
+        self.path = path
+        self.lines = lines
+        self.module = module_name(path)
+        self.enabled = enabled
+        self.is_test = Path(path).match("test_package/*.py") or Path(path).match("test_v1_package/*.py")
+        # Calls to layouts are the only expressions checked, any other node not written on the lines where
+        #   a layout is named is not visited
+        self.layout_lines = layout_lines
+        self.scopes = []
+        self.messages = []
+
+    def generic_visit(self, node):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, COMPOUND_STATEMENTS) or self._names_layout(child):
+                self.visit(child)
+
+    def _names_layout(self, node):
+        if not hasattr(node, "lineno"):
+            return True
+        index = bisect.bisect_left(self.layout_lines, node.lineno)
+        return index < len(self.layout_lines) and self.layout_lines[index] <= node.end_lineno
+
+    def add_message(self, msgid, node, line=None):
+        if msgid not in self.enabled:
+            return
+        symbol, message = MESSAGES[msgid]
+        end_line, end_column = node.end_lineno, node.end_col_offset
+        if isinstance(node, ast.ClassDef):
+            # pylint reports classes up to the end of their name
+            end_line = node.lineno
+            end_column = self.lines[node.lineno - 1].index(node.name, node.col_offset) + len(node.name)
+        self.messages.append({
+            "type": "error",
+            "module": self.module,
+            "obj": ".".join(self.scopes),
+            "line": line or node.lineno,
+            "column": node.col_offset,
+            "endLine": end_line,
+            "endColumn": end_column,
+            "path": self.path,
+            "symbol": symbol,
+            "message": message,
+            "message-id": msgid,
+        })
+
+    def _visit_scope(self, node, name):
+        self.scopes.append(name)
+        self.generic_visit(node)
+        self.scopes.pop()
+
+    def visit_FunctionDef(self, node):
+        self._visit_scope(node, node.name)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Lambda(self, node):
+        self._visit_scope(node, "<lambda>")
+
+    def visit_ClassDef(self, node):
+        # pylint reports the messages of a class node with the class itself as scope
+        self.scopes.append(node.name)
+        if len(node.bases) == 1 and isinstance(node.bases[0], ast.Name) and node.bases[0].id == "ConanFile":
+            self._check_package_name(node)
+            self._check_version_attribute(node)
+        self.generic_visit(node)
+        self.scopes.pop()
+
+    def _class_attribute(self, node, name):
+        """First `name = <constant>` of the class body, as matched by the pylint checkers"""
+        for attr in node.body:
+            if isinstance(attr, ast.Assign) and len(attr.targets) == 1:
+                target = attr.targets[0]
+            elif isinstance(attr, ast.AugAssign):
+                target = attr.target
+            else:
+                continue
+            if isinstance(target, ast.Name) and target.id == name and isinstance(attr.value, ast.Constant):
+                return attr
+        return None
+
+    def _check_package_name(self, node):
+        attr = self._class_attribute(node, "name")
+        if attr is None:
+            if not self.is_test:
+                self.add_message("E9005", node)
+        elif self.is_test:
+            self.add_message("E9007", attr)
+        else:
+            value = _const_as_string(attr.value)
+            if value.lower() != value:
+                self.add_message("E9004", attr)
+
+    def _check_version_attribute(self, node):
+        attr = self._class_attribute(node, "version")
+        if attr is not None:
+            value = _const_as_string(attr.value).replace('"', "").replace("'", "")
+            if value and value != "system":
+                self.add_message("E9014", attr)
+
+    def visit_ImportFrom(self, node):
+        basename = node.module or ""
+        names = [alias.name for alias in node.names]
+        if basename == "conans":
+            if "ConanFile" in names:
+                self.add_message("E9006", node)
+            if "errors" in names:
+                self.add_message("E9008", node)
+        elif basename == "conans.errors":
+            if "ConanException" in names:
+                self.add_message("E9009", node)
+            if "ConanInvalidConfiguration" in names:
+                self.add_message("E9010", node)
+        if (basename == "conan" and "tools" in names) or re.match(r"conan\.tools\.[^.]+\..+", basename):
+            self.add_message("E9011", node)
+        self.generic_visit(node)
+
+    def visit_Call(self, node):
+        if isinstance(node.func, ast.Name) and node.func.id in LAYOUTS:
+            for kw in node.keywords:
+                if kw.arg == "src_folder":
+                    value = _const_as_string(kw.value)
+                    if value is None or value.strip("\"'") != "src":
+                        self.add_message("E9013", node)
+                    break
+            else:
+                self.add_message("E9012", node)
+        self.generic_visit(node)
+
+
+def check_file(path, enabled):
+    with open(path, "rb") as f:
+        source = f.read()
+    tree = ast.parse(source, filename=path)
+    layout_lines = sorted({source.count(b"\n", 0, match.start()) + 1 for match in LAYOUTS_PATTERN.finditer(source)})
+    visitor = ConanChecksVisitor(path, source.decode("utf-8").splitlines(), enabled, layout_lines)
+    visitor.visit(tree)
+    return visitor.messages
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the ConanCenter pylint checks (E9xxx) without pylint, printing pylint JSON messages.")
+    parser.add_argument("paths", nargs="+", help="files or glob patterns (e.g. 'recipes/*/*/conanfile.py') to check.")
+    parser.add_argument("--rcfile", help="pylint configuration file, its disabled messages are not reported.")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="number of files checked in parallel (default: number of CPUs).")
+    parser.add_argument("--output", help="write the messages to this JSON file (default: stdout).")
+    parser.add_argument("--exit-zero", action="store_true", help="exit with 0 even if messages were reported.")
+    args = parser.parse_args()
+
+    enabled = enabled_messages(args.rcfile)
+    paths = expand_paths(args.paths)
+    messages = []
+    if args.jobs <= 1:
+        for path in paths:
+            messages.extend(check_file(path, enabled))
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            chunksize = max(1, len(paths) // (args.jobs * 8))
+            for file_messages in executor.map(check_file, paths, [enabled] * len(paths), chunksize=chunksize):
+                messages.extend(file_messages)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(messages, f, indent=4)
+    else:
+        json.dump(messages, sys.stdout, indent=4)
+    # Same exit status as pylint when errors are reported
+    sys.exit(0 if args.exit_zero or not messages else 2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Generate `conanfile_stubs.pyi`, the classes of the fields Conan injects into ConanFile instances.
+
+The stubs are read by `transform_conanfile.py` instead of the Conan package itself, so pylint does not
+parse the Conan internals on every run. Regenerate them whenever the Conan version used by ConanCenter
+changes:
+
+    pip install conan==<version in .c3i/config_v1.yml>
+    python3 linter/generate_conanfile_stubs.py
+"""
+
+import argparse
+import os
+import sys
+import textwrap
+
+import astroid
+import yaml
+
+
+LINTER_DIR = os.path.dirname(os.path.abspath(__file__))
+C3I_CONFIG = os.path.join(LINTER_DIR, os.pardir, ".c3i", "config_v1.yml")
+STUBS_FILE = os.path.join(LINTER_DIR, "conanfile_stubs.pyi")
+
+# (module, class) injected by Conan, with the name of the stub class
+CONAN_CLASSES = [
+    ("conans.model.info", "ConanInfo", "ConanInfo"),
+    ("conans.client.graph.graph_manager", "_RecipeBuildRequires", "RecipeBuildRequires"),
+    ("conans.client.file_copier", "FileCopier", "FileCopier"),
+    ("conans.client.importer", "_FileImporter", "FileImporter"),
+    ("conans.client.graph.python_requires", "PyRequires", "PyRequires"),
+    ("conans.model.conf", "Conf", "Conf"),
+]
+
+# Bases from the standard library are kept, the members of any other base are merged into the stub
+STDLIB_MODULES = ("builtins", "collections")
+
+HEADER = '''\
+# Generated by linter/generate_conanfile_stubs.py from Conan {version}, do not edit.
+#   Classes of the fields Conan injects into ConanFile instances, only read by astroid
+#   in transform_conanfile.py, this module is not meant to be imported.
+# pylint: skip-file
+
+from collections import OrderedDict, defaultdict
+from typing import Any
+
+
+CONAN_VERSION = "{version}"
+'''
+
+FOOTER = '''
+
+class Settings(object):
+    os = None
+    arch = None
+    compiler = None
+    build_type = None
+
+
+class UserInfoBuild(defaultdict):
+    pass
+
+
+# The types of Conan 1 at runtime: conan_data is the dict loaded from conandata.yml, python_requires is always a
+#   PyRequires (a `python_requires = "..."` attribute of the recipe shadows it), conf is a Conf
+conan_data = dict()
+recipe_folder = str()
+build_requires = RecipeBuildRequires()
+tool_requires = RecipeBuildRequires()
+info = ConanInfo()
+info_build = ConanInfo()
+user_info_build = UserInfoBuild()
+copy = FileCopier()
+copy_deps = FileImporter()
+python_requires = PyRequires()
+settings_build = Settings()
+settings_target = Settings()
+conf = Conf()
+'''
+
+
+def pinned_conan_version():
+    with open(C3I_CONFIG, encoding="utf-8") as f:
+        return str(yaml.safe_load(f)["conan"]["version"])
+
+
+def _signature(function):
+    args = function.args
+    if any(not isinstance(default, astroid.Const) for default in args.defaults + args.kw_defaults if default):
+        raise ValueError(f"{function.qname()}: only literal default values are supported")
+    return args.as_string()
+
+
+def _stub_class(module_name, class_name, stub_name):
+    cls = astroid.MANAGER.ast_from_module_name(module_name)[class_name]
+    bases = []
+    members = []
+    attributes = set()
+    seen = set()
+    for klass in [cls] + list(cls.ancestors()):
+        if klass.root().name in STDLIB_MODULES:
+            if klass in cls.ancestors(recurs=False) and klass.name != "object":
+                bases.append(klass.name)
+            continue
+        attributes.update(klass.instance_attrs)
+        for node in klass.body:
+            if isinstance(node, astroid.FunctionDef) and node.name not in seen:
+                seen.add(node.name)
+                decorators = [f"@{d.as_string()}\n" for d in node.decorators.nodes] if node.decorators else []
+                members.append("".join(decorators) + f"def {node.name}({_signature(node)}):\n"
+                               "    ...\n")
+            elif isinstance(node, astroid.Assign):
+                for target in node.targets:
+                    if isinstance(target, astroid.AssignName) and target.name not in seen:
+                        seen.add(target.name)
+                        value = node.value.as_string() if isinstance(node.value, astroid.Name) else "None"
+                        members.append(f"{target.name} = {value}\n")
+    # Declared without a value, so pylint does not assume anything about their type
+    attributes = "".join(f"{name}: Any\n" for name in sorted(attributes - seen))
+
+    body = "\n".join(([attributes] if attributes else []) + members)
+    return f"\n\nclass {stub_name}({', '.join(bases) or 'object'}):\n" + textwrap.indent(body, "    ")
+
+
+def generate(version):
+    content = HEADER.format(version=version)
+    for module_name, class_name, stub_name in CONAN_CLASSES:
+        content += _stub_class(module_name, class_name, stub_name)
+    return content + FOOTER
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the stubs of the ConanFile dynamic fields.")
+    parser.add_argument("--check", action="store_true",
+                        help="do not write the stubs, fail if they are outdated.")
+    args = parser.parse_args()
+
+    from conans import __version__ as installed_version
+
+    version = pinned_conan_version()
+    if installed_version != version:
+        print(f"Conan {version} is pinned in .c3i/config_v1.yml but {installed_version} is installed, "
+              f"run `pip install conan=={version}`", file=sys.stderr)
+        sys.exit(1)
+
+    content = generate(version)
+    if args.check:
+        with open(STUBS_FILE, encoding="utf-8") as f:
+            if f.read() != content:
+                print(f"{STUBS_FILE} is outdated, run `python3 {__file__}`", file=sys.stderr)
+                sys.exit(1)
+        return
+
+    with open(STUBS_FILE, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+if __name__ == "__main__":
+    main()
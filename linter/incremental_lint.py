@@ -0,0 +1,191 @@
+"""
+Lint the whole recipe tree, only running the linters on the files changed since a git reference.
+
+The findings of every linted file are stored by the git blob hash of its content, so a file is only linted
+again when its content (or the linters) changed. The files which did not change since `--base` are not
+even read, their blob hashes are listed by git:
+
+    python3 linter/incremental_lint.py --base origin/master
+
+The report contains the findings of all the files, the pylint messages in the `parseable` format and the
+YAML schema errors as GitHub annotations. The first run lints every file to fill the store.
+"""
+
+import argparse
+import hashlib
+import importlib.metadata
+import json
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import PurePosixPath
+
+from run_pylint_shards import lint_files
+from yaml_linting import Annotation, format_annotation
+
+
+LINTER_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Files linted, with the pylint rcfile or the YAML linter checking them
+LINTERS = {
+    "recipe": ("recipes/*/*/conanfile.py", "pylintrc_recipe"),
+    "test_package": ("recipes/*/*/test_package/conanfile.py", "pylintrc_testpackage"),
+    "conandata": ("recipes/*/*/conandata.yml", None),
+    "config": ("recipes/*/config.yml", None),
+}
+
+
+def _git(*args, stdin=None):
+    result = subprocess.run(["git"] + list(args), check=True, stdout=subprocess.PIPE,
+                            input=stdin.encode("utf-8") if stdin is not None else None)
+    return result.stdout.decode("utf-8")
+
+
+def linters_version():
+    """Hash of everything the findings depend on besides the linted file: the linters and their configuration"""
+    digest = hashlib.sha256()
+    for package in ("pylint", "astroid", "strictyaml", "pyyaml"):
+        digest.update(f"{package} {importlib.metadata.version(package)}".encode())
+    for name in sorted(os.listdir(LINTER_DIR)):
+        if name.endswith(".py") or name.startswith("pylintrc"):
+            with open(os.path.join(LINTER_DIR, name), "rb") as f:
+                digest.update(name.encode() + f.read())
+    return digest.hexdigest()
+
+
+def blob_hashes(base):
+    """Git blob hash of every file of the working tree, only the files changed since `base` are hashed"""
+    blobs = {}
+    for line in _git("ls-tree", "-r", "-z", base, "--", "recipes").split("\0"):
+        if line:
+            info, path = line.split("\t", 1)
+            blobs[path] = info.split()[2]
+
+    changed = _git("diff", "--name-only", "-z", "--no-renames", base, "--", "recipes").split("\0")
+    untracked = _git("ls-files", "--others", "--exclude-standard", "-z", "--", "recipes").split("\0")
+    changed = [path for path in changed + untracked if path]
+    for path in changed:
+        blobs.pop(path, None)
+    existing = [path for path in changed if os.path.isfile(path)]
+    if existing:
+        hashes = _git("hash-object", "--stdin-paths", stdin="\n".join(existing)).split()
+        blobs.update(zip(existing, hashes))
+    return blobs, changed
+
+
+class FindingsStore:
+    """
+    Findings by linter and blob hash, in `store_dir/<linters version>/`. The findings of a blob do not
+    contain its path, the same content gets the same findings wherever it is.
+    """
+
+    def __init__(self, store_dir, version):
+        self.store_dir = store_dir
+        self.version_dir = os.path.join(store_dir, version[:32])
+        os.makedirs(self.version_dir, exist_ok=True)
+
+    def _entry(self, kind, blob):
+        return os.path.join(self.version_dir, blob[:2], f"{blob}.{kind}.json")
+
+    def get(self, kind, blob):
+        try:
+            with open(self._entry(kind, blob), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, kind, blob, findings):
+        entry = self._entry(kind, blob)
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        tmp = f"{entry}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(findings, f)
+        os.replace(tmp, entry)
+
+    def prune(self):
+        """Remove the findings of previous versions of the linters"""
+        for name in os.listdir(self.store_dir):
+            path = os.path.join(self.store_dir, name)
+            if path != self.version_dir and os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+
+
+def _kind(path):
+    for kind, (pattern, _) in LINTERS.items():
+        if PurePosixPath(path).match(pattern) and len(PurePosixPath(path).parts) == len(PurePosixPath(pattern).parts):
+            return kind
+    return None
+
+
+def _lint(kind, paths, jobs):
+    """Findings of each path, without the path"""
+    _, rcfile = LINTERS[kind]
+    if rcfile:
+        pylint_args = [f"--rcfile={os.path.join(LINTER_DIR, rcfile)}", "--disable=duplicate-code"]
+        findings = {path: [] for path in paths}
+        for message in lint_files(pylint_args, paths, jobs):
+            findings[message.pop("path")].append(message)
+        return findings
+
+    if kind == "conandata":
+        from conandata_yaml_linter import lint_file_pyyaml as lint_file
+    else:
+        from config_yaml_linter import lint_file
+    return {path: [list(annotation) for annotation in lint_file(path)] for path in paths}
+
+
+def format_finding(kind, path, finding):
+    if LINTERS[kind][1]:
+        return f"{path}:{finding['line']}: [{finding['message-id']}({finding['symbol']}), {finding['obj']}] " \
+               f"{finding['message']}"
+    return format_annotation(path, Annotation(*finding))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Lint all the recipes, only running the linters on the files changed since a git reference.")
+    parser.add_argument("paths", nargs="*", help="folders or files to report (default: the whole recipes folder).")
+    parser.add_argument("--base", default="HEAD",
+                        help="git reference the working tree is compared to, the files which did not change since "
+                             "are not hashed again (default: HEAD).")
+    parser.add_argument("--store", default=os.path.join(os.path.expanduser("~"), ".cache", "cci-linter"),
+                        help="directory where the findings are stored (default: ~/.cache/cci-linter).")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="number of pylint processes (default: number of CPUs).")
+    args = parser.parse_args()
+
+    os.chdir(_git("rev-parse", "--show-toplevel").strip())
+    store = FindingsStore(args.store, linters_version())
+    blobs, changed = blob_hashes(args.base)
+
+    prefixes = [os.path.normpath(path) for path in args.paths]
+    files = {}
+    for path, blob in blobs.items():
+        kind = _kind(path)
+        if kind and (not prefixes or any(path == p or path.startswith(p + "/") for p in prefixes)):
+            files[path] = (kind, blob)
+
+    findings = {}
+    pending = {}
+    for path, (kind, blob) in files.items():
+        stored = store.get(kind, blob)
+        if stored is None:
+            pending.setdefault(kind, []).append(path)
+        else:
+            findings[path] = stored
+    for kind, paths in pending.items():
+        for path, file_findings in _lint(kind, sorted(paths), args.jobs).items():
+            store.put(kind, files[path][1], file_findings)
+            findings[path] = file_findings
+    store.prune()
+
+    for path in sorted(findings):
+        for finding in findings[path]:
+            print(format_finding(files[path][0], path, finding))
+    linted = sum(len(paths) for paths in pending.values())
+    print(f"{len(files)} files, {len(changed)} changed since {args.base}, {linted} linted", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
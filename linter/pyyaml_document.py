@@ -0,0 +1,221 @@
+"""
+YAML document loaded with PyYAML's C parser, reporting the same line numbers and snippets as strictyaml.
+
+strictyaml computes the lines of a node by dumping the document sliced up to that node, which is very
+slow for large files. Here the document is parsed once with libyaml, and only when a location is
+requested the document is dumped once (with the same ruamel dumper strictyaml uses) to find where every
+node ends up. Documents whose dump can not be reproduced this way (comments, folded scalars, ...) or that
+strictyaml would reject raise UnsupportedDocument, so callers can fall back to strictyaml.
+"""
+
+import re
+import yaml
+from strictyaml import utils
+from strictyaml.ruamel import dump
+from strictyaml.ruamel.comments import CommentedMap, CommentedSeq
+from strictyaml.ruamel.dumper import RoundTripDumper
+from strictyaml.ruamel.scalarstring import LiteralScalarString
+
+
+SCALAR = "scalar"
+MAPPING = "mapping"
+SEQUENCE = "sequence"
+
+# libyaml bindings are part of the PyYAML wheels, the pure Python parser reports the same marks
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_COMMENT_OR_BLANK = re.compile(r"(^\s*$)|(^\s*#)|(\s#)")
+
+
+class UnsupportedDocument(Exception):
+    pass
+
+
+class Node:
+    """A scalar (`value` is a str), a mapping (`value` is a list of key/value nodes) or a sequence"""
+
+    __slots__ = ("kind", "value", "style", "parent", "index", "is_key", "start_line0", "end_line0")
+
+    def __init__(self, kind, value, style=None):
+        self.kind = kind
+        self.value = value
+        self.style = style
+        self.parent = None
+        self.index = None
+        self.is_key = False
+        # Location in the document as dumped by strictyaml, 0-based
+        self.start_line0 = None
+        self.end_line0 = None
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def __iter__(self):
+        if self.kind == MAPPING:
+            return (key.value for key, _ in self.value)
+        return iter(self.value)
+
+    def get(self, key):
+        for key_node, value_node in self.value:
+            if key_node.value == key:
+                return value_node
+        return None
+
+    def found(self):
+        """Same description of the node as strictyaml's validation errors"""
+        if self.kind == SEQUENCE:
+            return "a sequence"
+        elif self.kind == MAPPING:
+            return "a mapping"
+        elif self.value == "":
+            return "a blank string"
+        elif utils.is_integer(self.value):
+            return "an arbitrary integer"
+        elif utils.is_decimal(self.value):
+            return "an arbitrary number"
+        else:
+            return "arbitrary text"
+
+
+class PyYAMLDocument:
+    def __init__(self, content):
+        self.content = content
+        try:
+            self.root = _compose(yaml.parse(content, Loader=_Loader))
+        except yaml.YAMLError:
+            raise UnsupportedDocument("YAML could not be parsed")
+        self._dumped_lines = None
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls(f.read())
+
+    def start_line(self, node):
+        self._locate()
+        parent = node.parent
+        if parent is None:
+            return 1
+        if node.index > 0:
+            # The previous sibling is the last thing dumped before this node
+            entry = parent.value[node.index]
+            return (entry[0] if parent.kind == MAPPING else entry).start_line0 + 1
+        if parent.parent is None:
+            return 1
+        # The parent container is dumped empty (`{}` or `[]`) on the line of its key or `-` indicator
+        owner = parent.parent.value[parent.index]
+        owner_line0 = owner[0].start_line0 if parent.parent.kind == MAPPING else owner.start_line0
+        return owner_line0 + 2
+
+    def end_line(self, node):
+        self._locate()
+        if node.is_key:
+            node = node.parent.value[node.index][1]
+        return node.end_line0 + 1
+
+    def snippet(self, node):
+        """Equivalent to strictyaml's `error.context_mark.get_snippet()` for an error raised on `node`"""
+        context_line = self.start_line(node) - 1
+        if context_line == 0:
+            raise UnsupportedDocument("snippet of the first line")
+        line = self._dumped_lines[context_line]
+        if len(line) > 36:
+            line = line[:32] + " ... "
+        return f"    {line}\n    ^ (line: {context_line + 1})"
+
+    def _locate(self):
+        if self._dumped_lines is not None:
+            return
+        if any(_COMMENT_OR_BLANK.search(line) for line in self.content.splitlines()):
+            raise UnsupportedDocument("comments and blank lines are moved around when dumped")
+
+        dumped = dump(_to_ruamel(self.root), Dumper=RoundTripDumper)
+        self._dumped_lines = dumped.split("\n")
+        events = yaml.parse(dumped, Loader=_Loader)
+        _assign_lines(self.root, _compose(events, keep_marks=True))
+
+
+def _compose(events, keep_marks=False):
+    events = iter(events)
+    for event in events:
+        if isinstance(event, yaml.DocumentStartEvent):
+            if event.explicit or event.version or event.tags:
+                raise UnsupportedDocument("explicit document")
+            root = _compose_node(next(events), events, keep_marks)
+            end = next(events)
+            if end.explicit or not isinstance(next(events), yaml.StreamEndEvent):
+                raise UnsupportedDocument("multiple documents")
+            return root
+    raise UnsupportedDocument("empty document")
+
+
+def _compose_node(event, events, keep_marks):
+    if isinstance(event, yaml.AliasEvent) or event.anchor is not None or event.tag is not None:
+        raise UnsupportedDocument("anchors, aliases and tags are disallowed")
+
+    if isinstance(event, yaml.ScalarEvent):
+        node = Node(SCALAR, event.value, event.style)
+        if keep_marks:
+            node.start_line0 = event.start_mark.line
+            end = event.end_mark
+            # Block scalars end at the beginning of the next line
+            node.end_line0 = end.line - 1 if end.column == 0 and end.line > event.start_mark.line else end.line
+        return node
+
+    if event.flow_style:
+        raise UnsupportedDocument("flow style is disallowed")
+
+    if isinstance(event, yaml.MappingStartEvent):
+        node = Node(MAPPING, [])
+        keys = set()
+        for key_event in events:
+            if isinstance(key_event, yaml.MappingEndEvent):
+                break
+            key = _compose_node(key_event, events, keep_marks)
+            if key.kind != SCALAR or key.value in keys:
+                raise UnsupportedDocument("complex or duplicated key")
+            keys.add(key.value)
+            value = _compose_node(next(events), events, keep_marks)
+            key.parent, key.index, key.is_key = node, len(node.value), True
+            value.parent, value.index = node, len(node.value)
+            node.value.append((key, value))
+    else:
+        node = Node(SEQUENCE, [])
+        for item_event in events:
+            if isinstance(item_event, yaml.SequenceEndEvent):
+                break
+            item = _compose_node(item_event, events, keep_marks)
+            item.parent, item.index = node, len(node.value)
+            node.value.append(item)
+
+    if not node.value:
+        raise UnsupportedDocument("empty collection")
+    if keep_marks:
+        node.start_line0 = event.start_mark.line
+        last = node.value[-1][1] if node.kind == MAPPING else node.value[-1]
+        node.end_line0 = last.end_line0
+    return node
+
+
+def _to_ruamel(node):
+    if node.kind == MAPPING:
+        return CommentedMap((key.value, _to_ruamel(value)) for key, value in node.value)
+    if node.kind == SEQUENCE:
+        return CommentedSeq(_to_ruamel(item) for item in node.value)
+    if node.style == "|":
+        if node.value.endswith("\n\n") or node.value[:1] in (" ", "\n"):
+            raise UnsupportedDocument("literal scalar with leading or trailing blank lines")
+        return LiteralScalarString(node.value)
+    if node.style == ">":
+        raise UnsupportedDocument("folded scalars keep their source folding when dumped")
+    return node.value
+
+
+def _assign_lines(node, dumped):
+    node.start_line0, node.end_line0 = dumped.start_line0, dumped.end_line0
+    if node.kind == MAPPING:
+        for (key, value), (dumped_key, dumped_value) in zip(node.value, dumped.value):
+            _assign_lines(key, dumped_key)
+            _assign_lines(value, dumped_value)
+    elif node.kind == SEQUENCE:
+        for item, dumped_item in zip(node.value, dumped.value):
+            _assign_lines(item, dumped_item)
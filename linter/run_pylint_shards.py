@@ -0,0 +1,112 @@
+"""
+Run pylint over many recipes, split into deterministic shards executed by a pool of processes.
+
+Every worker process runs pylint in-process for each shard it receives, so the astroid modules
+parsed for the first shard (conan, conans, the plugins in this folder) are reused by the next ones.
+The messages of all the shards are merged into a single JSON file, with the same format as
+`pylint --output-format=json`, and optionally summarized as markdown:
+
+    python3 linter/run_pylint_shards.py --rcfile=linter/pylintrc_recipe "recipes/*/*/conanfile.py" \\
+        --output=recipes.json --summary >> $GITHUB_STEP_SUMMARY
+
+Unknown arguments are forwarded to pylint, except the output format which is always JSON. Checks
+comparing several files (duplicate-code) only see the files of the same shard.
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import zlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from yaml_linting import expand_paths
+
+# Fixed, so that a shard holds the same files on every machine (--only-shard), and enough to balance the load of
+#   the processes of one machine
+DEFAULT_SHARDS = 64
+
+
+def split_shards(paths, shards):
+    """Assign each path to a shard by the hash of its name, so it stays in the same shard between runs"""
+    result = [[] for _ in range(shards)]
+    for path in paths:
+        result[zlib.crc32(path.encode("utf-8")) % shards].append(path)
+    return result
+
+
+def lint_shard(pylint_args, paths):
+    from pylint.lint import Run
+    from pylint.reporters import JSONReporter
+
+    if not paths:
+        return []
+    output = io.StringIO()
+    Run(pylint_args + paths, reporter=JSONReporter(output), exit=False)
+    return json.loads(output.getvalue() or "[]")
+
+
+def lint_files(pylint_args, paths, jobs, shards=None, only_shard=None):
+    """Messages of pylint for all the `paths`, sorted by path"""
+    shards = split_shards(paths, shards or DEFAULT_SHARDS)
+    if only_shard is not None:
+        shards = [shards[only_shard]]
+
+    messages = []
+    if jobs <= 1:
+        for shard in shards:
+            messages.extend(lint_shard(pylint_args, shard))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            for shard_messages in executor.map(lint_shard, [pylint_args] * len(shards), shards):
+                messages.extend(shard_messages)
+    # Same order no matter how the files were sharded, messages of a file keep the order of pylint
+    messages.sort(key=lambda message: message["path"])
+    return messages
+
+
+def summary(messages):
+    """Number of errors by message, most frequent first (same as the jq summary of the v2 linter workflow)"""
+    errors = defaultdict(int)
+    for message in messages:
+        if message["type"] == "error":
+            errors[message["message"]] += 1
+    ranking = sorted(errors.items(), key=lambda item: (item[1], item[0]), reverse=True)
+    return "".join(f" * {message}: {count}\n" for message, count in ranking)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run pylint over many files, split into shards linted in parallel.")
+    parser.add_argument("paths", nargs="+", help="files or glob patterns (e.g. 'recipes/*/*/conanfile.py') to lint.")
+    parser.add_argument("--rcfile", required=True, help="pylint configuration file.")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="number of pylint processes (default: number of CPUs).")
+    parser.add_argument("--shards", type=int,
+                        help=f"number of shards the files are split into (default: {DEFAULT_SHARDS}).")
+    parser.add_argument("--only-shard", type=int, metavar="INDEX",
+                        help="lint only this shard (0 based), to split the files between several machines.")
+    parser.add_argument("--output", help="write the merged messages to this JSON file (default: stdout).")
+    parser.add_argument("--summary", action="store_true",
+                        help="print the number of errors by message as a markdown list instead of the messages.")
+    args, pylint_args = parser.parse_known_args()
+    shards = args.shards or DEFAULT_SHARDS
+    if args.only_shard is not None and not 0 <= args.only_shard < shards:
+        parser.error(f"--only-shard must be between 0 and {shards - 1}")
+
+    pylint_args = [f"--rcfile={args.rcfile}"] + pylint_args
+    messages = lint_files(pylint_args, expand_paths(args.paths), args.jobs, shards, args.only_shard)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(messages, f, indent=4)
+    elif not args.summary:
+        json.dump(messages, sys.stdout, indent=4)
+    if args.summary:
+        print(summary(messages), end="")
+
+
+if __name__ == "__main__":
+    main()
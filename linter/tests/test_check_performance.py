@@ -0,0 +1,148 @@
+import astroid
+from pylint.testutils import CheckerTestCase, MessageTest
+
+from linter.check_performance import Performance
+
+
+class TestPerformance(CheckerTestCase):
+    CHECKER_CLASS = Performance
+
+    def _assert_message(self, code, msg_id, args):
+        """The node marked in the code (by #@ or __()) is the only one reported"""
+        node = astroid.extract_node(code)
+        with self.assertAddsMessages(MessageTest(msg_id=msg_id, node=node, args=args), ignore_position=True):
+            self.walk(node.root())
+
+    def _assert_no_message(self, code):
+        with self.assertNoMessages():
+            self.walk(astroid.parse(code))
+
+    def test_collect_libs_in_package_info(self):
+        self._assert_message("""
+from conan import ConanFile
+from conan.tools.files import collect_libs
+
+class Recipe(ConanFile):
+    def package_info(self):
+        self.cpp_info.libs = __(collect_libs(self))
+""", "conan-package-info-collect-libs", ("package_info()",))
+
+    def test_collect_libs_in_helper_of_package_info(self):
+        self._assert_message("""
+from conan import ConanFile
+from conan.tools.files import collect_libs
+
+class Recipe(ConanFile):
+    @property
+    def _libs(self):
+        return __(collect_libs(self))
+
+    def package_info(self):
+        self.cpp_info.libs = self._libs
+""", "conan-package-info-collect-libs", ("package_info() -> _libs",))
+
+    def test_collect_libs_outside_package_info(self):
+        self._assert_no_message("""
+from conan import ConanFile
+from conan.tools.files import collect_libs
+
+class Recipe(ConanFile):
+    def package(self):
+        self.output.info(collect_libs(self))
+
+    def package_info(self):
+        self.cpp_info.libs = ["foo"]
+""")
+
+    def test_file_read_in_package_info(self):
+        self._assert_message("""
+import os
+from conan import ConanFile
+from conan.tools.files import load
+
+class Recipe(ConanFile):
+    def package_info(self):
+        self.cpp_info.defines = __(load(self, os.path.join(self.package_folder, "defines.txt"))).split()
+""", "conan-package-info-read-file", ("package_info()",))
+
+    def test_recipe_file_read_in_package_info(self):
+        self._assert_no_message("""
+import os
+from conan import ConanFile
+
+class Recipe(ConanFile):
+    def package_info(self):
+        path = os.path.join(self.recipe_folder, "libs.txt")
+        with open(path) as f:
+            self.cpp_info.libs = f.read().split()
+""")
+
+    def test_subprocess_in_graph_method(self):
+        self._assert_message("""
+from conan import ConanFile
+
+class Recipe(ConanFile):
+    def _check_tool(self):
+        self.run("tool --version") #@
+
+    def validate(self):
+        self._check_tool()
+""", "conan-subprocess-in-graph-method", ("validate() -> _check_tool",))
+
+    def test_subprocess_module_in_graph_method(self):
+        self._assert_message("""
+import subprocess
+from conan import ConanFile
+
+class Recipe(ConanFile):
+    def configure(self):
+        subprocess.check_output(["tool", "--version"]) #@
+""", "conan-subprocess-in-graph-method", ("configure()",))
+
+    def test_subprocess_in_build(self):
+        self._assert_no_message("""
+import subprocess
+from conan import ConanFile
+
+class Recipe(ConanFile):
+    def build(self):
+        self.run("make")
+        subprocess.check_call(["make", "install"])
+""")
+
+    def test_heavy_module_import(self):
+        self._assert_message("""
+from conan import ConanFile
+import pkg_resources #@
+
+class Recipe(ConanFile):
+    pass
+""", "conan-heavy-module-import", ("pkg_resources",))
+
+    def test_heavy_module_from_import(self):
+        self._assert_message("""
+from conan import ConanFile
+from setuptools.sandbox import run_setup #@
+
+class Recipe(ConanFile):
+    pass
+""", "conan-heavy-module-import", ("setuptools.sandbox",))
+
+    def test_heavy_module_imported_in_method(self):
+        self._assert_no_message("""
+from conan import ConanFile
+
+class Recipe(ConanFile):
+    def build(self):
+        import pkg_resources
+        self.output.info(pkg_resources.__name__)
+""")
+
+    def test_not_a_recipe(self):
+        self._assert_no_message("""
+from conan.tools.files import collect_libs
+
+class Helper:
+    def package_info(self):
+        return collect_libs(self)
+""")
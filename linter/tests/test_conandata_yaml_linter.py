@@ -0,0 +1,90 @@
+import glob
+import os
+
+import pytest
+
+from conandata_yaml_linter import _lint_document, lint_file, lint_file_pyyaml
+from pyyaml_document import PyYAMLDocument, UnsupportedDocument
+
+RECIPES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "recipes")
+CONANDATA_FILES = sorted(glob.glob(os.path.join(RECIPES_DIR, "*", "*", "conandata.yml")))
+
+# An official patch without patch_source, and a patch with base_path: the annotations have lines
+CONANDATA = """\
+sources:
+  "1.0":
+    url: "https://example.com/1.0.tar.gz"
+    sha256: "abc"
+patches:
+  "1.0":
+    - patch_file: "patches/0001-fix.patch"
+      patch_description: "fix"
+      patch_type: "official"
+    - patch_file: "patches/0002-fix.patch"
+      patch_description: "fix"
+      patch_type: "conan"
+      base_path: "src"
+  "2.0":
+    - patch_file: "patches/0003-fix.patch"
+      patch_description: "fix"
+      patch_type: "backport"
+"""
+
+
+def _write(tmp_path, content):
+    path = tmp_path / "conandata.yml"
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.parametrize("path", CONANDATA_FILES, ids=lambda path: os.path.relpath(path, RECIPES_DIR))
+def test_backends_agree_on_recipes(path):
+    assert lint_file_pyyaml(path) == lint_file(path)
+
+
+def test_document_without_fallback(tmp_path):
+    path = _write(tmp_path, CONANDATA)
+    annotations = _lint_document(PyYAMLDocument.load(path))
+    assert [(a.level, a.line, a.endline) for a in annotations] == [
+        ("warning", 9, 9), ("notice", 13, 13), ("warning", 14, 17), ("warning", 16, 17)
+    ]
+    assert annotations == lint_file(path)
+
+
+@pytest.mark.parametrize("content", [
+    CONANDATA.replace('    sha256: "abc"\n', '    sha256: "abc"  # checksum\n'),
+    "# patched versions\n" + CONANDATA,
+    CONANDATA.replace("patches:\n", "\npatches:\n"),
+    CONANDATA.replace('  "2.0":\n', '\n  "2.0":\n'),
+], ids=["trailing-comment", "comment-line", "blank-line", "blank-line-in-patches"])
+def test_comments_and_blank_lines_fall_back(tmp_path, content):
+    path = _write(tmp_path, content)
+    with pytest.raises(UnsupportedDocument):
+        _lint_document(PyYAMLDocument.load(path))
+    annotations = lint_file(path)
+    assert annotations
+    assert lint_file_pyyaml(path) == annotations
+
+
+@pytest.mark.parametrize("content", [
+    CONANDATA.replace('    sha256: "abc"\n', '    sha256: &checksum "abc"\n')
+    + '  "3.0":\n    - patch_file: *checksum\n      patch_description: "fix"\n      patch_type: "conan"\n',
+    CONANDATA.replace('      patch_description: "fix"\n      patch_type: "official"\n',
+                      '      patch_description: !!str "fix"\n      patch_type: "official"\n'),
+    CONANDATA.replace('    url: "https://example.com/1.0.tar.gz"\n    sha256: "abc"\n',
+                      '    {url: "https://example.com/1.0.tar.gz", sha256: "abc"}\n'),
+    CONANDATA.replace('      patch_description: "fix"\n      patch_type: "official"\n',
+                      '      patch_description: >\n        fix of\n        the build\n      patch_type: "official"\n'),
+    CONANDATA.replace('      patch_description: "fix"\n      patch_type: "official"\n',
+                      '      patch_description: |2\n         fix\n      patch_type: "official"\n'),
+    CONANDATA + "extra: {}\n",
+    CONANDATA + "---\nsources: {}\n",
+    "sources:\n  - \"1.0\"\n",
+    "sources: [\n",
+], ids=["alias", "tag", "flow-style", "folded-scalar", "literal-leading-space", "key-not-in-schema",
+        "multiple-documents", "sources-sequence", "invalid-yaml"])
+def test_unsupported_nodes_fall_back(tmp_path, content):
+    path = _write(tmp_path, content)
+    with pytest.raises(UnsupportedDocument):
+        _lint_document(PyYAMLDocument.load(path))
+    assert lint_file_pyyaml(path) == lint_file(path)
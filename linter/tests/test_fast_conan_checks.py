@@ -0,0 +1,115 @@
+import os
+import textwrap
+
+import pytest
+
+from fast_conan_checks import MESSAGES, check_file, enabled_messages
+from run_pylint_shards import lint_shard
+
+LINTER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+RECIPE = """\
+from conans import ConanFile, errors, tools
+from conans.errors import ConanException, ConanInvalidConfiguration
+from conan import tools as conan_tools
+from conan.tools.cmake.layout import cmake_layout
+from conan.tools.layout import basic_layout
+
+
+class FooConan(ConanFile):
+    name = "Foo"
+    version = "1.0"
+
+    def layout(self):
+        cmake_layout(self)
+
+
+class BarConan(ConanFile):
+    settings = "os"
+
+    def layout(self):
+        basic_layout(self, src_folder="source")
+"""
+
+RECIPE_WITHOUT_MESSAGES = """\
+from conan import ConanFile
+from conan.errors import ConanInvalidConfiguration
+from conan.tools.layout import basic_layout
+
+
+class FooConan(ConanFile):
+    name = "foo"
+
+    def layout(self):
+        basic_layout(self, src_folder="src")
+
+    def validate(self):
+        if self.settings.os == "Windows":
+            raise ConanInvalidConfiguration("Windows is not supported")
+"""
+
+TEST_PACKAGE = """\
+from conans import ConanFile
+from conan.tools.layout import basic_layout
+
+
+class TestPackageConan(ConanFile):
+    name = "test_package"
+
+    def layout(self):
+        basic_layout(self)
+"""
+
+
+def _fixture(tmp_path, monkeypatch, folder, content):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs(folder)
+    path = os.path.join(folder, "conanfile.py")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return path
+
+
+def _sorted(messages):
+    return sorted(messages, key=lambda m: (m["path"], m["line"], m["column"], m["message-id"]))
+
+
+def _compare(path, rcfile):
+    """Messages of the fast checks, after checking pylint reports the same ones"""
+    rcfile = os.path.join(LINTER_DIR, rcfile)
+    fast = check_file(path, enabled_messages(rcfile))
+    pylint = [m for m in lint_shard([f"--rcfile={rcfile}"], [path]) if m["message-id"] in MESSAGES]
+    assert _sorted(fast) == _sorted(pylint)
+    return fast
+
+
+def test_recipe(tmp_path, monkeypatch):
+    path = _fixture(tmp_path, monkeypatch, os.path.join("recipes", "foo", "all"), RECIPE)
+    messages = _compare(path, "pylintrc_recipe")
+    assert sorted({m["message-id"] for m in messages}) == [
+        "E9004", "E9005", "E9006", "E9008", "E9009", "E9010", "E9011", "E9012", "E9013", "E9014"
+    ]
+
+
+def test_recipe_without_messages(tmp_path, monkeypatch):
+    path = _fixture(tmp_path, monkeypatch, os.path.join("recipes", "foo", "all"), RECIPE_WITHOUT_MESSAGES)
+    assert _compare(path, "pylintrc_recipe") == []
+
+
+@pytest.mark.parametrize("folder", ["test_package", "test_v1_package"])
+def test_test_package(tmp_path, monkeypatch, folder):
+    path = _fixture(tmp_path, monkeypatch, os.path.join("recipes", "foo", "all", folder), TEST_PACKAGE)
+    messages = _compare(path, "pylintrc_testpackage")
+    # The layout messages are disabled for the test packages
+    assert sorted(m["message-id"] for m in messages) == ["E9006", "E9007"]
+
+
+def test_disabled_messages(tmp_path):
+    rcfile = tmp_path / "pylintrc"
+    rcfile.write_text(textwrap.dedent("""\
+        [MESSAGES CONTROL]
+        disable=all
+        enable=conan-bad-name,
+               E9014
+    """), encoding="utf-8")
+    assert enabled_messages(str(rcfile)) == {"E9004", "E9014"}
@@ -2,32 +2,38 @@
 # Class ConanFile doesn't declare all the valid members and functions,
 #   some are injected by Conan dynamically to the class.
 
-import textwrap
+import os
+from functools import lru_cache
+
 import astroid
 from astroid.builder import AstroidBuilder
-from astroid.manager import AstroidManager
 
 
-def _settings_transform():
-    module = AstroidBuilder(AstroidManager()).string_build(
-        textwrap.dedent("""
-            class Settings(object):
-                os = None
-                arch = None
-                compiler = None
-                build_type = None
-            """)
-    )
-    return module['Settings']
+# Generated from the Conan version used by ConanCenter by generate_conanfile_stubs.py. As a .pyi file, pylint knows that the
+#   `...` bodies of its functions are not their code, and does not report the values they return as None
+STUBS_FILE = os.path.join(os.path.dirname(__file__), "conanfile_stubs.pyi")
+
+DYNAMIC_FIELDS = [
+    "conan_data",
+    "build_requires",
+    "tool_requires",
+    "info_build",
+    "user_info_build",
+    "info",
+    "copy",
+    "copy_deps",
+    "python_requires",
+    "recipe_folder",
+    "settings_build",
+    "settings_target",
+    "conf",
+]
 
-def _user_info_build_transform():
-    module = AstroidBuilder(AstroidManager()).string_build(
-        textwrap.dedent("""
-            class UserInfoBuild(defaultdict):
-                pass
-            """)
-    )
-    return module['UserInfoBuild']
+
+@lru_cache(maxsize=None)
+def _stubs():
+    # Built once per process, only this small module is parsed instead of the Conan internals
+    return AstroidBuilder(astroid.MANAGER).file_build(STUBS_FILE, "conanfile_stubs")
 
 
 def register(_):
@@ -36,37 +42,9 @@ def register(_):
 def transform_conanfile(node):
     """Transform definition of ConanFile class so dynamic fields are visible to pylint"""
 
-    str_class = astroid.builtin_lookup("str")
-    dict_class = astroid.builtin_lookup("dict")
-    info_class = astroid.MANAGER.ast_from_module_name("conans.model.info").lookup(
-        "ConanInfo")
-    build_requires_class = astroid.MANAGER.ast_from_module_name(
-        "conans.client.graph.graph_manager").lookup("_RecipeBuildRequires")
-    file_copier_class = astroid.MANAGER.ast_from_module_name(
-        "conans.client.file_copier").lookup("FileCopier")
-    file_importer_class = astroid.MANAGER.ast_from_module_name(
-        "conans.client.importer").lookup("_FileImporter")
-    python_requires_class = astroid.MANAGER.ast_from_module_name(
-        "conans.client.graph.python_requires").lookup("PyRequires")
-
-    dynamic_fields = {
-        "conan_data": str_class,
-        "build_requires": build_requires_class,
-        "tool_requires": build_requires_class,
-        "info_build": info_class,
-        "user_info_build": [_user_info_build_transform()],
-        "info": info_class,
-        "copy": file_copier_class,
-        "copy_deps": file_importer_class,
-        "python_requires": [str_class, python_requires_class],
-        "recipe_folder": str_class,
-        "settings_build": [_settings_transform()],
-        "settings_target": [_settings_transform()],
-        "conf": dict_class,
-    }
-    
-    for f, t in dynamic_fields.items():
-        node.locals[f] = [i for i in t]
+    stubs = _stubs()
+    for f in DYNAMIC_FIELDS:
+        node.locals[f] = stubs.locals[f]
 
 
 astroid.MANAGER.register_transform(
@@ -1,4 +1,14 @@
 import argparse
+import glob
+import hashlib
+import json
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+
+Annotation = namedtuple("Annotation", ["level", "line", "endline", "title", "message"])
 
 
 def file_path(a_string):
@@ -7,3 +17,174 @@ def file_path(a_string):
     if not isfile(a_string):
         raise argparse.ArgumentTypeError(f"{a_string} does not point to a file")
     return a_string
+
+
+def file_path_or_pattern(a_string):
+    if glob.has_magic(a_string):
+        return a_string
+    return file_path(a_string)
+
+
+def add_batch_arguments(parser):
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        type=file_path_or_pattern,
+        help="files or glob patterns (e.g. 'recipes/*/config.yml') to validate.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="number of files to validate in parallel (default: number of CPUs).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="directory where the results are stored by content hash, unchanged files are not parsed again.",
+    )
+    parser.add_argument(
+        "--cache-max-age",
+        type=int,
+        default=30,
+        help="days after which an unused cache entry is removed (default: 30).",
+    )
+    parser.add_argument(
+        "--cache-max-size",
+        type=int,
+        default=100,
+        help="maximum size of the cache in MB, least recently used entries are removed first (default: 100).",
+    )
+
+
+def expand_paths(patterns):
+    """Expand the glob patterns, returning each file once in a stable order"""
+    paths = set()
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            paths.update(p for p in glob.glob(pattern, recursive=True) if os.path.isfile(p))
+        else:
+            paths.add(pattern)
+    return sorted(paths)
+
+
+def format_annotation(path, annotation):
+    return (
+        f"::{annotation.level} file={path},line={annotation.line},endline={annotation.endline},"
+        f"title={annotation.title}::{annotation.message}"
+    )
+
+
+class ResultCache:
+    """
+    Annotations of already validated files, stored in `cache_dir` by the hash of the file content
+    and of the linter sources (schema definitions, messages and the modules they use), so any change
+    to the linter invalidates the previous results. The `variant` (like the backend selected) keeps
+    the results of the different implementations of a linter apart.
+    """
+
+    def __init__(self, cache_dir, linter_files, max_age_days, max_size_mb, variant=""):
+        self.cache_dir = cache_dir
+        self.max_age = max_age_days * 24 * 3600
+        self.max_size = max_size_mb * 1024 * 1024
+        self.schema_version = hashlib.sha256()
+        for source in (*linter_files, __file__):
+            with open(source, "rb") as f:
+                self.schema_version.update(f.read())
+        self.schema_version.update(b"\0" + variant.encode())
+
+    def key(self, path):
+        digest = self.schema_version.copy()
+        with open(path, "rb") as f:
+            digest.update(f.read())
+        return digest.hexdigest()
+
+    def _entry(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key):
+        entry = self._entry(key)
+        try:
+            with open(entry, encoding="utf-8") as f:
+                annotations = [Annotation(*item) for item in json.load(f)]
+        except (OSError, ValueError, TypeError):
+            return None
+        os.utime(entry)  # Mark as recently used
+        return annotations
+
+    def put(self, key, annotations):
+        entry = self._entry(key)
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        tmp = f"{entry}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(annotations, f)
+        os.replace(tmp, entry)
+
+    def prune(self):
+        """Remove the entries unused for `max_age`, then the least recently used until under `max_size`"""
+        now = time.time()
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                entry = os.path.join(root, name)
+                try:
+                    stat = os.stat(entry)
+                except OSError:
+                    continue
+                if now - stat.st_mtime > self.max_age:
+                    os.remove(entry)
+                else:
+                    entries.append((stat.st_mtime, stat.st_size, entry))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            os.remove(entry)
+            total_size -= size
+
+
+def cache_from_arguments(args, *linter_files, variant=""):
+    if not args.cache_dir:
+        return None
+    return ResultCache(args.cache_dir, linter_files, args.cache_max_age, args.cache_max_size, variant)
+
+
+def run_linter(lint_file, patterns, jobs, cache=None):
+    """
+    Validate every file with `lint_file` (a module level function returning a list of
+    annotations for a path) and print the annotations in the order of the sorted paths,
+    no matter in which order the workers complete. Files found in the `cache` are not
+    validated again, their stored annotations are printed instead.
+    """
+    paths = expand_paths(patterns)
+    keys = {path: cache.key(path) for path in paths} if cache else {}
+    cached = {}
+    for path, key in keys.items():
+        annotations = cache.get(key)
+        if annotations is not None:
+            cached[path] = annotations
+
+    pending = [path for path in paths if path not in cached]
+    results = _lint_files(lint_file, pending, jobs)
+    for path in paths:
+        annotations = cached.get(path)
+        if annotations is None:
+            annotations = next(results)
+            if cache:
+                cache.put(keys[path], annotations)
+        for annotation in annotations:
+            print(format_annotation(path, annotation))
+
+    if cache:
+        cache.prune()
+
+
+def _lint_files(lint_file, paths, jobs):
+    if jobs <= 1 or len(paths) <= 1:
+        yield from map(lint_file, paths)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        chunksize = max(1, len(paths) // (jobs * 8))
+        yield from executor.map(lint_file, paths, chunksize=chunksize)
@@ -26,10 +26,12 @@ class AbseilConan(ConanFile):
     options = {
         "shared": [True, False],
         "fPIC": [True, False],
+        "lto": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
+        "lto": False,
     }
     short_paths = True
 
@@ -61,6 +63,11 @@ class AbseilConan(ConanFile):
         if self.options.shared:
             self.options.rm_safe("fPIC")
 
+    def package_id(self):
+        # keeps the package IDs built before the option existed
+        if not self.info.options.lto:
+            del self.info.options.lto
+
     def validate(self):
         if self.settings.compiler.cppstd:
             check_min_cppstd(self, self._min_cppstd)
@@ -90,6 +97,8 @@ class AbseilConan(ConanFile):
         if is_msvc(self):
             # see https://github.com/abseil/abseil-cpp/issues/649
             tc.preprocessor_definitions["_HAS_DEPRECATED_RESULT_OF"] = 1
+        tc.variables["CMAKE_INTERPROCEDURAL_OPTIMIZATION"] = self.options.lto
+        tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0069"] = "NEW"
         tc.generate()
 
     def _patch_sources(self):
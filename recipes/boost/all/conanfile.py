@@ -14,6 +14,7 @@ from conan.tools.scm import Version
 
 import glob
 from io import StringIO
+import json
 import os
 import re
 import shlex
@@ -61,6 +62,32 @@ CONFIGURE_OPTIONS = (
     "wave",
 )
 
+# Variables of the python installation (sysconfig and distutils.sysconfig) used to find its headers and library
+PYTHON_CONFIG_VARS = ("INCLUDEPY", "INCLUDEDIR", "LIBRARY", "LDLIBRARY", "LIBDIR", "MULTIARCH", "multiarchsubdir",
+                      "WITH_DYLD", "LIBDEST")
+
+# Prints, as JSON, all the values of the python installation used by the recipe (one-liner valid in python 2 and 3,
+# where exec() is a statement and a function). distutils is only queried where it can be imported (not Python 3.12+).
+PYTHON_PROBE_SCRIPT = (
+    "from __future__ import print_function; "
+    "import json, sys, sysconfig; "
+    "du = None; "
+    "exec('try:\\n import distutils.sysconfig as du\\nexcept Exception:\\n du = None'); "
+    "s = lambda v: None if v is None else str(v).strip(); "
+    f"names = {list(PYTHON_CONFIG_VARS)!r}; "
+    "print(json.dumps(dict("
+    "version='{}.{}'.format(sys.version_info[0], sys.version_info[1]), "
+    "abiflags=getattr(sys, 'abiflags', ''), "
+    "paths=dict((n, s(sysconfig.get_path(n))) for n in ('include', 'platinclude')), "
+    "python_inc=s(getattr(sysconfig, 'get_python_inc', lambda: None)()), "
+    "sc_vars=dict((n, s(sysconfig.get_config_var(n))) for n in names), "
+    "du_vars=dict((n, s(du.get_config_var(n))) for n in names) if du else dict())))"
+)
+
+# Results of PYTHON_PROBE_SCRIPT, by path and modification time of the interpreter, shared by all the
+# instances of the recipe loaded in the same conan process
+_python_probes = {}
+
 
 class BoostConan(ConanFile):
     name = "boost"
@@ -153,6 +180,7 @@ class BoostConan(ConanFile):
     short_paths = True
     no_copy_source = True
     _cached_dependencies = None
+    _cached_transitive_dependencies = None
 
     def export(self):
         copy(self, f"dependencies/{self._dependency_filename}", src=self.recipe_folder, dst=self.export_folder)
@@ -197,31 +225,44 @@ class BoostConan(ConanFile):
                 self._cached_dependencies = yaml.safe_load(f)
         return self._cached_dependencies
 
+    @property
+    def _transitive_dependencies(self):
+        """
+        All (direct and indirect) dependencies and dependents of every module, the module itself included
+        """
+        if self._cached_transitive_dependencies is None:
+            dependencies = self._dependencies["dependencies"]
+            forward = self._dependencies.get("transitive_dependencies")
+            reverse = self._dependencies.get("transitive_dependents")
+            if forward is None or reverse is None:
+                # dependencies-x.y.z.yml generated before rebuild-dependencies.py computed the closures
+                forward = {}
+
+                def closure(module):
+                    if module not in forward:
+                        forward[module] = set()
+                        for dependency in dependencies.get(module, []):
+                            forward[module].add(dependency)
+                            forward[module].update(closure(dependency))
+                    return forward[module]
+
+                for module in dependencies:
+                    closure(module)
+                reverse = {module: set() for module in forward}
+                for module, module_dependencies in forward.items():
+                    for dependency in module_dependencies:
+                        reverse.setdefault(dependency, set()).add(module)
+            self._cached_transitive_dependencies = (
+                {module: {module, *module_dependencies} for module, module_dependencies in forward.items()},
+                {module: {module, *dependents} for module, dependents in reverse.items()},
+            )
+        return self._cached_transitive_dependencies
+
     def _all_dependent_modules(self, name):
-        dependencies = {name}
-        while True:
-            new_dependencies = set()
-            for dependency in dependencies:
-                new_dependencies.update(set(self._dependencies["dependencies"][dependency]))
-                new_dependencies.update(dependencies)
-            if len(new_dependencies) > len(dependencies):
-                dependencies = new_dependencies
-            else:
-                break
-        return dependencies
+        return self._transitive_dependencies[0].get(name, {name})
 
     def _all_super_modules(self, name):
-        dependencies = {name}
-        while True:
-            new_dependencies = set(dependencies)
-            for module in self._dependencies["dependencies"]:
-                if dependencies.intersection(set(self._dependencies["dependencies"][module])):
-                    new_dependencies.add(module)
-            if len(new_dependencies) > len(dependencies):
-                dependencies = new_dependencies
-            else:
-                break
-        return dependencies
+        return self._transitive_dependencies[1].get(name, {name})
 
     @property
     def _bcp_dir(self):
@@ -598,6 +639,29 @@ class BoostConan(ConanFile):
         output = output.strip()
         return output if output != "None" else None
 
+    @property
+    def _python_probe(self):
+        """
+        obtain all the values of the python installation used by the recipe, with a single run of the interpreter
+        :return: dict of the values (see PYTHON_PROBE_SCRIPT), empty if the interpreter failed
+        """
+        executable = self._python_executable
+        path = shutil.which(executable) or executable
+        try:
+            key = (path, os.path.getmtime(path))
+        except OSError:
+            key = None
+        if key in _python_probes:
+            return _python_probes[key]
+        output = self._run_python_script(PYTHON_PROBE_SCRIPT)
+        try:
+            probe = json.loads(output.splitlines()[-1]) if output else {}
+        except ValueError:
+            probe = {}
+        if probe and key:
+            _python_probes[key] = probe
+        return probe
+
     def _get_python_path(self, name):
         """
         obtain path entry for the python installation
@@ -606,9 +670,7 @@ class BoostConan(ConanFile):
         """
         # https://docs.python.org/3/library/sysconfig.html
         # https://docs.python.org/2.7/library/sysconfig.html
-        return self._run_python_script("from __future__ import print_function; "
-                                       "import sysconfig; "
-                                       f"print(sysconfig.get_path('{name}'))")
+        return self._python_probe.get("paths", {}).get(name)
 
     def _get_python_sc_var(self, name):
         """
@@ -616,9 +678,7 @@ class BoostConan(ConanFile):
         :param name: name of variable to be queried (such as LIBRARY or LDLIBRARY)
         :return: value of python sysconfig variable
         """
-        return self._run_python_script("from __future__ import print_function; "
-                                       "import sysconfig; "
-                                       f"print(sysconfig.get_config_var('{name}'))")
+        return self._python_probe.get("sc_vars", {}).get(name)
 
     def _get_python_du_var(self, name):
         """
@@ -627,9 +687,7 @@ class BoostConan(ConanFile):
         :param name: name of variable to be queried (such as LIBRARY or LDLIBRARY)
         :return: value of python sysconfig variable
         """
-        return self._run_python_script("from __future__ import print_function; "
-                                       "import distutils.sysconfig as du_sysconfig; "
-                                       f"print(du_sysconfig.get_config_var('{name}'))")
+        return self._python_probe.get("du_vars", {}).get(name)
 
     def _get_python_var(self, name):
         """
@@ -652,13 +710,13 @@ class BoostConan(ConanFile):
         obtain version of python interpreter
         :return: python interpreter version, in format major.minor
         """
-        return self._run_python_script("from __future__ import print_function; "
-                                       "import sys; "
-                                       "print('{}.{}'.format(sys.version_info[0], sys.version_info[1]))")
+        return self._python_probe.get("version")
 
     @property
     def _python_version(self):
         version = self._detect_python_version()
+        if version is None:
+            raise ConanException(f"could not query the python installation of {self._python_executable}")
         if self.options.python_version and version != self.options.python_version:
             raise ConanInvalidConfiguration(f"detected python version {version} doesn't match conan option {self.options.python_version}")
         return version
@@ -669,9 +727,7 @@ class BoostConan(ConanFile):
         obtain the result of the "sysconfig.get_python_inc()" call
         :return: result of the "sysconfig.get_python_inc()" execution
         """
-        return self._run_python_script("from __future__ import print_function; "
-                                       "import sysconfig; "
-                                       "print(sysconfig.get_python_inc())")
+        return self._python_probe.get("python_inc")
 
     @property
     def _python_abiflags(self):
@@ -679,9 +735,7 @@ class BoostConan(ConanFile):
         obtain python ABI flags, see https://www.python.org/dev/peps/pep-3149/ for the details
         :return: the value of python ABI flags
         """
-        return self._run_python_script("from __future__ import print_function; "
-                                       "import sys; "
-                                       "print(getattr(sys, 'abiflags', ''))")
+        return self._python_probe.get("abiflags")
 
     @property
     def _python_includes(self):
@@ -1214,6 +1268,11 @@ class BoostConan(ConanFile):
             return shutil.which(f"clang++-{compiler_version}") or shutil.which(f"clang++-{major}") or shutil.which("clang++") or ""
         return ""
 
+    @property
+    def _ccache(self):
+        ccache = self.dependencies.build.get("ccache")
+        return ccache.conf_info.get("user.ccache:launcher", check_type=str) if ccache else None
+
     def _create_user_config_jam(self, folder):
         self.output.warning("Patching user-config.jam")
 
@@ -1254,6 +1313,10 @@ class BoostConan(ConanFile):
 
         cxx_fwd_slahes = self._cxx.replace("\\", "/")
         if cxx_fwd_slahes:
+            if self._ccache and not is_msvc(self):
+                # using gcc : : ccache g++ ;
+                ccache_fwd_slashes = self._ccache.replace("\\", "/")
+                contents += f" \"{ccache_fwd_slashes}\""
             contents += f" \"{cxx_fwd_slahes}\""
 
         if is_apple_os(self):
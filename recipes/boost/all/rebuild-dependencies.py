@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 import dataclasses
+import heapq
 from pathlib import Path
 import re
+import shutil
 import subprocess
 import tempfile
 from typing import Dict, List, Tuple
@@ -104,30 +107,39 @@ class BoostDependencies(object):
 
 
 class BoostDependencyBuilder(object):
-    def __init__(self, boost_version: str, boostdep_version: str, tmppath: Path, git_url: str, outputdir: Path, unsafe: bool):
+    def __init__(self, boost_version: str, boostdep_version: str, tmppath: Path, git_url: str, outputdir: Path, unsafe: bool,
+                 worktree: bool = False):
         self.boost_version = boost_version
         self.boostdep_version = boostdep_version
         self.git_url = git_url
         self.tmppath = tmppath
         self.outputdir = outputdir
         self.unsafe = unsafe
+        self.worktree = worktree
 
     @property
-    def boost_path(self) -> Path:
+    def main_boost_path(self) -> Path:
         return self.tmppath / "boost"
 
+    @property
+    def boost_path(self) -> Path:
+        if self.worktree:
+            # Every version has its own worktree of the main clone, so they can be checked out at the same time
+            return self.tmppath / "boost-worktrees" / self.boost_version
+        return self.main_boost_path
+
     def do_git_update(self) -> None:
-        if not self.boost_path.exists():
+        if not self.main_boost_path.exists():
             with tools.chdir(str(self.tmppath)):
                 print("Cloning boost git")
                 subprocess.check_call(["git", "clone", "--", self.git_url, "boost"])
-            with tools.chdir(str(self.boost_path)):
+            with tools.chdir(str(self.main_boost_path)):
                 print("Checking out current master")
                 subprocess.check_call(["git", "checkout", "origin/master"])
                 print("Removing master branch")
                 subprocess.check_call(["git", "branch", "-D", "master"])
         else:
-            with tools.chdir(str(self.boost_path)):
+            with tools.chdir(str(self.main_boost_path)):
                 print("Updating git repo")
                 subprocess.check_call(["git", "fetch", "origin"])
                 print("Removing all local changes to git repo")
@@ -155,14 +167,47 @@ class BoostDependencyBuilder(object):
             print("Removing unknown files/directories")
             subprocess.check_call(["git", "clean", "-d", "-f"])
 
-    def do_install_boostdep(self):
+    def do_git_main_submodule_update(self) -> None:
+        with tools.chdir(str(self.main_boost_path)):
+            # The submodules of the worktrees borrow the objects of these ones
+            print("Updating git submodules of the main clone")
+            subprocess.check_call(["git", "submodule", "update", "--init"])
+
+    def do_git_worktree_add(self) -> None:
+        """Check out the version in a new worktree of the main clone, sharing its object store"""
+        if self.boost_path.exists():
+            shutil.rmtree(str(self.boost_path))
+        with tools.chdir(str(self.main_boost_path)):
+            subprocess.check_call(["git", "worktree", "prune"])
+            print("Adding worktree for version {}".format(self.boost_version))
+            subprocess.check_call(["git", "worktree", "add", "--detach", "--force", str(self.boost_path),
+                                   "boost-{}".format(self.boost_version)])
+        with tools.chdir(str(self.boost_path)):
+            # Writes to the git config shared by all the worktrees: not done concurrently
+            subprocess.check_call(["git", "submodule", "init"])
+
+    def do_git_worktree_submodule_update(self) -> None:
         with tools.chdir(str(self.boost_path)):
+            print("Checking out git submodules of version {}".format(self.boost_version))
+            submodules = subprocess.check_output(["git", "config", "-f", ".gitmodules", "--get-regexp", r"^submodule\..*\.path$"], text=True)
+            for line in submodules.splitlines():
+                key, path = line.split()
+                name = key[len("submodule."):-len(".path")]
+                command = ["git", "submodule", "update", "--quiet"]
+                reference = self.main_boost_path / ".git" / "modules" / name
+                if reference.is_dir():
+                    # Objects missing from the reference are still fetched from the remote
+                    command += ["--reference", str(reference)]
+                subprocess.check_call(command + ["--", path])
+
+    def do_install_boostdep(self):
+        with tools.chdir(str(self.main_boost_path)):
             print("Installing boostdep/{}".format(self.boostdep_version))
             subprocess.check_call(["conan", "install", "boostdep/{}@".format(self.boostdep_version), "-g", "json"])
 
     @property
     def _bin_paths(self):
-        with tools.chdir(str(self.boost_path)):
+        with tools.chdir(str(self.main_boost_path)):
             data = json.loads(open("conanbuildinfo.json").read())
             return data["dependencies"][0]["bin_paths"]
 
@@ -300,6 +345,58 @@ class BoostDependencyBuilder(object):
             tree = {k: [d for d in v if d not in nodeps] for k, v in tree.items() if k not in nodeps}
         return {}
 
+    @staticmethod
+    def topological_order(tree: Dict[str, List[str]]) -> List[str]:
+        """Modules sorted so that every module comes after its dependencies (alphabetical order between independent modules)"""
+        dependents = {k: [] for k in tree}
+        remaining = {k: len(set(v)) for k, v in tree.items()}
+        for k, v in tree.items():
+            for d in set(v):
+                dependents.setdefault(d, []).append(k)
+                remaining.setdefault(d, 0)
+        ready = [k for k, v in remaining.items() if not v]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            module = heapq.heappop(ready)
+            order.append(module)
+            for dependent in dependents.get(module, []):
+                remaining[dependent] -= 1
+                if not remaining[dependent]:
+                    heapq.heappush(ready, dependent)
+        if len(order) != len(remaining):
+            raise Exception("Dependency cycle detected. Remaining modules: {}".format(sorted(set(remaining) - set(order))))
+        return order
+
+    @classmethod
+    def transitive_closures(cls, tree: Dict[str, List[str]]) -> Tuple[Dict[str, List[str]], Dict[str, List[str]], List[str]]:
+        """Return all (direct and indirect) dependencies and dependents of every module, and the topological order"""
+        order = cls.topological_order(tree)
+        dependencies = {}
+        for module in order:
+            closure = set()
+            for d in tree.get(module, []):
+                closure.add(d)
+                closure.update(dependencies[d])
+            dependencies[module] = closure
+        dependents = {module: set() for module in order}
+        for module, closure in dependencies.items():
+            for d in closure:
+                dependents[d].add(module)
+        return ({k: sorted(v) for k, v in dependencies.items()},
+                {k: sorted(v) for k, v in dependents.items()},
+                order)
+
+    @classmethod
+    def add_transitive_dependencies(cls, data: dict) -> dict:
+        """Add the transitive closures and the topological order of `data["dependencies"]`, read by conanfile.py"""
+        transitive_dependencies, transitive_dependents, order = cls.transitive_closures(data["dependencies"])
+        data["transitive_dependencies"] = transitive_dependencies
+        data["transitive_dependents"] = transitive_dependents
+        # Not sorted alphabetically, unlike the other lists
+        data["topological_order"] = order
+        return data
+
     def _fix_dependencies(self, deptree: Dict[str, List[str]]) -> Dict[str, List[str]]:
         try:
             # python does not depend on graph
@@ -422,12 +519,19 @@ class BoostDependencyBuilder(object):
             data["UNSAFE"] = "!DO NOT COMMIT! !THIS FILE IS GENERATED WITH THE UNSAFE OPTION ENABLED!"
 
         data = self._sort_item(data)
+        data = self.add_transitive_dependencies(data)
 
         print("Creating {}".format(self.outputdir))
         with self._outputpath.open("w") as fout:
             yaml.dump(data, fout)
 
 
+def _create_worktree_dependency_file(boost_collector: BoostDependencyBuilder) -> str:
+    boost_collector.do_git_worktree_submodule_update()
+    boost_collector.do_create_dependency_file()
+    return boost_collector.boost_version
+
+
 def main(args=None) -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--verbose", dest="verbose", action="store_true", help="verbose output")
@@ -437,6 +541,10 @@ def main(args=None) -> int:
     parser.add_argument("-U", dest="git_update", action="store_true", help="update the git repo")
     parser.add_argument("-o", dest="outputdir", default=None, type=Path, help="output dependency dir")
     parser.add_argument("-x", dest="unsafe", action="store_true", help="unsafe fast(er) operation")
+    parser.add_argument("-j", dest="jobs", default=1, type=int,
+                        help="number of versions generated concurrently, each one in its own git worktree (default is 1)")
+    parser.add_argument("-c", dest="closures_only", action="store_true",
+                        help="only (re)compute the transitive dependencies of the existing dependency files, without boost git")
 
     version_group = parser.add_mutually_exclusive_group(required=True)
     version_group.add_argument("-v", dest="boost_version", help="boost version")
@@ -449,6 +557,7 @@ def main(args=None) -> int:
 
     if not ns.tmppath:
         ns.tmppath = Path(tempfile.gettempdir())
+    ns.tmppath = Path(ns.tmppath).resolve()
     print("Temporary folder is {}".format(ns.tmppath))
     if not ns.outputdir:
         ns.outputdir = Path("dependencies")
@@ -464,16 +573,45 @@ def main(args=None) -> int:
     else:
         boost_versions = [ns.boost_version]
 
-    for boost_version in boost_versions:
-        print("Starting {}".format(boost_version))
-        boost_collector = BoostDependencyBuilder(
-            boost_version=boost_version,
-            boostdep_version=ns.boostdep_version,
-            git_url=ns.git_url,
-            outputdir=ns.outputdir,
-            tmppath=ns.tmppath,
-            unsafe=ns.unsafe,
-        )
+    if ns.closures_only:
+        for boost_version in boost_versions:
+            outputpath = ns.outputdir / "dependencies-{}.yml".format(boost_version)
+            print("Updating {}".format(outputpath))
+            data = yaml.safe_load(outputpath.open())
+            data = BoostDependencyBuilder.add_transitive_dependencies(data)
+            with outputpath.open("w") as fout:
+                yaml.dump(data, fout)
+        return 0
+
+    boost_collectors = [BoostDependencyBuilder(
+        boost_version=boost_version,
+        boostdep_version=ns.boostdep_version,
+        git_url=ns.git_url,
+        outputdir=ns.outputdir,
+        tmppath=ns.tmppath,
+        unsafe=ns.unsafe,
+        worktree=ns.jobs > 1,
+    ) for boost_version in boost_versions]
+
+    if ns.jobs > 1:
+        main_collector = boost_collectors[0]
+        if not ns.git_update and not main_collector.main_boost_path.exists():
+            log.error("Boost directory does not exist. Re-execute this script with -U to run 'git update'.")
+            return 1
+        if ns.git_update:
+            main_collector.do_git_update()
+        main_collector.do_git_main_submodule_update()
+        main_collector.do_install_boostdep()
+        for boost_collector in boost_collectors:
+            boost_collector.do_git_worktree_add()
+
+        with ProcessPoolExecutor(max_workers=ns.jobs) as executor:
+            for boost_version in executor.map(_create_worktree_dependency_file, boost_collectors):
+                print("Finished {}".format(boost_version))
+        return 0
+
+    for boost_collector in boost_collectors:
+        print("Starting {}".format(boost_collector.boost_version))
 
         if not ns.git_update and not boost_collector.boost_path.exists():
             log.error("Boost directory does not exist. Re-execute this script with -U to run 'git update'.")
@@ -8,7 +8,7 @@ from conan.tools.scm import Version
 import os
 import glob
 
-required_conan_version = ">=1.53.0"
+required_conan_version = ">=1.55.0"
 
 
 class CBlosc2Conan(ConanFile):
@@ -118,6 +118,11 @@ class CBlosc2Conan(ConanFile):
         tc.generate()
 
         deps = CMakeDeps(self)
+        if self.options.with_zlib == "zlib-ng-compat" and Version(self.version) < "2.8.0":
+            # zlib-ng in compat mode is found as ZLIB, the patched CMakeLists of c-blosc2<2.8.0 look for it by its own name
+            deps.set_property("zlib-ng", "cmake_file_name", "zlib-ng")
+            deps.set_property("zlib-ng", "cmake_target_name", "zlib-ng::zlib-ng")
+            deps.set_property("zlib-ng", "cmake_find_mode", "config")
         deps.generate()
 
     def _patch_sources(self):
@@ -122,3 +122,7 @@ class CcacheConan(ConanFile):
         self.output.info("Appending PATH environment variable: {}".format(bin_path))
         self.env_info.PATH.append(bin_path)
         self.cpp_info.includedirs = []
+
+        # Compiler launcher used by the recipes when ccache is in their build context
+        executable = "ccache.exe" if self.settings.os == "Windows" else "ccache"
+        self.conf_info.define("user.ccache:launcher", os.path.join(bin_path, executable))
@@ -22,12 +22,14 @@ class GeosConan(ConanFile):
         "fPIC": [True, False],
         "inline": [True, False],
         "utils": [True, False],
+        "lto": [True, False],
     }
     default_options = {
         "shared": False,
         "fPIC": True,
         "inline": True,
         "utils": True,
+        "lto": False,
     }
 
     @property
@@ -47,6 +49,11 @@ class GeosConan(ConanFile):
     def layout(self):
         cmake_layout(self, src_folder="src")
 
+    def package_id(self):
+        # keeps the package IDs built before the option existed
+        if not self.info.options.lto:
+            del self.info.options.lto
+
     def validate(self):
         if self.settings.compiler.get_safe("cppstd"):
             check_min_cppstd(self, 11)
@@ -68,6 +75,8 @@ class GeosConan(ConanFile):
         tc.variables["BUILD_DOCUMENTATION"] = False
         tc.variables["BUILD_ASTYLE"] = False
         tc.variables["BUILD_GEOSOP"] = self.options.utils
+        tc.variables["CMAKE_INTERPROCEDURAL_OPTIMIZATION"] = self.options.lto
+        tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0069"] = "NEW"
         tc.generate()
 
     def build(self):
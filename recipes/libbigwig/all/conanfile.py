@@ -4,7 +4,7 @@ from conan.tools.files import collect_libs, get, copy
 from conan.errors import ConanInvalidConfiguration
 import os
 
-required_conan_version = ">=1.50.0"
+required_conan_version = ">=1.55.0"
 
 
 class LibBigWigConan(ConanFile):
@@ -78,6 +78,11 @@ class LibBigWigConan(ConanFile):
         tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0077"] = "NEW"  # honor BUILD_SHARED_LIBS
         tc.generate()
         tc = CMakeDeps(self)
+        if self.options.with_zlibng:
+            # zlib-ng in compat mode is found as ZLIB, libBigWig looks for it by its own name
+            tc.set_property("zlib-ng", "cmake_file_name", "zlib-ng")
+            tc.set_property("zlib-ng", "cmake_target_name", "zlib-ng::zlib-ng")
+            tc.set_property("zlib-ng", "cmake_find_mode", "config")
         tc.generate()
 
     def build(self):
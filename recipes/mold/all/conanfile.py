@@ -17,9 +17,13 @@ class MoldConan(ConanFile):
     settings = "os", "arch", "compiler", "build_type"
     options = {
         "with_mimalloc": [True, False],
+        "inject_linker_flags": [True, False],
+        "thread_count": [None, "ANY"],
     }
     default_options = {
         "with_mimalloc": False,
+        "inject_linker_flags": False,
+        "thread_count": None,
     }
 
     def validate(self):
@@ -37,12 +41,17 @@ class MoldConan(ConanFile):
             raise ConanInvalidConfiguration("Clang version 12 or higher required")
         if self.settings.compiler == "apple-clang" and "armv8" == self.settings.arch :
             raise ConanInvalidConfiguration(f'{self.name} is still not supported by Mac M1.')
+        if self.options.thread_count and not str(self.options.thread_count).isdigit():
+            raise ConanInvalidConfiguration(f"{self.ref} option thread_count must be a number of threads")
 
     def layout(self):
         cmake_layout(self, src_folder="src")
 
     def package_id(self):
         del self.info.settings.compiler
+        # Only used by package_info()
+        del self.info.options.inject_linker_flags
+        del self.info.options.thread_count
 
     def requirements(self):
         self.requires("zlib/1.2.13")
@@ -91,6 +100,14 @@ class MoldConan(ConanFile):
         self.env_info.PATH.append(bindir)
         self.env_info.LD = mold_location
         self.buildenv_info.prepend_path("MOLD_ROOT", bindir)
+
+        if self.options.inject_linker_flags:
+            # gcc and clang look for the linker (ld) in the -B folders first, -fuse-ld=mold requires GCC 12.1
+            link_flags = [f"-B{os.path.join(self.package_folder, 'libexec', 'mold')}"]
+            if self.options.thread_count:
+                link_flags.append(f"-Wl,--thread-count={self.options.thread_count}")
+            self.conf_info.append("tools.build:exelinkflags", link_flags)
+            self.conf_info.append("tools.build:sharedlinkflags", link_flags)
         self.cpp_info.includedirs = []
         self.cpp_info.libdirs = []
         self.cpp_info.frameworkdirs = []
@@ -308,6 +308,11 @@ class OpenCVConan(ConanFile):
               set(GLOG_LIBRARIES glog::glog)
             endif()""")
 
+    @property
+    def _ccache(self):
+        ccache = self.dependencies.build.get("ccache")
+        return ccache.conf_info.get("user.ccache:launcher", check_type=str) if ccache else None
+
     def generate(self):
         if self.options.dnn:
             if hasattr(self, "settings_build") and cross_building(self):
@@ -491,6 +496,9 @@ class OpenCVConan(ConanFile):
         if self.settings.os == "Android":
             tc.variables["BUILD_ANDROID_EXAMPLES"] = False
 
+        if self._ccache:
+            tc.variables["CMAKE_C_COMPILER_LAUNCHER"] = self._ccache.replace("\\", "/")
+            tc.variables["CMAKE_CXX_COMPILER_LAUNCHER"] = self._ccache.replace("\\", "/")
         tc.generate()
 
         CMakeDeps(self).generate()
@@ -28,6 +28,7 @@ class ProtobufConan(ConanFile):
         "with_rtti": [True, False],
         "lite": [True, False],
         "debug_suffix": [True, False],
+        "lto": [True, False],
     }
     default_options = {
         "shared": False,
@@ -36,6 +37,7 @@ class ProtobufConan(ConanFile):
         "with_rtti": True,
         "lite": False,
         "debug_suffix": True,
+        "lto": False,
     }
 
     short_paths = True
@@ -72,6 +74,11 @@ class ProtobufConan(ConanFile):
         if self.options.with_zlib:
             self.requires("zlib/1.2.13")
 
+    def package_id(self):
+        # keeps the package IDs built before the option existed
+        if not self.info.options.lto:
+            del self.info.options.lto
+
     def validate(self):
         if self.options.shared and is_msvc_static_runtime(self):
             raise ConanInvalidConfiguration("Protobuf can't be built with shared + MT(d) runtimes")
@@ -109,6 +116,8 @@ class ProtobufConan(ConanFile):
         if is_apple_os(self) and self.options.shared:
             # Workaround against SIP on macOS for consumers while invoking protoc when protobuf lib is shared
             tc.variables["CMAKE_INSTALL_RPATH"] = "@loader_path/../lib"
+        tc.variables["CMAKE_INTERPROCEDURAL_OPTIMIZATION"] = self.options.lto
+        tc.cache_variables["CMAKE_POLICY_DEFAULT_CMP0069"] = "NEW"
         tc.generate()
 
         deps = CMakeDeps(self)
@@ -1,5 +1,5 @@
 from conan import ConanFile
-from conan.errors import ConanInvalidConfiguration
+from conan.errors import ConanException, ConanInvalidConfiguration
 from conan.tools.android import android_abi
 from conan.tools.apple import is_apple_os
 from conan.tools.build import build_jobs, check_min_cppstd, cross_building
@@ -8,12 +8,13 @@ from conan.tools.files import chdir, copy, get, load, replace_in_file, rm, rmdir
 from conan.tools.gnu import PkgConfigDeps
 from conan.tools.microsoft import msvc_runtime_flag, is_msvc, VCVars
 from conan.tools.scm import Version
-import configparser
 import glob
+import hashlib
 import itertools
 import os
 import textwrap
 import shutil
+import yaml
 
 required_conan_version = ">=1.59.0"
 
@@ -128,8 +129,22 @@ class QtConan(ConanFile):
     def _settings_build(self):
         return getattr(self, "settings_build", self.settings)
 
+    def _qtmodules(self):
+        # Generated from qtmodules<version>.conf and components.yml by ../rebuild-module-graph.py. Read with the C
+        #   parser of PyYAML when it is available, ten times faster than the Python one
+        with open(os.path.join(self.recipe_folder, f"qtmodules{self.version}.yml"), encoding="utf-8") as f:
+            return yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
     def export(self):
-        copy(self, f"qtmodules{self.version}.conf", self.recipe_folder, self.export_folder)
+        with open(os.path.join(self.recipe_folder, f"qtmodules{self.version}.conf"), "rb") as f:
+            conf_sha256 = hashlib.sha256(f.read()).hexdigest()
+        with open(os.path.join(self.recipe_folder, "components.yml"), "rb") as f:
+            components_sha256 = hashlib.sha256(f.read()).hexdigest()
+        graph = self._qtmodules()
+        if graph["conf_sha256"] != conf_sha256 or graph["components_sha256"] != components_sha256:
+            raise ConanException(f"qtmodules{self.version}.yml does not match qtmodules{self.version}.conf and components.yml, "
+                                 "regenerate it with rebuild-module-graph.py")
+        copy(self, f"qtmodules{self.version}.yml", self.recipe_folder, self.export_folder)
 
     def export_sources(self):
         export_conandata_patches(self)
@@ -262,21 +277,9 @@ class QtConan(ConanFile):
         if self.options.multiconfiguration:
             del self.settings.build_type
 
-        config = configparser.ConfigParser()
-        config.read(os.path.join(self.recipe_folder, f"qtmodules{self.version}.conf"))
-        submodules_tree = {}
-        assert config.sections(), f"no qtmodules.conf file for version {self.version}"
-        for s in config.sections():
-            section = str(s)
-            assert section.startswith("submodule ")
-            assert section.count('"') == 2
-            modulename = section[section.find('"') + 1: section.rfind('"')]
-            status = str(config.get(section, "status"))
-            if status not in ("obsolete", "ignore"):
-                submodules_tree[modulename] = {"status": status,
-                                "path": str(config.get(section, "path")), "depends": []}
-                if config.has_option(section, "depends"):
-                    submodules_tree[modulename]["depends"] = [str(i) for i in config.get(section, "depends").split()]
+        modules = self._qtmodules()["modules"]
+        submodules_tree = {modulename: module for modulename, module in modules.items()
+                           if module["status"] not in ("obsolete", "ignore")}
 
         for m in submodules_tree:
             assert m in ["qtbase", "qtqa", "qtrepotools"] or m in self._submodules, "module %s is not present in recipe options : (%s)" % (m, ",".join(self._submodules))
@@ -285,15 +288,11 @@ class QtConan(ConanFile):
             if m not in submodules_tree:
                 delattr(self.options, m)
 
-        def _enablemodule(mod):
-            if mod != "qtbase":
-                setattr(self.options, mod, True)
-            for req in submodules_tree[mod]["depends"]:
-                _enablemodule(req)
-
         for module in self._submodules:
             if self.options.get_safe(module):
-                _enablemodule(module)
+                for req in submodules_tree[module]["all_depends"]:
+                    if req != "qtbase":
+                        setattr(self.options, req, True)
 
         for module in self._submodules:
             if module in self.options and not self.options.get_safe(module):
@@ -954,6 +953,34 @@ Examples = bin/datadir/examples""")
         if self.info.settings.os == "Android":
             del self.info.options.android_sdk
 
+    def _component_condition(self, condition):
+        """Whether a condition of the components of qtmodules<version>.yml holds, see components.yml"""
+        if not condition:
+            return True
+        for key, value in condition.items():
+            if key == "options":
+                holds = all(self.options.get_safe(option, False) for option in value)
+            elif key == "not_options":
+                holds = not any(self.options.get_safe(option, False) for option in value)
+            elif key == "values":
+                holds = all(str(self.options.get_safe(option)) == v for option, v in value.items())
+            elif key == "not_values":
+                holds = all(self.options.get_safe(option) is not None and str(self.options.get_safe(option)) != v
+                            for option, v in value.items())
+            elif key == "os":
+                holds = self.settings.os in value
+            elif key == "not_os":
+                holds = self.settings.os not in value
+            elif key == "cross_building":
+                holds = cross_building(self) == value
+            elif key == "any":
+                holds = any(self._component_condition(c) for c in value)
+            else:
+                raise ConanException(f"unknown key {key} in a condition of the components of qtmodules{self.version}.yml")
+            if not holds:
+                return False
+        return True
+
     def package_info(self):
         self.cpp_info.set_property("cmake_file_name", "Qt5")
 
@@ -1022,19 +1049,31 @@ Examples = bin/datadir/examples""")
                 requires.append("Core")
             self.cpp_info.components[componentname].requires = _get_corrected_reqs(requires)
 
-        core_reqs = ["zlib::zlib"]
-        if self.options.with_pcre2:
-            core_reqs.append("pcre2::pcre2")
-        if self.options.with_doubleconversion:
-            core_reqs.append("double-conversion::double-conversion")
-        if self.options.get_safe("with_icu", False):
-            core_reqs.append("icu::icu")
-        if self.options.with_zstd:
-            core_reqs.append("zstd::zstd")
-        if self.options.with_glib:
-            core_reqs.append("glib::glib-2.0")
+        def _create_alias(aliasname, requires):
+            componentname = f"qt{aliasname}"
+            self.cpp_info.components[componentname].set_property("cmake_target_name", f"Qt5::{aliasname}")
+            self.cpp_info.components[componentname].names["cmake_find_package"] = aliasname
+            self.cpp_info.components[componentname].names["cmake_find_package_multi"] = aliasname
+            self.cpp_info.components[componentname].requires = _get_corrected_reqs(requires)
+
+        for name, component in self._qtmodules()["components"].items():
+            if not self._component_condition(component.get("if")):
+                continue
+            requires = []
+            for require in component.get("requires", []):
+                if isinstance(require, str):
+                    requires.append(require)
+                else:
+                    (require, condition), = require.items()
+                    if self._component_condition(condition):
+                        requires.append(require)
+            if "plugin" in component:
+                _create_plugin(name, component["plugin"]["library"], component["plugin"]["type"], requires)
+            elif component.get("alias"):
+                _create_alias(name, requires)
+            else:
+                _create_module(name, requires, has_include_dir=component.get("include_dir", True))
 
-        _create_module("Core", core_reqs)
         if self.settings.os == "Windows":
             module = "WinMain"
             componentname = f"qt{module}"
@@ -1045,383 +1084,60 @@ Examples = bin/datadir/examples""")
             self.cpp_info.components[componentname].includedirs = []
             self.cpp_info.components[componentname].defines = []
 
-        if self.options.with_dbus:
-            _create_module("DBus", ["dbus::dbus"])
         if self.options.gui:
-            gui_reqs = []
-            if self.options.with_dbus:
-                gui_reqs.append("DBus")
-            if self.options.with_freetype:
-                gui_reqs.append("freetype::freetype")
-            if self.options.with_libpng:
-                gui_reqs.append("libpng::libpng")
-            if self.options.get_safe("with_fontconfig", False):
-                gui_reqs.append("fontconfig::fontconfig")
-            if self.settings.os in ["Linux", "FreeBSD"]:
-                if self.options.qtwayland or self.options.get_safe("with_x11", False):
-                    gui_reqs.append("xkbcommon::xkbcommon")
-                if self.options.get_safe("with_x11", False):
-                    gui_reqs.append("xorg::xorg")
-            if self.options.get_safe("opengl", "no") != "no":
-                gui_reqs.append("opengl::opengl")
-            if self.options.get_safe("with_vulkan", False):
-                gui_reqs.append("vulkan-loader::vulkan-loader")
-                if is_apple_os(self):
-                    gui_reqs.append("moltenvk::moltenvk")
-            if self.options.with_harfbuzz:
-                gui_reqs.append("harfbuzz::harfbuzz")
-            if self.options.with_libjpeg == "libjpeg-turbo":
-                gui_reqs.append("libjpeg-turbo::libjpeg-turbo")
-            if self.options.with_libjpeg == "libjpeg":
-                gui_reqs.append("libjpeg::libjpeg")
-            if self.options.with_md4c:
-                gui_reqs.append("md4c::md4c")
-            _create_module("Gui", gui_reqs)
             _add_build_module("qtGui", self._cmake_qt5_private_file("Gui"))
 
-            event_dispatcher_reqs = ["Core", "Gui"]
-            if self.options.with_glib:
-                event_dispatcher_reqs.append("glib::glib")
-            _create_module("EventDispatcherSupport", event_dispatcher_reqs)
-            _create_module("FontDatabaseSupport", ["Core", "Gui"])
             if self.settings.os == "Windows":
                 self.cpp_info.components["qtFontDatabaseSupport"].system_libs.extend(["advapi32", "ole32", "user32", "gdi32"])
             elif is_apple_os(self):
                 self.cpp_info.components["qtFontDatabaseSupport"].frameworks.extend(["CoreFoundation", "CoreGraphics", "CoreText","Foundation"])
                 self.cpp_info.components["qtFontDatabaseSupport"].frameworks.append("AppKit" if self.settings.os == "Macos" else "UIKit")
-            if self.options.get_safe("with_fontconfig"):
-                self.cpp_info.components["qtFontDatabaseSupport"].requires.append("fontconfig::fontconfig")
-            if self.options.get_safe("with_freetype"):
-                self.cpp_info.components["qtFontDatabaseSupport"].requires.append("freetype::freetype")
-
-
-            _create_module("ThemeSupport", ["Core", "Gui"])
-            _create_module("AccessibilitySupport", ["Core", "Gui"])
-            if self.options.get_safe("with_vulkan"):
-                _create_module("VulkanSupport", ["Core", "Gui"])
 
             if self.options.widgets:
-                _create_module("Widgets", ["Gui"])
                 _add_build_module("qtWidgets", self._cmake_qt5_private_file("Widgets"))
-                if self.settings.os not in ["iOS", "watchOS", "tvOS"]:
-                    _create_module("PrintSupport", ["Gui", "Widgets"])
-                    if self.settings.os == "Macos" and not self.options.shared:
-                        self.cpp_info.components["qtPrintSupport"].system_libs.append("cups")
+                if self.settings.os == "Macos" and not self.options.shared:
+                    self.cpp_info.components["qtPrintSupport"].system_libs.append("cups")
 
             if is_apple_os(self):
-                _create_module("ClipboardSupport", ["Core", "Gui"])
                 self.cpp_info.components["qtClipboardSupport"].frameworks = ["ImageIO"]
                 if self.settings.os == "Macos":
                     self.cpp_info.components["qtClipboardSupport"].frameworks.append("AppKit")
-                _create_module("GraphicsSupport", ["Core", "Gui"])
-
-            if self.settings.os in ["Android", "Emscripten"]:
-                _create_module("EglSupport", ["Core", "Gui"])
 
             if self.settings.os == "Windows":
-                windows_reqs = ["Core", "Gui"]
-                windows_reqs.extend(["EventDispatcherSupport", "FontDatabaseSupport", "ThemeSupport", "AccessibilitySupport"])
-                _create_module("WindowsUIAutomationSupport", ["Core", "Gui"])
-                windows_reqs.append("WindowsUIAutomationSupport")
-                if self.options.get_safe("with_vulkan"):
-                    windows_reqs.append("VulkanSupport")
-                _create_plugin("QWindowsIntegrationPlugin", "qwindows", "platforms", windows_reqs)
-                _create_plugin("QWindowsVistaStylePlugin", "qwindowsvistastyle", "styles", windows_reqs)
                 self.cpp_info.components["qtQWindowsIntegrationPlugin"].system_libs = ["advapi32", "dwmapi", "gdi32", "imm32",
                     "ole32", "oleaut32", "shell32", "shlwapi", "user32", "winmm", "winspool", "wtsapi32"]
             elif self.settings.os == "Android":
-                android_reqs = ["Core", "Gui", "EventDispatcherSupport", "AccessibilitySupport", "FontDatabaseSupport", "EglSupport"]
-                if self.options.get_safe("with_vulkan"):
-                    android_reqs.append("VulkanSupport")
-                _create_plugin("QAndroidIntegrationPlugin", "qtforandroid", "platforms", android_reqs)
                 self.cpp_info.components["qtQAndroidIntegrationPlugin"].system_libs = ["android", "jnigraphics"]
             elif self.settings.os == "Macos":
-                cocoa_reqs = ["Core", "Gui", "ClipboardSupport", "ThemeSupport", "FontDatabaseSupport", "GraphicsSupport", "AccessibilitySupport"]
-                if self.options.get_safe("with_vulkan"):
-                    cocoa_reqs.append("VulkanSupport")
-                if self.options.widgets:
-                    cocoa_reqs.append("PrintSupport")
-                _create_plugin("QCocoaIntegrationPlugin", "qcocoa", "platforms", cocoa_reqs)
-                _create_plugin("QMacStylePlugin", "qmacstyle", "styles", cocoa_reqs)
                 self.cpp_info.components["QCocoaIntegrationPlugin"].frameworks = ["AppKit", "Carbon", "CoreServices", "CoreVideo",
                     "IOKit", "IOSurface", "Metal", "QuartzCore"]
             elif self.settings.os in ["iOS", "tvOS"]:
-                _create_plugin("QIOSIntegrationPlugin", "qios", "platforms", ["ClipboardSupport", "FontDatabaseSupport", "GraphicsSupport"])
                 self.cpp_info.components["QIOSIntegrationPlugin"].frameworks = ["AudioToolbox", "Foundation", "Metal",
                     "MobileCoreServices", "OpenGLES", "QuartzCore", "UIKit"]
-            elif self.settings.os == "watchOS":
-                _create_plugin("QMinimalIntegrationPlugin", "qminimal", "platforms", ["EventDispatcherSupport", "FontDatabaseSupport"])
-            elif self.settings.os == "Emscripten":
-                _create_plugin("QWasmIntegrationPlugin", "qwasm", "platforms", ["Core", "Gui", "EventDispatcherSupport", "FontDatabaseSupport", "EglSupport"])
-            elif self.settings.os in ["Linux", "FreeBSD"]:
-                service_support_reqs = ["Core", "Gui"]
-                if self.options.with_dbus:
-                    service_support_reqs.append("DBus")
-                _create_module("ServiceSupport", service_support_reqs)
-                _create_module("EdidSupport")
-                if self.options.get_safe("with_x11", False):
-                    _create_module("XkbCommonSupport", ["Core", "Gui", "xkbcommon::libxkbcommon-x11"])
-                    xcb_qpa_reqs = ["Core", "Gui", "ServiceSupport", "ThemeSupport", "FontDatabaseSupport", "EdidSupport", "XkbCommonSupport", "xorg::xorg"]
-                elif self.options.qtwayland:
-                    _create_module("XkbCommonSupport", ["Core", "Gui", "xkbcommon::libxkbcommon"])
-                if self.options.with_dbus and self.options.with_atspi:
-                    _create_module("LinuxAccessibilitySupport", ["Core", "DBus", "Gui", "AccessibilitySupport", "at-spi2-core::at-spi2-core"])
-                    xcb_qpa_reqs.append("LinuxAccessibilitySupport")
-                if self.options.get_safe("with_vulkan"):
-                    xcb_qpa_reqs.append("VulkanSupport")
-                if self.options.get_safe("with_x11", False):
-                    _create_module("XcbQpa", xcb_qpa_reqs, has_include_dir=False)
-                    _create_plugin("QXcbIntegrationPlugin", "qxcb", "platforms", ["Core", "Gui", "XcbQpa"])
-
-        if self.options.with_sqlite3:
-            _create_plugin("QSQLiteDriverPlugin", "qsqlite", "sqldrivers", ["sqlite3::sqlite3"])
-        if self.options.with_pq:
-            _create_plugin("QPSQLDriverPlugin", "qsqlpsql", "sqldrivers", ["libpq::libpq"])
-        if self.options.get_safe("with_mysql", False):
-            _create_plugin("QMySQLDriverPlugin", "qsqlmysql", "sqldrivers", ["libmysqlclient::libmysqlclient"])
-        if self.options.with_odbc:
-            if self.settings.os != "Windows":
-                _create_plugin("QODBCDriverPlugin", "qsqlodbc", "sqldrivers", ["odbc::odbc"])
-        networkReqs = []
-        if self.options.openssl:
-            networkReqs.append("openssl::openssl")
-        if self.settings.os in ['Linux', 'FreeBSD'] and self.options.with_gssapi:
-            networkReqs.append("krb5::krb5-gssapi")
-        _create_module("Network", networkReqs)
-        _create_module("Sql")
-        _create_module("Test")
-        if self.options.get_safe("opengl", "no") != "no" and self.options.gui:
-            _create_module("OpenGL", ["Gui"])
-        if self.options.widgets and self.options.get_safe("opengl", "no") != "no":
-            _create_module("OpenGLExtensions", ["Gui"])
-        _create_module("Concurrent")
-        _create_module("Xml")
 
         if self.options.qtdeclarative:
-            _create_module("Qml", ["Network"])
             _add_build_module("qtQml", self._cmake_qt5_private_file("Qml"))
-            _create_module("QmlModels", ["Qml"])
-            self.cpp_info.components["qtQmlImportScanner"].set_property("cmake_target_name", "Qt5::QmlImportScanner")
-            self.cpp_info.components["qtQmlImportScanner"].names["cmake_find_package"] = "QmlImportScanner" # this is an alias for Qml and there to integrate with existing consumers
-            self.cpp_info.components["qtQmlImportScanner"].names["cmake_find_package_multi"] = "QmlImportScanner"
-            self.cpp_info.components["qtQmlImportScanner"].requires = _get_corrected_reqs(["Qml"])
-            if self.options.gui:
-                _create_module("Quick", ["Gui", "Qml", "QmlModels"])
-                if self.options.widgets:
-                    _create_module("QuickWidgets", ["Gui", "Qml", "Quick", "Widgets"])
-                _create_module("QuickShapes", ["Gui", "Qml", "Quick"])
-            _create_module("QmlWorkerScript", ["Qml"])
-            _create_module("QuickTest", ["Test"])
 
         if self.options.qttools and self.options.gui and self.options.widgets:
-            self.cpp_info.components["qtLinguistTools"].set_property("cmake_target_name", "Qt5::LinguistTools")
-            self.cpp_info.components["qtLinguistTools"].names["cmake_find_package"] = "LinguistTools"
-            self.cpp_info.components["qtLinguistTools"].names["cmake_find_package_multi"] = "LinguistTools"
-            _create_module("UiPlugin", ["Gui", "Widgets"])
             self.cpp_info.components["qtUiPlugin"].libs = [] # this is a collection of abstract classes, so this is header-only
             self.cpp_info.components["qtUiPlugin"].libdirs = []
-            _create_module("UiTools", ["UiPlugin", "Gui", "Widgets"])
-            if not cross_building(self):
-                _create_module("Designer", ["Gui", "UiPlugin", "Widgets", "Xml"])
-            _create_module("Help", ["Gui", "Sql", "Widgets"])
-
-        if self.options.qtquick3d and self.options.gui:
-            _create_module("Quick3DUtils", ["Gui"])
-            _create_module("Quick3DRender", ["Quick3DUtils", "Quick"])
-            _create_module("Quick3DAssetImport", ["Gui", "Qml", "Quick3DRender", "Quick3DUtils"])
-            _create_module("Quick3DRuntimeRender", ["Quick3DRender", "Quick3DAssetImport", "Quick3DUtils"])
-            _create_module("Quick3D", ["Gui", "Qml", "Quick", "Quick3DRuntimeRender"])
-
-        if self.options.qtquickcontrols2 and self.options.gui:
-            _create_module("QuickControls2", ["Gui", "Quick"])
-            _create_module("QuickTemplates2", ["Gui", "Quick"])
-
-        if self.options.qtsvg and self.options.gui:
-            _create_module("Svg", ["Gui"])
-
-        if self.options.qtwayland and self.options.gui:
-            _create_module("WaylandClient", ["Gui", "wayland::wayland-client"])
-            _create_module("WaylandCompositor", ["Gui", "wayland::wayland-server"])
-
-        if self.options.qtlocation:
-            _create_module("Positioning")
-            _create_module("Location", ["Gui", "Quick"])
-            _create_plugin("QGeoServiceProviderFactoryMapbox", "qtgeoservices_mapbox", "geoservices", [])
-            _create_plugin("QGeoServiceProviderFactoryMapboxGL", "qtgeoservices_mapboxgl", "geoservices", [])
-            _create_plugin("GeoServiceProviderFactoryEsri", "qtgeoservices_esri", "geoservices", [])
-            _create_plugin("QGeoServiceProviderFactoryItemsOverlay", "qtgeoservices_itemsoverlay", "geoservices", [])
-            _create_plugin("QGeoServiceProviderFactoryNokia", "qtgeoservices_nokia", "geoservices", [])
-            _create_plugin("QGeoServiceProviderFactoryOsm", "qtgeoservices_osm", "geoservices", [])
-            _create_plugin("QGeoPositionInfoSourceFactoryGeoclue", "qtposition_geoclue", "position", [])
-            _create_plugin("QGeoPositionInfoSourceFactoryGeoclue2", "qtposition_geoclue2", "position", [])
-            _create_plugin("QGeoPositionInfoSourceFactoryPoll", "qtposition_positionpoll", "position", [])
-            _create_plugin("QGeoPositionInfoSourceFactorySerialNmea", "qtposition_serialnmea", "position", [])
-
-        if self.options.qtwebchannel:
-            _create_module("WebChannel", ["Qml"])
 
         if self.options.qtwebengine:
-            webenginereqs = ["Gui", "Quick", "WebChannel", "Positioning"]
-            if self.settings.os in ["Linux", "FreeBSD"]:
-                webenginereqs.extend(["expat::expat", "opus::libopus", "xorg-proto::xorg-proto", "libxshmfence::libxshmfence", \
-                                      "nss::nss", "libdrm::libdrm", "egl::egl"])
-            _create_module("WebEngineCore", webenginereqs)
             if self.settings.os != "Windows":
                 self.cpp_info.components["WebEngineCore"].system_libs.append("resolv")
-            _create_module("WebEngine", ["WebEngineCore"])
-            _create_module("WebEngineWidgets", ["WebEngineCore", "Quick", "PrintSupport", "Widgets", "Gui", "Network"])
-
-        if self.options.qtserialport:
-            _create_module("SerialPort")
-
-        if self.options.qtserialbus:
-            _create_module("SerialBus", ["SerialPort"] if self.options.get_safe("qtserialport") else [])
-            _create_plugin("PassThruCanBusPlugin", "qtpassthrucanbus", "canbus", [])
-            _create_plugin("PeakCanBusPlugin", "qtpeakcanbus", "canbus", [])
-            _create_plugin("SocketCanBusPlugin", "qtsocketcanbus", "canbus", [])
-            _create_plugin("TinyCanBusPlugin", "qttinycanbus", "canbus", [])
-            _create_plugin("VirtualCanBusPlugin", "qtvirtualcanbus", "canbus", [])
-
-        if self.options.qtsensors:
-            _create_module("Sensors")
-            _create_plugin("genericSensorPlugin", "qtsensors_generic", "sensors", [])
-            _create_plugin("IIOSensorProxySensorPlugin", "qtsensors_iio-sensor-proxy", "sensors", [])
-            if self.settings.os == "Linux":
-                _create_plugin("LinuxSensorPlugin", "qtsensors_linuxsys", "sensors", [])
-            _create_plugin("QtSensorGesturePlugin", "qtsensorgestures_plugin", "sensorgestures", [])
-            _create_plugin("QShakeSensorGesturePlugin", "qtsensorgestures_shakeplugin", "sensorgestures", [])
-
-        if self.options.qtscxml:
-            _create_module("Scxml", ["Qml"])
-
-        if self.options.qtpurchasing:
-            _create_module("Purchasing")
-
-        if self.options.qtcharts:
-            _create_module("Charts", ["Gui", "Widgets"])
-
-        if self.options.qtgamepad:
-            _create_module("Gamepad", ["Gui"])
-            if self.settings.os == "Linux":
-                _create_plugin("QEvdevGamepadBackendPlugin", "evdevgamepad", "gamepads", [])
-            if self.settings.os == "Macos":
-                _create_plugin("QDarwinGamepadBackendPlugin", "darwingamepad", "gamepads", [])
-            if self.settings.os =="Windows":
-                _create_plugin("QXInputGamepadBackendPlugin", "xinputgamepad", "gamepads", [])
-
-        if self.options.qt3d:
-            _create_module("3DCore", ["Gui", "Network"])
-
-            _create_module("3DRender", ["3DCore"])
-            _create_plugin("DefaultGeometryLoaderPlugin", "defaultgeometryloader", "geometryloaders", [])
-            _create_plugin("GLTFGeometryLoaderPlugin", "gltfgeometryloader", "geometryloaders", [])
-            _create_plugin("GLTFSceneExportPlugin", "gltfsceneexport", "sceneparsers", [])
-            _create_plugin("GLTFSceneImportPlugin", "gltfsceneimport", "sceneparsers", [])
-            _create_plugin("OpenGLRendererPlugin", "openglrenderer", "renderers", [])
-            _create_plugin("Scene2DPlugin", "scene2d", "renderplugins", [])
-
-            _create_module("3DAnimation", ["3DRender", "3DCore", "Gui"])
-            _create_module("3DInput", ["3DCore", "Gamepad", "Gui"])
-            _create_module("3DLogic", ["3DCore", "Gui"])
-            _create_module("3DExtras", ["3DRender", "3DInput", "3DLogic", "3DCore", "Gui"])
-            _create_module("3DQuick", ["3DCore", "Quick", "Gui", "Qml"])
-            _create_module("3DQuickAnimation", ["3DAnimation", "3DRender", "3DQuick", "3DCore", "Gui", "Qml"])
-            _create_module("3DQuickExtras", ["3DExtras", "3DInput", "3DQuick", "3DRender", "3DLogic", "3DCore", "Gui", "Qml"])
-            _create_module("3DQuickInput", ["3DInput", "3DQuick", "3DCore", "Gui", "Qml"])
-            _create_module("3DQuickRender", ["3DRender", "3DQuick", "3DCore", "Gui", "Qml"])
-            _create_module("3DQuickScene2D", ["3DRender", "3DQuick", "3DCore", "Gui", "Qml"])
-
-        if self.options.qtmultimedia:
-            multimedia_reqs = ["Network", "Gui"]
-            if self.options.get_safe("with_libalsa", False):
-                multimedia_reqs.append("libalsa::libalsa")
-            if self.options.with_openal:
-                multimedia_reqs.append("openal::openal")
-            if self.options.get_safe("with_pulseaudio", False):
-                multimedia_reqs.append("pulseaudio::pulse")
-            _create_module("Multimedia", multimedia_reqs)
-            _create_module("MultimediaWidgets", ["Multimedia", "Widgets", "Gui"])
-            if self.options.qtdeclarative and self.options.gui:
-                _create_module("MultimediaQuick", ["Multimedia", "Quick"])
-            _create_plugin("QM3uPlaylistPlugin", "qtmultimedia_m3u", "playlistformats", [])
-            if self.options.with_gstreamer:
-                _create_module("MultimediaGstTools", ["Multimedia", "MultimediaWidgets", "Gui", "gst-plugins-base::gst-plugins-base"])
-                _create_plugin("QGstreamerAudioDecoderServicePlugin", "gstaudiodecoder", "mediaservice", [])
-                _create_plugin("QGstreamerCaptureServicePlugin", "gstmediacapture", "mediaservice", [])
-                _create_plugin("QGstreamerPlayerServicePlugin", "gstmediaplayer", "mediaservice", [])
-            if self.settings.os == "Linux":
-                _create_plugin("CameraBinServicePlugin", "gstcamerabin", "mediaservice", [])
-                _create_plugin("QAlsaPlugin", "qtaudio_alsa", "audio", [])
-            if self.settings.os == "Windows":
-                _create_plugin("AudioCaptureServicePlugin", "qtmedia_audioengine", "mediaservice", [])
-                _create_plugin("DSServicePlugin", "dsengine", "mediaservice", [])
-                _create_plugin("QWindowsAudioPlugin", "qtaudio_windows", "audio", [])
-            if self.settings.os == "Macos":
-                _create_plugin("AudioCaptureServicePlugin", "qtmedia_audioengine", "mediaservice", [])
-                _create_plugin("AVFMediaPlayerServicePlugin", "qavfmediaplayer", "mediaservice", [])
-                _create_plugin("AVFServicePlugin", "qavfcamera", "mediaservice", [])
-                _create_plugin("CoreAudioPlugin", "qtaudio_coreaudio", "audio", [])
-
-        if self.options.qtwebsockets:
-            _create_module("WebSockets", ["Network"])
-
-        if self.options.qtconnectivity:
-            _create_module("Bluetooth", ["Network"])
-            _create_module("Nfc", [])
-
-        if self.options.qtdatavis3d:
-            _create_module("DataVisualization", ["Gui"])
-
-        if self.options.qtnetworkauth:
-            _create_module("NetworkAuth", ["Network"])
 
         if self.settings.os != "Windows":
             self.cpp_info.components["qtCore"].cxxflags.append("-fPIC")
 
-        if self.options.get_safe("qtx11extras"):
-            _create_module("X11Extras")
-
-        if self.options.qtremoteobjects:
-            _create_module("RemoteObjects")
-
-        if self.options.get_safe("qtwinextras"):
-            _create_module("WinExtras")
-
-        if self.options.get_safe("qtmacextras"):
-            _create_module("MacExtras")
-
-        if self.options.qtxmlpatterns:
-            _create_module("XmlPatterns", ["Network"])
-
         if self.options.get_safe("qtactiveqt"):
-            _create_module("AxBase", ["Gui", "Widgets"])
             self.cpp_info.components["qtAxBase"].includedirs = ["include", os.path.join("include", "ActiveQt")]
             self.cpp_info.components["qtAxBase"].system_libs.extend(["ole32", "oleaut32", "user32", "gdi32", "advapi32"])
             if self.settings.compiler == "gcc":
                 self.cpp_info.components["qtAxBase"].system_libs.append("uuid")
-            _create_module("AxContainer", ["Core", "Gui", "Widgets", "AxBase"])
             self.cpp_info.components["qtAxContainer"].includedirs = [os.path.join("include", "ActiveQt")]
-            _create_module("AxServer", ["Core", "Gui", "Widgets", "AxBase"])
             self.cpp_info.components["qtAxServer"].includedirs = [os.path.join("include", "ActiveQt")]
             self.cpp_info.components["qtAxServer"].system_libs.append("shell32")
 
-        if self.options.qtscript:
-            _create_module("Script")
-            if self.options.widgets:
-                _create_module("ScriptTools", ["Gui", "Widgets", "Script"])
-
-        if self.options.qtandroidextras:
-            _create_module("AndroidExtras")
-
-        if self.options.qtwebview:
-            _create_module("WebView", ["Gui", "Quick"])
-
-        if self.options.qtvirtualkeyboard:
-            _create_module("VirtualKeyboard", ["Qml", "Quick", "Gui"])
-
-        if self.options.qtspeech:
-            _create_module("TextToSpeech")
-
         if not self.options.shared:
             if self.settings.os == "Windows":
                 self.cpp_info.components["qtCore"].system_libs.append("version")  # qtcore requires "GetFileVersionInfoW" and "VerQueryValueW" which are in "Version.lib" library
@@ -1,9 +1,10 @@
 from contextlib import contextmanager
 
-import configparser
 import glob
+import hashlib
 import os
 import textwrap
+import yaml
 
 from conan import ConanFile
 from conan.tools.apple import is_apple_os
@@ -14,7 +15,7 @@ from conan.tools.files import copy, get, replace_in_file, apply_conandata_patche
 from conan.tools.gnu import PkgConfigDeps
 from conan.tools.microsoft import msvc_runtime_flag, is_msvc
 from conan.tools.scm import Version
-from conan.errors import ConanInvalidConfiguration
+from conan.errors import ConanException, ConanInvalidConfiguration
 from conans import RunEnvironment, tools
 from conans.model import Generator
 
@@ -162,21 +163,9 @@ class QtConan(ConanFile):
     def _get_module_tree(self):
         if self._submodules_tree:
             return self._submodules_tree
-        config = configparser.ConfigParser()
-        config.read(os.path.join(self.recipe_folder, f"qtmodules{self.version}.conf"))
-        self._submodules_tree = {}
-        assert config.sections(), f"no qtmodules.conf file for version {self.version}"
-        for s in config.sections():
-            section = str(s)
-            assert section.startswith("submodule ")
-            assert section.count('"') == 2
-            modulename = section[section.find('"') + 1: section.rfind('"')]
-            status = str(config.get(section, "status"))
-            if status not in ["obsolete", "ignore", "additionalLibrary"]:
-                self._submodules_tree[modulename] = {"status": status,
-                                "path": str(config.get(section, "path")), "depends": []}
-                if config.has_option(section, "depends"):
-                    self._submodules_tree[modulename]["depends"] = [str(i) for i in config.get(section, "depends").split()]
+        modules = self._qtmodules()["modules"]
+        self._submodules_tree = {modulename: module for modulename, module in modules.items()
+                                 if module["status"] not in ["obsolete", "ignore", "additionalLibrary"]}
 
         for m in self._submodules_tree:
             assert m in ["qtbase", "qtqa", "qtrepotools"] or m in self._submodules, f"module {m} not in self._submodules"
@@ -186,8 +175,22 @@ class QtConan(ConanFile):
     def export_sources(self):
         export_conandata_patches(self)
 
+    def _qtmodules(self):
+        # Generated from qtmodules<version>.conf and components.yml by ../rebuild-module-graph.py. Read with the C
+        #   parser of PyYAML when it is available, ten times faster than the Python one
+        with open(os.path.join(self.recipe_folder, f"qtmodules{self.version}.yml"), encoding="utf-8") as f:
+            return yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
     def export(self):
-        copy(self, f"qtmodules{self.version}.conf", self.recipe_folder, self.export_folder)
+        with open(os.path.join(self.recipe_folder, f"qtmodules{self.version}.conf"), "rb") as f:
+            conf_sha256 = hashlib.sha256(f.read()).hexdigest()
+        with open(os.path.join(self.recipe_folder, "components.yml"), "rb") as f:
+            components_sha256 = hashlib.sha256(f.read()).hexdigest()
+        graph = self._qtmodules()
+        if graph["conf_sha256"] != conf_sha256 or graph["components_sha256"] != components_sha256:
+            raise ConanException(f"qtmodules{self.version}.yml does not match qtmodules{self.version}.conf and components.yml, "
+                                 "regenerate it with rebuild-module-graph.py")
+        copy(self, f"qtmodules{self.version}.yml", self.recipe_folder, self.export_folder)
 
     def config_options(self):
         if self.settings.os not in ["Linux", "FreeBSD"]:
@@ -242,15 +245,11 @@ class QtConan(ConanFile):
         if self.options.multiconfiguration:
             del self.settings.build_type
 
-        def _enablemodule(mod):
-            if mod != "qtbase":
-                setattr(self.options, mod, True)
-            for req in self._get_module_tree[mod]["depends"]:
-                _enablemodule(req)
-
         for module in self._get_module_tree:
             if self.options.get_safe(module):
-                _enablemodule(module)
+                for req in self._get_module_tree[module]["all_depends"]:
+                    if req != "qtbase":
+                        setattr(self.options, req, True)
 
     def validate(self):
         if os.getenv('NOT_ON_C3I', '0') == '0':
@@ -458,6 +457,11 @@ class QtConan(ConanFile):
         if cross_building(self):
             self.tool_requires(f"qt/{self.version}")
 
+    @property
+    def _ccache(self):
+        ccache = self.dependencies.build.get("ccache")
+        return ccache.conf_info.get("user.ccache:launcher", check_type=str) if ccache else None
+
     def generate(self):
         ms = VirtualBuildEnv(self)
         ms.generate()
@@ -629,6 +633,9 @@ class QtConan(ConanFile):
 
         tc.variables[cpp_std_map.get(current_cpp_std, "FEATURE_cxx17")] = "ON"
 
+        if self._ccache:
+            tc.variables["CMAKE_C_COMPILER_LAUNCHER"] = self._ccache.replace("\\", "/")
+            tc.variables["CMAKE_CXX_COMPILER_LAUNCHER"] = self._ccache.replace("\\", "/")
         tc.generate()
 
     def source(self):
@@ -947,10 +954,33 @@ class QtConan(ConanFile):
             else:
                 self.info.settings.compiler.runtime_type = "Release/Debug"
 
-    @property
-    def _has_positioning(self):
-        return (self.options.get_safe("qtlocation") and Version(self.version) < "6.2.2") or \
-            (self.options.get_safe("qtpositioning") and Version(self.version) >= "6.2.2")
+    def _component_condition(self, condition):
+        """Whether a condition of the components of qtmodules<version>.yml holds, see components.yml"""
+        if not condition:
+            return True
+        for key, value in condition.items():
+            if key == "options":
+                holds = all(self.options.get_safe(option, False) for option in value)
+            elif key == "not_options":
+                holds = not any(self.options.get_safe(option, False) for option in value)
+            elif key == "values":
+                holds = all(str(self.options.get_safe(option)) == v for option, v in value.items())
+            elif key == "not_values":
+                holds = all(self.options.get_safe(option) is not None and str(self.options.get_safe(option)) != v
+                            for option, v in value.items())
+            elif key == "os":
+                holds = self.settings.os in value
+            elif key == "not_os":
+                holds = self.settings.os not in value
+            elif key == "cross_building":
+                holds = cross_building(self) == value
+            elif key == "any":
+                holds = any(self._component_condition(c) for c in value)
+            else:
+                raise ConanException(f"unknown key {key} in a condition of the components of qtmodules{self.version}.yml")
+            if not holds:
+                return False
+        return True
 
     def package_info(self):
         self.cpp_info.set_property("cmake_file_name", "Qt6")
@@ -1022,19 +1052,31 @@ class QtConan(ConanFile):
                 requires.append("Core")
             self.cpp_info.components[componentname].requires = _get_corrected_reqs(requires)
 
-        core_reqs = ["zlib::zlib"]
-        if self.options.with_pcre2:
-            core_reqs.append("pcre2::pcre2")
-        if self.options.with_doubleconversion:
-            core_reqs.append("double-conversion::double-conversion")
-        if self.options.get_safe("with_icu", False):
-            core_reqs.append("icu::icu")
-        if self.options.with_zstd:
-            core_reqs.append("zstd::zstd")
-        if self.options.with_glib:
-            core_reqs.append("glib::glib")
+        def _create_alias(aliasname, requires):
+            componentname = f"qt{aliasname}"
+            self.cpp_info.components[componentname].set_property("cmake_target_name", f"Qt6::{aliasname}")
+            self.cpp_info.components[componentname].names["cmake_find_package"] = aliasname
+            self.cpp_info.components[componentname].names["cmake_find_package_multi"] = aliasname
+            self.cpp_info.components[componentname].requires = _get_corrected_reqs(requires)
+
+        for name, component in self._qtmodules()["components"].items():
+            if not self._component_condition(component.get("if")):
+                continue
+            requires = []
+            for require in component.get("requires", []):
+                if isinstance(require, str):
+                    requires.append(require)
+                else:
+                    (require, condition), = require.items()
+                    if self._component_condition(condition):
+                        requires.append(require)
+            if "plugin" in component:
+                _create_plugin(name, component["plugin"]["library"], component["plugin"]["type"], requires)
+            elif component.get("alias"):
+                _create_alias(name, requires)
+            else:
+                _create_module(name, requires, has_include_dir=component.get("include_dir", True))
 
-        _create_module("Core", core_reqs)
         if self.settings.os == "Windows":
             if Version(self.version) >= "6.3.0":
                 self.cpp_info.components["qtCore"].system_libs.append("authz")
@@ -1052,37 +1094,7 @@ class QtConan(ConanFile):
         self.cpp_info.components["qtPlatform"].includedirs = [os.path.join("res", "archdatadir", "mkspecs", self._xplatform())]
         if Version(self.version) < "6.1.0":
             self.cpp_info.components["qtCore"].libs.append(f"Qt6Core_qobject{libsuffix}")
-        if self.options.with_dbus:
-            _create_module("DBus", ["dbus::dbus"])
         if self.options.gui:
-            gui_reqs = []
-            if self.options.with_dbus:
-                gui_reqs.append("DBus")
-            if self.options.with_freetype:
-                gui_reqs.append("freetype::freetype")
-            if self.options.with_libpng:
-                gui_reqs.append("libpng::libpng")
-            if self.options.get_safe("with_fontconfig", False):
-                gui_reqs.append("fontconfig::fontconfig")
-            if self.settings.os in ["Linux", "FreeBSD"]:
-                if self.options.qtwayland or self.options.get_safe("with_x11", False):
-                    gui_reqs.append("xkbcommon::xkbcommon")
-                if self.options.get_safe("with_x11", False):
-                    gui_reqs.append("xorg::xorg")
-            if self.settings.os != "Windows" and self.options.get_safe("opengl", "no") != "no":
-                gui_reqs.append("opengl::opengl")
-            if self.options.get_safe("with_vulkan", False):
-                gui_reqs.append("vulkan-loader::vulkan-loader")
-                if is_apple_os(self):
-                    gui_reqs.append("moltenvk::moltenvk")
-            if self.options.with_harfbuzz:
-                gui_reqs.append("harfbuzz::harfbuzz")
-            if self.options.with_glib:
-                gui_reqs.append("glib::glib")
-            if self.options.with_md4c:
-                gui_reqs.append("md4c::md4c")
-            _create_module("Gui", gui_reqs)
-
             _add_build_module("qtGui", self._cmake_qt6_private_file("Gui"))
 
             if self.settings.os == "Windows":
@@ -1090,266 +1102,30 @@ class QtConan(ConanFile):
                     "dxgi", "dxguid", "d2d1", "dwrite"]
                 if self.settings.compiler == "gcc":
                     self.cpp_info.components["qtGui"].system_libs.append("uuid")
-                _create_plugin("QWindowsIntegrationPlugin", "qwindows", "platforms", ["Core", "Gui"])
-                _create_plugin("QWindowsVistaStylePlugin", "qwindowsvistastyle", "styles", ["Core", "Gui"])
                 self.cpp_info.components["qtQWindowsIntegrationPlugin"].system_libs = ["advapi32", "dwmapi", "gdi32", "imm32",
                     "ole32", "oleaut32", "shell32", "shlwapi", "user32", "winmm", "winspool", "wtsapi32"]
             elif self.settings.os == "Android":
-                _create_plugin("QAndroidIntegrationPlugin", "qtforandroid", "platforms", ["Core", "Gui"])
                 self.cpp_info.components["qtQAndroidIntegrationPlugin"].system_libs = ["android", "jnigraphics"]
             elif self.settings.os == "Macos":
-                _create_plugin("QCocoaIntegrationPlugin", "qcocoa", "platforms", ["Core", "Gui"])
                 self.cpp_info.components["QCocoaIntegrationPlugin"].frameworks = ["AppKit", "Carbon", "CoreServices", "CoreVideo",
                     "IOKit", "IOSurface", "Metal", "QuartzCore"]
             elif self.settings.os in ["iOS", "tvOS"]:
-                _create_plugin("QIOSIntegrationPlugin", "qios", "platforms", [])
                 self.cpp_info.components["QIOSIntegrationPlugin"].frameworks = ["AudioToolbox", "Foundation", "Metal",
                     "QuartzCore", "UIKit"]
-            elif self.settings.os == "watchOS":
-                _create_plugin("QMinimalIntegrationPlugin", "qminimal", "platforms", [])
-            elif self.settings.os == "Emscripten":
-                _create_plugin("QWasmIntegrationPlugin", "qwasm", "platforms", ["Core", "Gui"])
-            elif self.options.get_safe("with_x11", False):
-                _create_module("XcbQpaPrivate", ["xkbcommon::libxkbcommon-x11", "xorg::xorg"], has_include_dir=False)
-                _create_plugin("QXcbIntegrationPlugin", "qxcb", "platforms", ["Core", "Gui", "XcbQpaPrivate"])
-
-            _create_plugin("QGifPlugin", "qgif", "imageformats", ["Gui"])
-            _create_plugin("QIcoPlugin", "qico", "imageformats", ["Gui"])
-            if self.options.get_safe("with_libjpeg"):
-                jpeg_reqs = ["Gui"]
-                if self.options.with_libjpeg == "libjpeg-turbo":
-                    jpeg_reqs.append("libjpeg-turbo::libjpeg-turbo")
-                if self.options.with_libjpeg == "libjpeg":
-                    jpeg_reqs.append("libjpeg::libjpeg")
-                _create_plugin("QJpegPlugin", "qjpeg", "imageformats", jpeg_reqs)
-
-        if self.options.with_sqlite3:
-            _create_plugin("QSQLiteDriverPlugin", "qsqlite", "sqldrivers", ["sqlite3::sqlite3"])
-        if self.options.with_pq:
-            _create_plugin("QPSQLDriverPlugin", "qsqlpsql", "sqldrivers", ["libpq::libpq"])
-        if self.options.with_odbc:
-            if self.settings.os != "Windows":
-                _create_plugin("QODBCDriverPlugin", "qsqlodbc", "sqldrivers", ["odbc::odbc"])
-        networkReqs = []
-        if self.options.openssl:
-            networkReqs.append("openssl::openssl")
-        if self.options.with_brotli:
-            networkReqs.append("brotli::brotli")
-        if self.settings.os in ['Linux', 'FreeBSD'] and self.options.with_gssapi:
-            networkReqs.append("krb5::krb5-gssapi")
-        _create_module("Network", networkReqs)
-        _create_module("Sql", [])
-        _create_module("Test", [])
+
         if self.options.widgets:
-            _create_module("Widgets", ["Gui"])
             _add_build_module("qtWidgets", self._cmake_qt6_private_file("Widgets"))
-        if self.options.gui and self.options.widgets:
-            _create_module("PrintSupport", ["Gui", "Widgets"])
-        if self.options.get_safe("opengl", "no") != "no" and self.options.gui:
-            _create_module("OpenGL", ["Gui"])
-        if self.options.widgets and self.options.get_safe("opengl", "no") != "no":
-            _create_module("OpenGLWidgets", ["OpenGL", "Widgets"])
-        _create_module("Concurrent", [])
-        _create_module("Xml", [])
-
-        if self.options.qt5compat:
-            _create_module("Core5Compat", [])
-
-        # since https://github.com/qt/qtdeclarative/commit/4fb84137f1c0a49d64b8bef66fef8a4384cc2a68
-        qt_quick_enabled = self.options.gui and (Version(self.version) < "6.2.0" or self.options.qtshadertools)
 
         if self.options.qtdeclarative:
-            _create_module("Qml", ["Network"])
             _add_build_module("qtQml", self._cmake_qt6_private_file("Qml"))
-            _create_module("QmlModels", ["Qml"])
-            self.cpp_info.components["qtQmlImportScanner"].set_property("cmake_target_name", "Qt6::QmlImportScanner")
-            self.cpp_info.components["qtQmlImportScanner"].names["cmake_find_package"] = "QmlImportScanner" # this is an alias for Qml and there to integrate with existing consumers
-            self.cpp_info.components["qtQmlImportScanner"].names["cmake_find_package_multi"] = "QmlImportScanner"
-            self.cpp_info.components["qtQmlImportScanner"].requires = _get_corrected_reqs(["Qml"])
-            if qt_quick_enabled:
-                _create_module("Quick", ["Gui", "Qml", "QmlModels"])
-                if self.options.widgets:
-                    _create_module("QuickWidgets", ["Gui", "Qml", "Quick", "Widgets"])
-                _create_module("QuickShapes", ["Gui", "Qml", "Quick"])
-            _create_module("QmlWorkerScript", ["Qml"])
 
         if self.options.qttools and self.options.gui and self.options.widgets:
-            self.cpp_info.components["qtLinguistTools"].set_property("cmake_target_name", "Qt6::LinguistTools")
-            self.cpp_info.components["qtLinguistTools"].names["cmake_find_package"] = "LinguistTools"
-            self.cpp_info.components["qtLinguistTools"].names["cmake_find_package_multi"] = "LinguistTools"
-            _create_module("UiPlugin", ["Gui", "Widgets"])
             self.cpp_info.components["qtUiPlugin"].libs = [] # this is a collection of abstract classes, so this is header-only
             self.cpp_info.components["qtUiPlugin"].libdirs = []
-            _create_module("UiTools", ["UiPlugin", "Gui", "Widgets"])
-            _create_module("Designer", ["Gui", "UiPlugin", "Widgets", "Xml"])
-            _create_module("Help", ["Gui", "Sql", "Widgets"])
-
-        if self.options.qtshadertools and self.options.gui:
-            _create_module("ShaderTools", ["Gui"])
-
-        if self.options.qtquick3d and qt_quick_enabled:
-            _create_module("Quick3DUtils", ["Gui"])
-            _create_module("Quick3DAssetImport", ["Gui", "Qml", "Quick3DUtils"])
-            _create_module("Quick3DRuntimeRender", ["Gui", "Quick", "Quick3DAssetImport", "Quick3DUtils", "ShaderTools"])
-            _create_module("Quick3D", ["Gui", "Qml", "Quick", "Quick3DRuntimeRender"])
-
-        if (self.options.get_safe("qtquickcontrols2") or \
-            (self.options.qtdeclarative and Version(self.version) >= "6.2.0")) and qt_quick_enabled:
-            _create_module("QuickControls2", ["Gui", "Quick"])
-            _create_module("QuickTemplates2", ["Gui", "Quick"])
-
-        if self.options.qtsvg and self.options.gui:
-            _create_module("Svg", ["Gui"])
-            if self.options.widgets:
-                _create_module("SvgWidgets", ["Gui", "Svg", "Widgets"])
-
-        if self.options.qtwayland and self.options.gui:
-            _create_module("WaylandClient", ["Gui", "wayland::wayland-client"])
-            _create_module("WaylandCompositor", ["Gui", "wayland::wayland-server"])
 
         if self.options.get_safe("qtactiveqt") and self.settings.os == "Windows":
-            _create_module("AxBase", ["Gui", "Widgets"])
-            _create_module("AxServer", ["AxBase"])
             self.cpp_info.components["qtAxServer"].system_libs.append("shell32")
             self.cpp_info.components["qtAxServer"].defines.append("QAXSERVER")
-            _create_module("AxContainer", ["AxBase"])
-        if self.options.get_safe("qtcharts"):
-            _create_module("Charts", ["Gui", "Widgets"])
-        if self.options.get_safe("qtdatavis3d") and qt_quick_enabled:
-            _create_module("DataVisualization", ["Gui", "OpenGL", "Qml", "Quick"])
-        if self.options.get_safe("qtlottie"):
-            _create_module("Bodymovin", ["Gui"])
-        if self.options.get_safe("qtscxml"):
-            _create_module("StateMachine", [])
-            _create_module("StateMachineQml", ["StateMachine", "Qml"])
-            _create_module("Scxml", [])
-            _create_plugin("QScxmlEcmaScriptDataModelPlugin", "qscxmlecmascriptdatamodel", "scxmldatamodel", ["Scxml", "Qml"])
-            _create_module("ScxmlQml", ["Scxml", "Qml"])
-        if self.options.get_safe("qtvirtualkeyboard") and qt_quick_enabled:
-            _create_module("VirtualKeyboard", ["Gui", "Qml", "Quick"])
-            _create_plugin("QVirtualKeyboardPlugin", "qtvirtualkeyboardplugin", "platforminputcontexts", ["Gui", "Qml", "VirtualKeyboard"])
-            _create_plugin("QtVirtualKeyboardHangulPlugin", "qtvirtualkeyboard_hangul", "virtualkeyboard", ["Gui", "Qml", "VirtualKeyboard"])
-            _create_plugin("QtVirtualKeyboardMyScriptPlugin", "qtvirtualkeyboard_myscript", "virtualkeyboard", ["Gui", "Qml", "VirtualKeyboard"])
-            _create_plugin("QtVirtualKeyboardThaiPlugin", "qtvirtualkeyboard_thai", "virtualkeyboard", ["Gui", "Qml", "VirtualKeyboard"])
-        if self.options.get_safe("qt3d"):
-            _create_module("3DCore", ["Gui", "Network"])
-            _create_module("3DRender", ["3DCore", "OpenGL"])
-            _create_module("3DAnimation", ["3DCore", "3DRender", "Gui"])
-            _create_module("3DInput", ["3DCore", "Gui"])
-            _create_module("3DLogic", ["3DCore", "Gui"])
-            _create_module("3DExtras", ["Gui", "3DCore", "3DInput", "3DLogic", "3DRender"])
-            _create_plugin("DefaultGeometryLoaderPlugin", "defaultgeometryloader", "geometryloaders", ["3DCore", "3DRender", "Gui"])
-            _create_plugin("fbxGeometryLoaderPlugin", "fbxgeometryloader", "geometryloaders", ["3DCore", "3DRender", "Gui"])
-            if qt_quick_enabled:
-                _create_module("3DQuick", ["3DCore", "Gui", "Qml", "Quick"])
-                _create_module("3DQuickAnimation", ["3DAnimation", "3DCore", "3DQuick", "3DRender", "Gui", "Qml"])
-                _create_module("3DQuickExtras", ["3DCore", "3DExtras", "3DInput", "3DQuick", "3DRender", "Gui", "Qml"])
-                _create_module("3DQuickInput", ["3DCore", "3DInput", "3DQuick", "Gui", "Qml"])
-                _create_module("3DQuickRender", ["3DCore", "3DQuick", "3DRender", "Gui", "Qml"])
-                _create_module("3DQuickScene2D", ["3DCore", "3DQuick", "3DRender", "Gui", "Qml"])
-        if self.options.get_safe("qtimageformats"):
-            _create_plugin("ICNSPlugin", "qicns", "imageformats", ["Gui"])
-            _create_plugin("QJp2Plugin", "qjp2", "imageformats", ["Gui"])
-            _create_plugin("QMacHeifPlugin", "qmacheif", "imageformats", ["Gui"])
-            _create_plugin("QMacJp2Plugin", "qmacjp2", "imageformats", ["Gui"])
-            _create_plugin("QMngPlugin", "qmng", "imageformats", ["Gui"])
-            _create_plugin("QTgaPlugin", "qtga", "imageformats", ["Gui"])
-            _create_plugin("QTiffPlugin", "qtiff", "imageformats", ["Gui"])
-            _create_plugin("QWbmpPlugin", "qwbmp", "imageformats", ["Gui"])
-            _create_plugin("QWebpPlugin", "qwebp", "imageformats", ["Gui"])
-        if self.options.get_safe("qtnetworkauth"):
-            _create_module("NetworkAuth", ["Network"])
-        if self.options.get_safe("qtcoap"):
-            _create_module("Coap", ["Network"])
-        if self.options.get_safe("qtmqtt"):
-            _create_module("Mqtt", ["Network"])
-        if self.options.get_safe("qtopcua"):
-            _create_module("OpcUa", ["Network"])
-            _create_plugin("QOpen62541Plugin", "open62541_backend", "opcua", ["Network", "OpcUa"])
-            _create_plugin("QUACppPlugin", "uacpp_backend", "opcua", ["Network", "OpcUa"])
-
-        if self.options.get_safe("qtmultimedia"):
-            multimedia_reqs = ["Network", "Gui"]
-            if self.options.get_safe("with_libalsa", False):
-                multimedia_reqs.append("libalsa::libalsa")
-            if self.options.with_openal:
-                multimedia_reqs.append("openal::openal")
-            if self.options.get_safe("with_pulseaudio", False):
-                multimedia_reqs.append("pulseaudio::pulse")
-            _create_module("Multimedia", multimedia_reqs)
-            _create_module("MultimediaWidgets", ["Multimedia", "Widgets", "Gui"])
-            if self.options.qtdeclarative and qt_quick_enabled:
-                _create_module("MultimediaQuick", ["Multimedia", "Quick"])
-            _create_plugin("QM3uPlaylistPlugin", "qtmultimedia_m3u", "playlistformats", [])
-            if self.options.with_gstreamer:
-                _create_module("MultimediaGstTools", ["Multimedia", "MultimediaWidgets", "Gui", "gst-plugins-base::gst-plugins-base"])
-                _create_plugin("QGstreamerAudioDecoderServicePlugin", "gstaudiodecoder", "mediaservice", [])
-                _create_plugin("QGstreamerCaptureServicePlugin", "gstmediacapture", "mediaservice", [])
-                _create_plugin("QGstreamerPlayerServicePlugin", "gstmediaplayer", "mediaservice", [])
-            if self.settings.os == "Linux":
-                _create_plugin("CameraBinServicePlugin", "gstcamerabin", "mediaservice", [])
-                _create_plugin("QAlsaPlugin", "qtaudio_alsa", "audio", [])
-            if self.settings.os == "Windows":
-                _create_plugin("AudioCaptureServicePlugin", "qtmedia_audioengine", "mediaservice", [])
-                _create_plugin("DSServicePlugin", "dsengine", "mediaservice", [])
-                _create_plugin("QWindowsAudioPlugin", "qtaudio_windows", "audio", [])
-            if self.settings.os == "Macos":
-                _create_plugin("AudioCaptureServicePlugin", "qtmedia_audioengine", "mediaservice", [])
-                _create_plugin("AVFMediaPlayerServicePlugin", "qavfmediaplayer", "mediaservice", [])
-                _create_plugin("AVFServicePlugin", "qavfcamera", "mediaservice", [])
-                _create_plugin("CoreAudioPlugin", "qtaudio_coreaudio", "audio", [])
-
-        if self._has_positioning:
-            _create_module("Positioning", [])
-            _create_plugin("QGeoPositionInfoSourceFactoryGeoclue2", "qtposition_geoclue2", "position", [])
-            _create_plugin("QGeoPositionInfoSourceFactoryPoll", "qtposition_positionpoll", "position", [])
-
-        if self.options.get_safe("qtsensors"):
-            _create_module("Sensors", [])
-            _create_plugin("genericSensorPlugin", "qtsensors_generic", "sensors", [])
-            _create_plugin("IIOSensorProxySensorPlugin", "qtsensors_iio-sensor-proxy", "sensors", [])
-            if self.settings.os == "Linux":
-                _create_plugin("LinuxSensorPlugin", "qtsensors_linuxsys", "sensors", [])
-            _create_plugin("QtSensorGesturePlugin", "qtsensorgestures_plugin", "sensorgestures", [])
-            _create_plugin("QShakeSensorGesturePlugin", "qtsensorgestures_shakeplugin", "sensorgestures", [])
-
-        if self.options.get_safe("qtconnectivity"):
-            _create_module("Bluetooth", ["Network"])
-            _create_module("Nfc", [])
-
-        if self.options.get_safe("qtserialport"):
-            _create_module("SerialPort", [])
-
-        if self.options.get_safe("qtserialbus"):
-            _create_module("SerialBus", ["SerialPort"] if self.options.get_safe("qtserialport") else [])
-            _create_plugin("PassThruCanBusPlugin", "qtpassthrucanbus", "canbus", [])
-            _create_plugin("PeakCanBusPlugin", "qtpeakcanbus", "canbus", [])
-            _create_plugin("SocketCanBusPlugin", "qtsocketcanbus", "canbus", [])
-            _create_plugin("TinyCanBusPlugin", "qttinycanbus", "canbus", [])
-            _create_plugin("VirtualCanBusPlugin", "qtvirtualcanbus", "canbus", [])
-
-        if self.options.get_safe("qtwebsockets"):
-            _create_module("WebSockets", ["Network"])
-
-        if self.options.get_safe("qtwebchannel"):
-            _create_module("WebChannel", ["Qml"])
-
-        if self.options.get_safe("qtwebengine") and qt_quick_enabled:
-            webenginereqs = ["Gui", "Quick", "WebChannel"]
-            if self._has_positioning:
-                webenginereqs.append("Positioning")
-            if self.settings.os == "Linux":
-                webenginereqs.extend(["expat::expat", "opus::libopus", "xorg-proto::xorg-proto", "libxshmfence::libxshmfence", \
-                                      "nss::nss", "libdrm::libdrm"])
-            _create_module("WebEngineCore", webenginereqs)
-            _create_module("WebEngineQuick", ["WebEngineCore"])
-            _create_module("WebEngineWidgets", ["WebEngineCore", "Quick", "PrintSupport", "Widgets", "Gui", "Network"])
-
-        if self.options.get_safe("qtremoteobjects"):
-            _create_module("RemoteObjects", [])
-
-        if self.options.get_safe("qtwebview"):
-            _create_module("WebView", ["Core", "Gui"])
 
         if self.settings.os in ["Windows", "iOS"]:
             if self.settings.os == "Windows":
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+
+"""
+Generate the module graph read by the qt recipes, qtmodules<version>.yml, from qtmodules<version>.conf
+(the .gitmodules file of qt5.git or qt6.git) and from the components.yml file next to it.
+
+For every module, the graph contains the fields of the .conf file (status, path, depends) and all the modules
+it depends on, directly or not (all_depends). It also contains the table of the components created by
+package_info, with their conditions, from components.yml. Run it after adding or updating a qtmodules<version>.conf
+or a components.yml file, or with --check to verify that the graphs match them:
+
+    python3 recipes/qt/rebuild-module-graph.py [--check] [recipes/qt/6.x.x/qtmodules6.5.0.conf ...]
+"""
+
+import argparse
+import configparser
+import hashlib
+import sys
+from pathlib import Path
+
+import yaml
+
+
+CONDITION_KEYS = {"options", "not_options", "values", "not_values", "os", "not_os", "cross_building", "any"}
+COMPONENT_KEYS = {"if", "requires", "include_dir", "plugin", "alias"}
+
+
+def conf_sha256(conf_path: Path) -> str:
+    return hashlib.sha256(conf_path.read_bytes()).hexdigest()
+
+
+def read_modules(conf_path: Path) -> dict:
+    config = configparser.ConfigParser()
+    config.read(conf_path)
+    assert config.sections(), f"no module in {conf_path}"
+    modules = {}
+    for section in config.sections():
+        assert section.startswith("submodule ")
+        assert section.count('"') == 2
+        modulename = section[section.find('"') + 1: section.rfind('"')]
+        modules[modulename] = {
+            "status": config.get(section, "status"),
+            "path": config.get(section, "path"),
+            "depends": config.get(section, "depends").split() if config.has_option(section, "depends") else [],
+        }
+    return modules
+
+
+def all_depends(modules: dict, name: str, visiting=()) -> list:
+    if name in visiting:
+        raise Exception(f"Dependency cycle detected: {' -> '.join(visiting + (name,))}")
+    depends = set()
+    for depend in modules[name]["depends"]:
+        depends.add(depend)
+        if depend in modules:
+            depends.update(all_depends(modules, depend, visiting + (name,)))
+    return sorted(depends)
+
+
+def components_path(conf_path: Path) -> Path:
+    return conf_path.parent / "components.yml"
+
+
+def check_condition(condition, where: str):
+    assert isinstance(condition, dict), f"{where}: a condition is a mapping"
+    assert set(condition) <= CONDITION_KEYS, f"{where}: unknown keys {sorted(set(condition) - CONDITION_KEYS)}"
+    for alternative in condition.get("any", []):
+        check_condition(alternative, where)
+
+
+def read_components(path: Path) -> dict:
+    components = yaml.safe_load(path.read_text(encoding="utf-8"))
+    created = set()
+    for name, component in components.items():
+        assert set(component) <= COMPONENT_KEYS, f"{name}: unknown keys {sorted(set(component) - COMPONENT_KEYS)}"
+        assert not ("plugin" in component and component.get("alias")), f"{name}: a plugin is not an alias"
+        check_condition(component.get("if", {}), name)
+        for require in component.get("requires", []):
+            if isinstance(require, dict):
+                assert len(require) == 1, f"{name}: a conditional requirement is a single `name: condition`"
+                (require, condition), = require.items()
+                check_condition(condition, f"{name} -> {require}")
+            # package_info asserts that the required qt components exist
+            assert "::" in require or require in created, f"{name}: {require} is required before being created"
+        created.add(name)
+    return components
+
+
+def module_graph(conf_path: Path) -> str:
+    modules = read_modules(conf_path)
+    for name, module in modules.items():
+        module["all_depends"] = all_depends(modules, name)
+    graph = {
+        "conf_sha256": conf_sha256(conf_path),
+        "components_sha256": conf_sha256(components_path(conf_path)),
+        "modules": modules,
+    }
+    components = {"components": read_components(components_path(conf_path))}
+    # Modules keep the order of the .conf file, components the order of their creation. The lists of
+    #   the conditions and of the requirements of the components are written on one line
+    return yaml.dump(graph, sort_keys=False) + yaml.dump(components, sort_keys=False, default_flow_style=None)
+
+
+def graph_path(conf_path: Path) -> Path:
+    return conf_path.with_suffix(".yml")
+
+
+def main(args=None) -> int:
+    parser = argparse.ArgumentParser(description="Generate the module graphs of the qt recipes.")
+    parser.add_argument("conf_files", nargs="*", type=Path,
+                        help="qtmodules<version>.conf files (default: all the files of the qt recipes)")
+    parser.add_argument("--check", action="store_true", help="only check that the module graphs are up to date")
+    ns = parser.parse_args(args)
+
+    conf_files = ns.conf_files or sorted(Path(__file__).parent.glob("*/qtmodules*.conf"))
+    outdated = []
+    for conf_path in conf_files:
+        graph = module_graph(conf_path)
+        path = graph_path(conf_path)
+        if ns.check:
+            if not path.is_file() or path.read_text(encoding="utf-8") != graph:
+                outdated.append(path)
+        else:
+            print(f"Creating {path}")
+            path.write_text(graph, encoding="utf-8")
+
+    for path in outdated:
+        print(f"{path} does not match its .conf file or components.yml, run {Path(__file__).name}", file=sys.stderr)
+    return 1 if outdated else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
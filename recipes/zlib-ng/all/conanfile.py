@@ -47,6 +47,9 @@ class ZlibNgConan(ConanFile):
             self.options.rm_safe("fPIC")
         self.settings.rm_safe("compiler.cppstd")
         self.settings.rm_safe("compiler.libcxx")
+        if self.options.zlib_compat:
+            # Same API and headers as zlib, found with the same CMake and pkg-config names
+            self.provides = "zlib"
 
     def layout(self):
         cmake_layout(self, src_folder="src")
@@ -87,6 +90,13 @@ class ZlibNgConan(ConanFile):
         #FIXME: CMake targets are https://github.com/zlib-ng/zlib-ng/blob/29fd4672a2279a0368be936d7cd44d013d009fae/CMakeLists.txt#L914
         suffix = "" if self.options.zlib_compat else "-ng"
         self.cpp_info.set_property("pkg_config_name", f"zlib{suffix}")
+        if self.options.zlib_compat:
+            # Drop-in replacement of zlib: the consumers of zlib find it the same way
+            self.cpp_info.set_property("cmake_find_mode", "both")
+            self.cpp_info.set_property("cmake_file_name", "ZLIB")
+            self.cpp_info.set_property("cmake_target_name", "ZLIB::ZLIB")
+            self.cpp_info.names["cmake_find_package"] = "ZLIB"
+            self.cpp_info.names["cmake_find_package_multi"] = "ZLIB"
         if self.settings.os == "Windows":
             # The library name of zlib-ng is complicated in zlib-ng>=2.0.4:
             # https://github.com/zlib-ng/zlib-ng/blob/2.0.4/CMakeLists.txt#L994-L1016
@@ -1,5 +1,6 @@
 #include <stdio.h>
 #include <stdlib.h>
+#include <string.h>
 
 #ifdef ZLIB_COMPAT
 #  include "zlib.h"
@@ -11,5 +12,19 @@
 
 int main(void) {
     printf("ZLIB NG VERSION: %s\n", ZLIB_VERSION());
+#ifdef ZLIB_COMPAT
+    /* Used through the API of zlib, like by the consumers of zlib */
+    const char input[] = "conan-center-index conan-center-index conan-center-index";
+    unsigned char compressed[128];
+    char output[sizeof(input)];
+    uLongf compressed_size = sizeof(compressed);
+    uLongf output_size = sizeof(output);
+    if (compress(compressed, &compressed_size, (const Bytef *)input, sizeof(input)) != Z_OK ||
+        uncompress((Bytef *)output, &output_size, compressed, compressed_size) != Z_OK ||
+        output_size != sizeof(input) || memcmp(input, output, sizeof(input)) != 0) {
+        printf("zlib API round trip failed\n");
+        return EXIT_FAILURE;
+    }
+#endif
     return EXIT_SUCCESS;
 }
@@ -0,0 +1,252 @@
+"""
+Expand the build configurations of ConanCenter (the `configurations` of .c3i/config_v1.yml or config_v2.yml) into
+the package builds of some recipes, and schedule them on a number of builders:
+
+    python3 tools/build_matrix.py zlib/1.2.13 boost --durations durations.json --builders 8
+
+A recipe without version builds all the versions of its config.yml. The builds whose package ID would be the same
+are only built once: the package ID of each build is computed statically from the recipe, keeping the `settings`
+it declares, minus the ones removed by `configure()` (`self.settings.rm_safe("compiler.libcxx")`) or `package_id()`
+(`del self.info.settings.compiler`, `self.info.clear()`, ...). Only the statements directly in these methods are
+considered, not the ones under a condition. Like ConanCenter, the recipes with a `shared` option are built with
+both values.
+
+The builds are scheduled longest first on the least loaded builder (LPT), with the duration of each build read from
+a JSON file of durations in seconds by recipe name or reference (e.g. `{"boost": 1800, "zlib/1.2.13": 60}`).
+The output of change_impact.py can be used as the list of references with `--impact`.
+"""
+
+import argparse
+import ast
+import heapq
+import itertools
+import json
+import os
+import sys
+
+import yaml
+
+from recipe_index import Loader
+
+
+def _expand(content):
+    """Settings of every combination of a `content` item: {setting: [value, or {value: {sub-setting: [...]}}]}"""
+    keys = list(content)
+    per_key = []
+    for key in keys:
+        values = []
+        for value in content[key]:
+            if isinstance(value, dict):
+                for name, sub_content in value.items():
+                    for settings in _expand(sub_content or {}):
+                        values.append({key: str(name), **settings})
+            else:
+                values.append({key: str(value)})
+        per_key.append(values)
+    return [dict(item for settings in combination for item in settings.items())
+            for combination in itertools.product(*per_key)]
+
+
+def configurations(config, epoch=None):
+    """Settings of the builds of each configuration id, for an epoch (by default the latest one)"""
+    entries = config.get("configurations") or []
+    if epoch is None:
+        epoch = max(e for entry in entries for e in entry.get("epochs", [0]))
+    selected = {}
+    for entry in entries:
+        epochs = [e for e in entry.get("epochs", [0]) if e <= epoch]
+        if epochs and (entry["id"] not in selected or max(epochs) > selected[entry["id"]][0]):
+            selected[entry["id"]] = (max(epochs), entry)
+    result = {}
+    for config_id, (_, entry) in selected.items():
+        builds = []
+        for content in entry.get("content") or []:
+            for settings in _expand(content):
+                # Config v2 lists the cppstd built with each compiler version
+                cppstd = (config.get("cppstd") or {}).get(settings.get("compiler"), {}).get(
+                    settings.get("compiler.version"))
+                for value in cppstd or [None]:
+                    builds.append(dict(settings, **{"compiler.cppstd": value}) if value else settings)
+        result[config_id] = builds
+    return result
+
+
+def _self_attribute_chain(node):
+    """["info", "settings", "compiler"] for `self.info.settings.compiler`, None for other expressions"""
+    chain = []
+    while isinstance(node, ast.Attribute):
+        chain.insert(0, node.attr)
+        node = node.value
+    return chain if isinstance(node, ast.Name) and node.id == "self" else None
+
+
+def _unconditional_statements(body):
+    """Statements always executed by a function, including the ones of `try:` blocks (like `del` of a setting)"""
+    for statement in body:
+        if isinstance(statement, ast.Try):
+            yield from _unconditional_statements(statement.body)
+        else:
+            yield statement
+
+
+def recipe_traits(content):
+    """What the package ID of a recipe depends on: its settings, the ones it removes, its shared option"""
+    traits = {"settings": [], "removed": [], "cleared": False, "shared": False}
+    for node in ast.parse(content).body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for statement in node.body:
+            if isinstance(statement, ast.Assign) and len(statement.targets) == 1 and \
+                    isinstance(statement.targets[0], ast.Name):
+                name, value = statement.targets[0].id, statement.value
+                if name == "settings":
+                    elements = value.elts if isinstance(value, (ast.Tuple, ast.List)) else [value]
+                    traits["settings"] = [e.value for e in elements if isinstance(e, ast.Constant)]
+                elif name == "options" and isinstance(value, ast.Dict):
+                    traits["shared"] = any(isinstance(k, ast.Constant) and k.value == "shared" for k in value.keys)
+                elif name == "package_type" and isinstance(value, ast.Constant):
+                    traits["cleared"] = value.value == "header-library"
+            elif isinstance(statement, ast.FunctionDef) and statement.name in ("configure", "package_id"):
+                # Settings removed by configure() (self.settings) or package_id() (self.info.settings)
+                prefix = ["settings"] if statement.name == "configure" else ["info", "settings"]
+                for expression in _unconditional_statements(statement.body):
+                    if isinstance(expression, ast.Delete):
+                        for target in expression.targets:
+                            chain = _self_attribute_chain(target)
+                            if chain and chain[:len(prefix)] == prefix and len(chain) > len(prefix):
+                                traits["removed"].append(".".join(chain[len(prefix):]))
+                    elif isinstance(expression, ast.Expr) and isinstance(expression.value, ast.Call):
+                        call = expression.value
+                        chain = _self_attribute_chain(call.func)
+                        if chain in (["info", "clear"], ["info", "header_only"]):
+                            traits["cleared"] = True
+                        elif chain == prefix + ["clear"]:
+                            traits["removed"].extend(traits["settings"])
+                        elif chain in (prefix + ["rm_safe"], prefix + ["remove"]) and \
+                                call.args and isinstance(call.args[0], ast.Constant):
+                            traits["removed"].append(call.args[0].value)
+    return traits
+
+
+def package_id_key(traits, settings, options):
+    """Everything the package ID of a build depends on, according to the traits of the recipe"""
+    if traits["cleared"]:
+        return ()
+    kept = []
+    for setting, value in sorted(settings.items()):
+        parts = setting.split(".")
+        if parts[0] not in traits["settings"]:
+            continue
+        if any(".".join(parts[:i]) in traits["removed"] for i in range(1, len(parts) + 1)):
+            continue
+        kept.append((setting, value))
+    return tuple(kept) + tuple(sorted(options.items()))
+
+
+def read_references(root, references):
+    """(name, version, conanfile path) of the references, the versions of config.yml for the names alone"""
+    result = []
+    for reference in references:
+        name, _, version = reference.partition("/")
+        with open(os.path.join(root, "recipes", name, "config.yml"), encoding="utf-8") as f:
+            versions = (yaml.load(f, Loader=Loader) or {}).get("versions") or {}
+        versions = {str(v): (info or {}).get("folder") for v, info in versions.items()}
+        for v in [version] if version else versions:
+            if v not in versions:
+                raise ValueError(f"{name}/{v} is not in recipes/{name}/config.yml")
+            result.append((name, v, os.path.join(root, "recipes", name, versions[v], "conanfile.py")))
+    return result
+
+
+def expand_jobs(root, references, builds_by_config):
+    """Builds of the references, and the number of builds skipped since their package ID is already built"""
+    jobs, duplicates = [], 0
+    traits_cache = {}
+    for name, version, path in read_references(root, references):
+        if path not in traits_cache:
+            with open(path, encoding="utf-8") as f:
+                traits_cache[path] = recipe_traits(f.read())
+        traits = traits_cache[path]
+        seen = set()
+        for config_id, builds in sorted(builds_by_config.items()):
+            for settings in builds:
+                for shared in ([False, True] if traits["shared"] else [None]):
+                    options = {} if shared is None else {"shared": str(shared)}
+                    key = package_id_key(traits, settings, options)
+                    if key in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(key)
+                    jobs.append({"reference": f"{name}/{version}", "configuration": config_id,
+                                 "settings": settings, "options": options})
+    return jobs, duplicates
+
+
+def schedule(jobs, durations, default_duration, builders):
+    """Longest processing time first: every job, longest first, goes to the builder which is free first"""
+    def duration(job):
+        reference = job["reference"]
+        return durations.get(reference, durations.get(reference.split("/")[0], default_duration))
+
+    heap = [(0.0, builder) for builder in range(builders)]
+    assignments = [[] for _ in range(builders)]
+    for job in sorted(jobs, key=lambda job: (-duration(job), job["reference"], job["configuration"])):
+        load, builder = heapq.heappop(heap)
+        assignments[builder].append(dict(job, start=load, duration=duration(job)))
+        heapq.heappush(heap, (load + duration(job), builder))
+    total = sum(duration(job) for job in jobs)
+    return {
+        "makespan": max(load for load, _ in heap),
+        # No schedule can be shorter than this
+        "lower_bound": max([total / builders] + [duration(job) for job in jobs]),
+        "total": total,
+        "builders": assignments,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Expand the ConanCenter build configurations of some recipes and "
+                                                 "schedule the builds.")
+    parser.add_argument("references", nargs="*", help="recipes (name or name/version) to build.")
+    parser.add_argument("--impact", help="also build the versions to rebuild in this output of change_impact.py.")
+    parser.add_argument("--config", default=os.path.join(".c3i", "config_v1.yml"),
+                        help="configuration file, relative to the root (default: .c3i/config_v1.yml).")
+    parser.add_argument("--epoch", type=int, help="epoch of the configurations (default: the latest one).")
+    parser.add_argument("--durations", help="JSON file of build durations in seconds, by recipe name or reference.")
+    parser.add_argument("--default-duration", type=float, default=600,
+                        help="duration of the builds of the recipes missing from --durations (default: 600).")
+    parser.add_argument("--builders", type=int, default=1, help="number of builders (default: 1).")
+    parser.add_argument("--root", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."),
+                        help="root of the conan-center-index repository (default: the one of this script).")
+    parser.add_argument("--output", help="write the jobs and their schedule to this JSON file (default: stdout).")
+    args = parser.parse_args()
+
+    root = os.path.normpath(args.root)
+    references = list(args.references)
+    if args.impact:
+        with open(args.impact, encoding="utf-8") as f:
+            references += [f"{item['recipe']}/{item['version']}" for item in json.load(f)["rebuild"]]
+    if not references:
+        parser.error("no reference to build")
+    with open(os.path.join(root, args.config), encoding="utf-8") as f:
+        config = yaml.load(f, Loader=Loader)
+    durations = {}
+    if args.durations:
+        with open(args.durations, encoding="utf-8") as f:
+            durations = json.load(f)
+
+    jobs, duplicates = expand_jobs(root, dict.fromkeys(references), configurations(config, args.epoch))
+    result = schedule(jobs, durations, args.default_duration, args.builders)
+    result["duplicates"] = duplicates
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=4)
+    else:
+        json.dump(result, sys.stdout, indent=4)
+    print(f"{len(jobs)} builds ({duplicates} skipped with the same package ID), {result['total'] / 3600:.1f} h in "
+          f"total, {result['makespan'] / 3600:.1f} h on {args.builders} builders "
+          f"(at best {result['lower_bound'] / 3600:.1f} h)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+List the recipe versions to build again after the changes of a git range, and the recipes depending on them:
+
+    python3 tools/change_impact.py origin/master...HEAD
+
+The files changed in the range are classified, and each class changes a different set of versions:
+
+- config.yml: the versions added, or moved to another folder
+- conanfile.py, and any other file of the folder (which may be exported): all the versions of the folder
+- conandata.yml: the versions whose sources or patches changed (all of them if another field changed)
+- patches/*: the versions applying the patch, according to conandata.yml
+- test_package/*, test_v1_package/*: the versions of the folder have to be tested, but no binary changes
+- the other files of the recipe (scripts next to config.yml): none
+
+The recipes requiring (`requires`, directly or not) a version to build are built again as well, at the recipe
+level since the versions of their folders share the same requirements. They are read from the working tree, see
+dependency_graph.py. Build requirements do not change the package ID of the recipes using them.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import PurePosixPath
+
+import yaml
+
+from dependency_graph import read_recipes, reverse_closure
+
+
+TEST_FOLDERS = ("test_package", "test_v1_package")
+
+
+def _git(*args):
+    return subprocess.run(["git"] + list(args), check=True, stdout=subprocess.PIPE).stdout.decode("utf-8")
+
+
+def _revisions(git_range):
+    """Old and new revisions compared by a git range"""
+    if "..." in git_range:
+        old, new = git_range.split("...", 1)
+        new = new or "HEAD"
+        return _git("merge-base", old, new).strip(), new
+    if ".." in git_range:
+        old, new = git_range.split("..", 1)
+        return old, new or "HEAD"
+    return git_range, "HEAD"
+
+
+def _load(revision, path):
+    """YAML content of a file at a revision, None if it does not exist"""
+    try:
+        content = subprocess.run(["git", "show", f"{revision}:{path}"], check=True, stdout=subprocess.PIPE,
+                                 stderr=subprocess.DEVNULL).stdout
+    except subprocess.CalledProcessError:
+        return None
+    return yaml.safe_load(content) or {}
+
+
+def classify(path):
+    """(recipe, folder, kind) of a changed file, None for the files of no recipe"""
+    parts = PurePosixPath(path).parts
+    if len(parts) < 3 or parts[0] != "recipes":
+        return None
+    recipe = parts[1]
+    if len(parts) == 3:
+        return recipe, None, "config" if parts[2] == "config.yml" else "unexported"
+    folder, rest = parts[2], parts[3:]
+    if rest[0] in TEST_FOLDERS:
+        kind = "test_package"
+    elif rest == ("conanfile.py",):
+        kind = "conanfile"
+    elif rest == ("conandata.yml",):
+        kind = "conandata"
+    elif rest[0] == "patches":
+        kind = "patch"
+    else:
+        kind = "exported"
+    return recipe, folder, kind
+
+
+def _versions(config):
+    versions = (config or {}).get("versions") or {}
+    return {str(version): str((info or {}).get("folder")) for version, info in versions.items()}
+
+
+def _conandata_changes(old, new):
+    """Versions whose entries changed in conandata.yml, None if all of them may have changed"""
+    old, new = old or {}, new or {}
+    if {k: v for k, v in old.items() if k not in ("sources", "patches")} != \
+            {k: v for k, v in new.items() if k not in ("sources", "patches")}:
+        return None
+    changed = set()
+    for field in ("sources", "patches"):
+        old_entries, new_entries = old.get(field) or {}, new.get(field) or {}
+        for version in set(old_entries) | set(new_entries):
+            if old_entries.get(version) != new_entries.get(version):
+                changed.add(str(version))
+    return changed
+
+
+def _patch_versions(conandata, folder_path, patch_path):
+    """Versions applying a patch file"""
+    versions = set()
+    for version, patches in ((conandata or {}).get("patches") or {}).items():
+        for patch in patches or []:
+            patch_file = patch.get("patch_file") if isinstance(patch, dict) else None
+            if patch_file and PurePosixPath(folder_path, patch_file) == PurePosixPath(patch_path):
+                versions.add(str(version))
+    return versions
+
+
+def analyze(old, new, paths):
+    """Versions to build {(recipe, version): [reasons]}, versions to test only, and the classification of the files"""
+    rebuild = defaultdict(set)
+    test_only = set()
+    files = {}
+    by_recipe = defaultdict(list)
+    for path in paths:
+        classification = classify(path)
+        files[path] = classification[2] if classification else "unrelated"
+        if classification:
+            by_recipe[classification[0]].append((path, classification[1], classification[2]))
+
+    for recipe, changes in by_recipe.items():
+        config_path = f"recipes/{recipe}/config.yml"
+        old_versions, new_versions = _versions(_load(old, config_path)), _versions(_load(new, config_path))
+        folder_versions = defaultdict(set)
+        for version, folder in new_versions.items():
+            folder_versions[folder].add(version)
+
+        conandata = {}
+        for path, folder, kind in changes:
+            if kind == "config":
+                for version, folder_name in new_versions.items():
+                    if old_versions.get(version) != folder_name:
+                        rebuild[(recipe, version)].add(path)
+            elif kind == "test_package":
+                test_only.update((recipe, version) for version in folder_versions[folder])
+            elif kind in ("conanfile", "exported"):
+                for version in folder_versions[folder]:
+                    rebuild[(recipe, version)].add(path)
+            elif kind == "conandata":
+                changed = _conandata_changes(_load(old, path), _load(new, path))
+                for version in folder_versions[folder] if changed is None else changed & folder_versions[folder]:
+                    rebuild[(recipe, version)].add(path)
+            elif kind == "patch":
+                folder_path = f"recipes/{recipe}/{folder}"
+                for revision in (old, new):
+                    key = (revision, folder)
+                    if key not in conandata:
+                        conandata[key] = _load(revision, f"{folder_path}/conandata.yml")
+                    for version in _patch_versions(conandata[key], folder_path, path) & folder_versions[folder]:
+                        rebuild[(recipe, version)].add(path)
+
+    test_only.difference_update(rebuild)
+    return rebuild, test_only, files
+
+
+def downstream(rebuild, root, jobs):
+    """Recipes requiring the versions to build, directly or not"""
+    recipes = read_recipes(root, jobs)
+    changed = defaultdict(set)
+    for recipe, version in rebuild:
+        changed[recipe].add(version)
+    # Direct dependents of the versions built: the references without a known version may require any of them
+    graph = defaultdict(set)
+    direct = set()
+    for name, recipe in recipes.items():
+        for dependency, references in recipe["requires"].items():
+            graph[name].add(dependency)
+            versions = {reference.split("/", 1)[1].split("@")[0].split("#")[0] if "/" in reference else "*"
+                        for reference in references}
+            if dependency in changed and any("*" in v or v.startswith("[") or v in changed[dependency]
+                                             for v in versions):
+                direct.add(name)
+    graph = {name: sorted(deps) for name, deps in graph.items()}
+    for name in recipes:
+        graph.setdefault(name, [])
+    return sorted(reverse_closure(graph, direct) - set(changed)) if direct else []
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List the recipe versions to build again after the changes of a git "
+                                                 "range, and the recipes depending on them.")
+    parser.add_argument("range", help="git range (A..B, A...B, or a revision compared to HEAD).")
+    parser.add_argument("--root", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."),
+                        help="root of the conan-center-index repository (default: the one of this script).")
+    parser.add_argument("--output", help="write the result to this JSON file (default: stdout).")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="number of processes parsing the recipes (default: number of CPUs).")
+    args = parser.parse_args()
+
+    root = os.path.normpath(args.root)
+    os.chdir(root)
+    old, new = _revisions(args.range)
+    paths = [path for path in _git("diff", "--name-only", "-z", "--no-renames", old, new).split("\0") if path]
+    rebuild, test_only, files = analyze(old, new, paths)
+
+    result = {
+        "rebuild": [{"recipe": recipe, "version": version, "files": sorted(reasons)}
+                    for (recipe, version), reasons in sorted(rebuild.items())],
+        "test_only": [{"recipe": recipe, "version": version} for recipe, version in sorted(test_only)],
+        "downstream": downstream(rebuild, root, args.jobs),
+        "files": files,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=4)
+    else:
+        json.dump(result, sys.stdout, indent=4)
+    print(f"{len(result['rebuild'])} versions to build, {len(result['test_only'])} to test only, "
+          f"{len(result['downstream'])} recipes depending on them", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
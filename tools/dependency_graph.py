@@ -0,0 +1,192 @@
+"""
+Build the graph of the dependencies between the recipes, from the references required by every
+recipes/*/*/conanfile.py (extracted statically, see conanfile_requirements in recipe_index.py):
+
+    python3 tools/dependency_graph.py --output graph.json --dot graph.dot
+
+With --affected, only the recipes depending (directly or not) on the given packages are kept. The recipes are then
+grouped into waves: every recipe of a wave only depends on recipes of the previous waves, so all the recipes of a wave
+can be built in parallel. With --workers, the recipes are also scheduled in steps of at most N builds, starting with
+the recipes on the longest chains of dependents:
+
+    python3 tools/dependency_graph.py --affected zlib openssl --workers 8
+
+Nodes are packages (recipe names), the versions of all the recipe folders are merged. Build requirements
+(tool_requires, build_requires) are edges of the graph as well, since they must be built first.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from recipe_index import conanfile_requirements
+
+
+# Requirements building a recipe depends on
+BUILD_KINDS = {"tool_requires", "build_requires"}
+HOST_KINDS = {"requires"}
+
+
+def _recipe_requirements(path):
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+    try:
+        return path, conanfile_requirements(content, path)
+    except SyntaxError:
+        return path, []
+
+
+def read_recipes(root, jobs):
+    """Requirements of every recipe: {name: {"folders": [...], "requires": {dependency: [references]}, ...}}"""
+    paths = sorted(glob.glob(os.path.join(root, "recipes", "*", "*", "conanfile.py")))
+    recipes = {}
+    for path in paths:
+        name = path.split(os.sep)[-3]
+        recipes.setdefault(name, {"folders": [], "requires": defaultdict(set), "build_requires": defaultdict(set)})
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for path, requirements in executor.map(_recipe_requirements, paths, chunksize=32):
+            name, folder = path.split(os.sep)[-3:-1]
+            recipe = recipes[name]
+            recipe["folders"].append(folder)
+            for kind, reference, _ in requirements:
+                dependency = reference.split("/")[0]
+                if dependency == name:
+                    continue
+                if kind in HOST_KINDS:
+                    recipe["requires"][dependency].add(reference)
+                elif kind in BUILD_KINDS:
+                    recipe["build_requires"][dependency].add(reference)
+    return recipes
+
+
+def dependencies(recipes):
+    """Recipes (of the index) each recipe depends on"""
+    return {name: sorted((set(recipe["requires"]) | set(recipe["build_requires"])) & set(recipes))
+            for name, recipe in recipes.items()}
+
+
+def reverse_closure(graph, packages):
+    """Recipes depending on the packages, directly or not, the packages included"""
+    dependents = defaultdict(set)
+    for name, deps in graph.items():
+        for dep in deps:
+            dependents[dep].add(name)
+    affected = set()
+    pending = [package for package in packages if package in graph]
+    while pending:
+        name = pending.pop()
+        if name not in affected:
+            affected.add(name)
+            pending.extend(dependents[name])
+    return affected
+
+
+def waves(graph, nodes):
+    """Topological levels of the nodes, and the nodes left in dependency cycles"""
+    remaining = {name: set(graph[name]) & nodes for name in nodes}
+    result = []
+    while remaining:
+        wave = sorted(name for name, deps in remaining.items() if not deps)
+        if not wave:
+            break
+        result.append(wave)
+        for name in wave:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(wave)
+    return result, sorted(remaining)
+
+
+def schedule(graph, ordered_waves, workers):
+    """Steps of at most `workers` builds, every build of a step only depends on builds of the previous steps"""
+    nodes = {name for wave in ordered_waves for name in wave}
+    dependents = defaultdict(set)
+    for name in nodes:
+        for dep in set(graph[name]) & nodes:
+            dependents[dep].add(name)
+    # Length of the longest chain of recipes depending on each recipe, built first
+    height = {}
+    for wave in reversed(ordered_waves):
+        for name in wave:
+            height[name] = 1 + max((height[d] for d in dependents[name]), default=0)
+    remaining = {name: len(set(graph[name]) & nodes) for name in nodes}
+    ready = {name for name, count in remaining.items() if not count}
+    steps = []
+    while ready:
+        step = sorted(ready, key=lambda name: (-height[name], name))[:workers]
+        steps.append(step)
+        ready.difference_update(step)
+        for name in step:
+            for dependent in dependents[name]:
+                remaining[dependent] -= 1
+                if not remaining[dependent]:
+                    ready.add(dependent)
+    return steps
+
+
+def to_dot(recipes, nodes, affected_roots=()):
+    lines = ["digraph recipes {", "    rankdir=LR;"]
+    for name in sorted(nodes):
+        style = ', style=filled, fillcolor="#ffcc66"' if name in affected_roots else ""
+        lines.append(f'    "{name}" [label="{name}"{style}];')
+    for name in sorted(nodes):
+        recipe = recipes[name]
+        for dependency in sorted(set(recipe["requires"]) & nodes):
+            lines.append(f'    "{name}" -> "{dependency}";')
+        for dependency in sorted((set(recipe["build_requires"]) - set(recipe["requires"])) & nodes):
+            lines.append(f'    "{name}" -> "{dependency}" [style=dashed];')
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the graph of the dependencies between the recipes.")
+    parser.add_argument("--root", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."),
+                        help="root of the conan-center-index repository (default: the one of this script).")
+    parser.add_argument("--affected", nargs="+", metavar="PACKAGE",
+                        help="only keep the recipes depending on these packages, directly or not.")
+    parser.add_argument("--workers", type=int, help="also schedule the builds in steps of at most N recipes.")
+    parser.add_argument("--output", help="write the graph to this JSON file (default: stdout).")
+    parser.add_argument("--dot", help="write the graph to this Graphviz file.")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="number of processes parsing the recipes (default: number of CPUs).")
+    args = parser.parse_args()
+
+    recipes = read_recipes(os.path.normpath(args.root), args.jobs)
+    graph = dependencies(recipes)
+    nodes = reverse_closure(graph, args.affected) if args.affected else set(graph)
+    ordered_waves, cycles = waves(graph, nodes)
+
+    result = {
+        "recipes": {
+            name: {
+                "folders": sorted(recipes[name]["folders"]),
+                "requires": {dep: sorted(refs) for dep, refs in sorted(recipes[name]["requires"].items())},
+                "build_requires": {dep: sorted(refs) for dep, refs in sorted(recipes[name]["build_requires"].items())},
+            } for name in sorted(nodes)
+        },
+        "waves": ordered_waves,
+        "cycles": cycles,
+    }
+    if args.affected:
+        result["affected"] = sorted(nodes)
+    if args.workers:
+        result["schedule"] = schedule(graph, ordered_waves, args.workers)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=4)
+    else:
+        json.dump(result, sys.stdout, indent=4)
+    if args.dot:
+        with open(args.dot, "w", encoding="utf-8") as f:
+            f.write(to_dot(recipes, nodes, set(args.affected or [])))
+    print(f"{len(nodes)} recipes in {len(ordered_waves)} waves, {len(cycles)} in dependency cycles", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Compare the link times of the default linker with mold (or other linkers), to know what injecting mold into the
+builds of the recipes would save:
+
+    python3 tools/link_benchmark.py --mold ~/.conan/data/mold/1.8.0/_/_/package/<package_id>/bin/mold
+
+By default, a synthetic C++ project is generated and compiled once (`--sources` files of `--functions` functions each,
+with debug information), then its executable and shared library are linked `--repeat` times with each linker. The
+link of a real project can be measured instead with `--link-command`, the command linking one of its targets (like
+printed by `ninja -t commands <target> | tail -n 1`), run in `--cwd` with the flags of each linker appended.
+
+mold is selected like with the `inject_linker_flags` option of its recipe: with `-B` and a folder where `ld` is mold.
+Other linkers are compared with `--linker name=flags`, like `--linker gold=-fuse-ld=gold`.
+"""
+
+import argparse
+import json
+import os
+import shlex
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _source(index, functions):
+    lines = ["#include <map>", "#include <string>", "#include <vector>", "", f"namespace unit{index} {{"]
+    for function in range(functions):
+        lines += [
+            f"std::string function{function}(const std::vector<int>& values) {{",
+            "    std::map<int, std::string> names;",
+            "    for (int value : values) {",
+            f"        names[value * {function + 1}] = std::to_string(value + {index});",
+            "    }",
+            "    return names.empty() ? std::string() : names.begin()->second;",
+            "}",
+        ]
+    lines += ["}", "", f"std::string unit{index}_entry(const std::vector<int>& values) {{",
+              "    std::string result;"]
+    lines += [f"    result += unit{index}::function{function}(values);" for function in range(functions)]
+    lines += ["    return result;", "}", ""]
+    return "\n".join(lines)
+
+
+def generate_project(folder, sources, functions):
+    """Write the sources of the synthetic project, the last one defining main()"""
+    paths = []
+    for index in range(sources):
+        path = os.path.join(folder, f"unit{index}.cpp")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_source(index, functions))
+        paths.append(path)
+    main = os.path.join(folder, "main.cpp")
+    with open(main, "w", encoding="utf-8") as f:
+        f.write("#include <string>\n#include <vector>\n\n")
+        f.write("".join(f"std::string unit{index}_entry(const std::vector<int>&);\n" for index in range(sources)))
+        f.write("\nint main(int argc, char**) {\n    std::vector<int> values(argc);\n    std::string result;\n")
+        f.write("".join(f"    result += unit{index}_entry(values);\n" for index in range(sources)))
+        f.write("    return static_cast<int>(result.size() % 2);\n}\n")
+    return paths, main
+
+
+def compile_project(cxx, paths, main, jobs):
+    """Object files of the sources (position independent, for the shared library too), and the one of main()"""
+    def compile_file(path):
+        subprocess.run(cxx + ["-c", "-O1", "-g", "-fPIC", path, "-o", path[:-len(".cpp")] + ".o"], check=True)
+        return path[:-len(".cpp")] + ".o"
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        objects = list(executor.map(compile_file, paths + [main]))
+    return objects[:-1], objects[-1]
+
+
+def mold_flags(mold, folder):
+    """Flags linking with mold: gcc and clang look for `ld` in the -B folders first"""
+    link_folder = os.path.join(folder, "mold")
+    os.makedirs(link_folder, exist_ok=True)
+    os.symlink(os.path.abspath(mold), os.path.join(link_folder, "ld"))
+    return [f"-B{link_folder}"]
+
+
+def time_links(commands, linkers, repeat, cwd=None):
+    """Median time of each command, with the flags of each linker: {linker: {command name: seconds}}"""
+    results = {}
+    for linker, flags in linkers.items():
+        results[linker] = {}
+        for name, command in commands.items():
+            times = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                subprocess.run(command + flags, check=True, cwd=cwd)
+                times.append(time.perf_counter() - start)
+            results[linker][name] = statistics.median(times)
+    return results
+
+
+def report(results):
+    linkers = list(results)
+    names = list(results[linkers[0]])
+    lines = [f"{'linker':<12}" + "".join(f"{name:>16}" for name in names)]
+    for linker in linkers:
+        cells = []
+        for name in names:
+            cell = f"{results[linker][name]:.3f} s"
+            if linker != linkers[0]:
+                cell += f" {results[linkers[0]][name] / results[linker][name]:.1f}x"
+            cells.append(f"{cell:>16}")
+        lines.append(f"{linker:<12}" + "".join(cells))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the link times of the default linker with mold.")
+    parser.add_argument("--mold", default=shutil.which("mold"),
+                        help="mold executable, e.g. the one of its Conan package (default: the one in the PATH).")
+    parser.add_argument("--linker", action="append", default=[], metavar="NAME=FLAGS",
+                        help="another linker to compare, selected by flags (e.g. gold=-fuse-ld=gold).")
+    parser.add_argument("--cxx", default=os.environ.get("CXX", "c++"),
+                        help="compiler driver of the synthetic project (default: $CXX, or c++).")
+    parser.add_argument("--sources", type=int, default=100,
+                        help="number of source files of the synthetic project (default: 100).")
+    parser.add_argument("--functions", type=int, default=100,
+                        help="number of functions by source file of the synthetic project (default: 100).")
+    parser.add_argument("--link-command", help="command linking a target of a real project, instead of the synthetic one.")
+    parser.add_argument("--cwd", help="folder where --link-command is run (default: the current folder).")
+    parser.add_argument("--repeat", type=int, default=5, help="number of links with each linker (default: 5).")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="number of files compiled in parallel (default: number of CPUs).")
+    parser.add_argument("--output", help="write the link times to this JSON file.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        linkers = {"default": []}
+        if args.mold:
+            linkers["mold"] = mold_flags(args.mold, folder)
+        for linker in args.linker:
+            name, _, flags = linker.partition("=")
+            linkers[name] = shlex.split(flags)
+        if len(linkers) == 1:
+            parser.error("mold is not in the PATH, give it with --mold or other linkers with --linker")
+
+        if args.link_command:
+            command = args.link_command.strip()
+            # The link commands of CMake with Ninja are wrapped in ": && ... && :"
+            if command.startswith(": && ") and command.endswith(" && :"):
+                command = command[len(": && "):-len(" && :")]
+            commands = {"command": shlex.split(command)}
+        else:
+            cxx = shlex.split(args.cxx)
+            print(f"Compiling {args.sources} sources of {args.functions} functions...", file=sys.stderr)
+            objects, main_object = compile_project(cxx, *generate_project(folder, args.sources, args.functions),
+                                                   args.jobs)
+            commands = {
+                "executable": cxx + objects + [main_object, "-o", os.path.join(folder, "benchmark")],
+                "shared library": cxx + ["-shared"] + objects + ["-o", os.path.join(folder, "libbenchmark.so")],
+            }
+        results = time_links(commands, linkers, args.repeat, cwd=args.cwd)
+
+    print(report(results))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
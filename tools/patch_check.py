@@ -0,0 +1,189 @@
+"""
+Check that the patches listed in the conandata.yml files still apply to the sources of their versions, without
+building anything:
+
+    python3 tools/source_cache.py prefetch --recipe zlib
+    python3 tools/patch_check.py --recipe zlib
+
+The sources are read from the store of source_cache.py, the versions whose sources are not in the store are skipped.
+The sources of each version are extracted once into a scratch folder (without their root folder, like
+`get(..., strip_root=True)`), where its patches are applied in order, with patch_ng like `apply_conandata_patches()`.
+The folder the recipe extracts the sources to (like `source_subfolder`) is not known statically, so the leading
+folders of `base_path` missing from the sources are ignored.
+
+The versions are checked in parallel, the patches which do not apply are reported as GitHub Actions annotations.
+"""
+
+import argparse
+import glob
+import logging
+import os
+import shutil
+import sys
+import tarfile
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+import patch_ng
+import yaml
+
+from recipe_index import Loader
+from source_cache import SourceStore
+
+
+class _Messages(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def _patch_lines(content):
+    """Line (1-based) of each patch entry of conandata.yml, by version and index"""
+    lines = {}
+    root = yaml.compose(content, Loader=Loader)
+    for key, value in root.value if isinstance(root, yaml.MappingNode) else []:
+        if key.value == "patches" and isinstance(value, yaml.MappingNode):
+            for version, entries in value.value:
+                if isinstance(entries, yaml.SequenceNode):
+                    for index, entry in enumerate(entries.value):
+                        lines[(str(version.value), index)] = entry.start_mark.line + 1
+    return lines
+
+
+def _main_source(source):
+    """sha256 of the main source of a version, None if the layout of the sources is not supported"""
+    if isinstance(source, list):
+        source = next((item for item in source if isinstance(item, dict) and "url" in item), None)
+    if isinstance(source, dict) and "url" in source and source.get("sha256"):
+        return str(source["sha256"]).lower()
+    return None
+
+
+def read_checks(root, recipes=None):
+    """Patches to check: (conandata path, version, sha256 of the sources, [(line, patch entry)])"""
+    checks = []
+    for path in sorted(glob.glob(os.path.join(root, "recipes", "*", "*", "conandata.yml"))):
+        if recipes and path.split(os.sep)[-3] not in recipes:
+            continue
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+        data = yaml.load(content, Loader=Loader) or {}
+        patches = data.get("patches")
+        if not isinstance(patches, dict):
+            continue
+        lines = _patch_lines(content)
+        sources = data.get("sources") or {}
+        for version, entries in patches.items():
+            entries = [(lines.get((str(version), index)), entry) for index, entry in enumerate(entries or [])
+                       if isinstance(entry, dict)]
+            if entries:
+                checks.append((path, str(version), _main_source(sources.get(version)), entries))
+    return checks
+
+
+def _extract(archive, destination):
+    if zipfile.is_zipfile(archive):
+        with zipfile.ZipFile(archive) as z:
+            z.extractall(destination)
+    else:
+        with tarfile.open(archive) as tar:
+            if hasattr(tarfile, "data_filter"):
+                tar.extractall(destination, filter="data")
+            else:
+                tar.extractall(destination)
+    # strip_root=True
+    children = os.listdir(destination)
+    if len(children) == 1 and os.path.isdir(os.path.join(destination, children[0])):
+        return os.path.join(destination, children[0])
+    return destination
+
+
+def _patch_root(sources, base_path):
+    parts = [part for part in (base_path or "").replace("\\", "/").split("/") if part]
+    while parts and not os.path.isdir(os.path.join(sources, *parts)):
+        parts.pop(0)
+    return os.path.join(sources, *parts)
+
+
+def check_version(archive, recipe_folder, entries, scratch):
+    """Apply the patches of a version in order, return (line, patch, error) of the first one which does not apply"""
+    logger = logging.getLogger("patch_ng")
+    logger.handlers = []
+    logger.propagate = False
+    handler = _Messages()
+    logger.addHandler(handler)
+    folder = tempfile.mkdtemp(dir=scratch)
+    try:
+        sources = _extract(archive, folder)
+        for line, entry in entries:
+            name = entry.get("patch_file") or "patch_string"
+            if entry.get("patch_file"):
+                patchset = patch_ng.fromfile(os.path.join(recipe_folder, entry["patch_file"]))
+            else:
+                patchset = patch_ng.fromstring(str(entry.get("patch_string", "")).encode())
+            handler.messages = []
+            if not patchset:
+                return line, name, "; ".join(["failed to parse the patch"] + handler.messages)
+            if not patchset.apply(strip=entry.get("strip", 0), root=_patch_root(sources, entry.get("base_path")),
+                                  fuzz=entry.get("fuzz", False)):
+                return line, name, "; ".join(["failed to apply the patch"] + handler.messages)
+        return None
+    except (OSError, tarfile.TarError, zipfile.BadZipFile) as error:
+        return None, "sources", f"failed to extract the sources: {error}"
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+def _check(args):
+    path, version, archive, entries, scratch = args
+    return path, version, check_version(archive, os.path.dirname(path), entries, scratch)
+
+
+def _annotation(path, line, message):
+    location = f"file={path},line={line}" if line else f"file={path}"
+    # Messages are on a single line in annotations
+    return f"::error {location}::{message.replace('%', '%25').replace(chr(13), '%0D').replace(chr(10), '%0A')}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that the patches of the conandata.yml files still apply.")
+    parser.add_argument("--store", default=os.path.join(os.path.expanduser("~"), ".cache", "cci-sources"),
+                        help="folder of the store of source_cache.py (default: ~/.cache/cci-sources).")
+    parser.add_argument("--root", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."),
+                        help="root of the conan-center-index repository (default: the one of this script).")
+    parser.add_argument("--recipe", nargs="+", help="only the patches of these recipes.")
+    parser.add_argument("--scratch", help="folder where the sources are extracted (default: a temporary folder).")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="number of versions checked in parallel (default: number of CPUs).")
+    args = parser.parse_args()
+
+    root = os.path.normpath(args.root)
+    store = SourceStore(args.store)
+    tasks, skipped = [], []
+    for path, version, sha256, entries in read_checks(root, args.recipe):
+        if sha256 and sha256 in store:
+            tasks.append((path, version, store.path(sha256), entries))
+        else:
+            skipped.append((path, version))
+
+    failed = 0
+    with tempfile.TemporaryDirectory(dir=args.scratch) as scratch:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            for path, version, failure in executor.map(_check, [task + (scratch,) for task in tasks]):
+                if failure:
+                    failed += 1
+                    line, name, error = failure
+                    print(_annotation(os.path.relpath(path, root).replace(os.sep, "/"), line,
+                                      f"{version}: {name}: {error}"))
+    for path, version in skipped:
+        print(f"Skipped {os.path.relpath(path, root)} {version}: sources not in the store", file=sys.stderr)
+    print(f"{len(tasks)} versions checked, {failed} failed, {len(skipped)} skipped", file=sys.stderr)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
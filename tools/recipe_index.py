@@ -0,0 +1,368 @@
+"""
+Index the recipes (their config.yml, conandata.yml and conanfile.py files) into an SQLite database, to answer
+questions about the whole index without parsing thousands of files every time:
+
+    python3 tools/recipe_index.py requires zlib/1.2.11
+    python3 tools/recipe_index.py patches --type vulnerability
+    python3 tools/recipe_index.py sources --host sourceforge.net
+    python3 tools/recipe_index.py sql "SELECT recipe, COUNT(*) FROM versions GROUP BY recipe ORDER BY 2 DESC LIMIT 10"
+
+Every command first updates the index: only the files whose modification time or size changed are read again,
+and only the ones whose content (sha256) changed are parsed again. The `requires` of the recipes are extracted
+statically: string literals, and f-strings or concatenations of the string constants of the recipe (module
+constants, class attributes and properties returning a literal). Any other part of a reference is stored as `*`,
+like the version in `f"oatpp/{self.version}"`.
+"""
+
+import argparse
+import ast
+import glob
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+from urllib.parse import urlparse
+
+import yaml
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS versions (
+    path TEXT NOT NULL,
+    recipe TEXT NOT NULL,
+    version TEXT NOT NULL,
+    folder TEXT
+);
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT NOT NULL,
+    recipe TEXT NOT NULL,
+    folder TEXT NOT NULL,
+    version TEXT NOT NULL,
+    url TEXT NOT NULL,
+    host TEXT NOT NULL,
+    sha256 TEXT
+);
+CREATE TABLE IF NOT EXISTS patches (
+    path TEXT NOT NULL,
+    recipe TEXT NOT NULL,
+    folder TEXT NOT NULL,
+    version TEXT NOT NULL,
+    patch_file TEXT,
+    patch_type TEXT,
+    patch_source TEXT,
+    patch_description TEXT
+);
+CREATE TABLE IF NOT EXISTS requires (
+    path TEXT NOT NULL,
+    recipe TEXT NOT NULL,
+    folder TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    reference TEXT NOT NULL,
+    line INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS versions_path ON versions (path);
+CREATE INDEX IF NOT EXISTS sources_path ON sources (path);
+CREATE INDEX IF NOT EXISTS patches_path ON patches (path);
+CREATE INDEX IF NOT EXISTS requires_path ON requires (path);
+CREATE INDEX IF NOT EXISTS requires_reference ON requires (reference);
+"""
+
+# Tables filled from the files, by their path
+TABLES = ["versions", "sources", "patches", "requires"]
+
+# Increased when the rows extracted from the files change, to index all of them again
+INDEX_VERSION = 2
+
+FILE_PATTERNS = ["recipes/*/config.yml", "recipes/*/*/conandata.yml", "recipes/*/*/conanfile.py"]
+
+# Methods and attributes of ConanFile declaring a dependency
+REQUIRES_KINDS = ["requires", "build_requires", "tool_requires", "test_requires", "python_requires"]
+
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _load_yaml(content):
+    return yaml.load(content, Loader=Loader) or {}
+
+
+def _text(value):
+    """Value of a YAML field as text, whatever its type"""
+    return value if value is None or isinstance(value, str) else str(value)
+
+
+def index_config(path, content):
+    recipe = path.split("/")[1]
+    versions = _load_yaml(content).get("versions") or {}
+    return {"versions": [(path, recipe, str(version), _text((info or {}).get("folder")))
+                         for version, info in versions.items()]}
+
+
+def source_urls(source):
+    """(url, sha256) of a source entry, which may be a list of mirrors, or a list/dict of several sources"""
+    if isinstance(source, list):
+        for item in source:
+            yield from source_urls(item)
+    elif isinstance(source, dict):
+        if "url" in source:
+            urls = source["url"] if isinstance(source["url"], list) else [source["url"]]
+            for url in urls:
+                yield str(url), _text(source.get("sha256"))
+        else:
+            for item in source.values():
+                yield from source_urls(item)
+
+
+def index_conandata(path, content):
+    _, recipe, folder, _ = path.split("/")
+    data = _load_yaml(content)
+    sources = []
+    for version, source in (data.get("sources") or {}).items():
+        for url, sha256 in source_urls(source):
+            sources.append((path, recipe, folder, str(version), url, urlparse(url).hostname or "", sha256))
+    patches = []
+    for version, version_patches in (data.get("patches") or {}).items():
+        for patch in version_patches or []:
+            if isinstance(patch, dict):
+                patches.append((path, recipe, folder, str(version)) + tuple(_text(patch.get(field)) for field in (
+                    "patch_file", "patch_type", "patch_source", "patch_description")))
+    return {"sources": sources, "patches": patches}
+
+
+def _recipe_constants(tree):
+    """String constants of a recipe: module and class attributes, and properties returning a literal"""
+    constants = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    constants[target.id] = node.value.value
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for attr in node.body:
+            if isinstance(attr, ast.Assign) and isinstance(attr.value, ast.Constant) and isinstance(attr.value.value, str):
+                for target in attr.targets:
+                    if isinstance(target, ast.Name):
+                        constants[f"self.{target.id}"] = attr.value.value
+            elif isinstance(attr, ast.FunctionDef) and any(isinstance(d, ast.Name) and d.id == "property"
+                                                           for d in attr.decorator_list):
+                body = [statement for statement in attr.body
+                        if not (isinstance(statement, ast.Expr) and isinstance(statement.value, ast.Constant))]
+                if len(body) == 1 and isinstance(body[0], ast.Return) and isinstance(body[0].value, ast.Constant) \
+                        and isinstance(body[0].value.value, str):
+                    constants[f"self.{attr.name}"] = body[0].value.value
+    return constants
+
+
+def _resolve(node, constants):
+    """Value of a string expression, `*` for its parts which are not constants, None if it is not a string"""
+    if isinstance(node, ast.Constant):
+        return node.value if isinstance(node.value, str) else None
+    if isinstance(node, ast.Name):
+        return constants.get(node.id, "*")
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == "self":
+        return constants.get(f"self.{node.attr}", "*")
+    if isinstance(node, ast.JoinedStr):
+        return "".join(_resolve(value, constants) or "*" if isinstance(value, ast.FormattedValue) else value.value
+                       for value in node.values)
+    if isinstance(node, ast.FormattedValue):
+        return _resolve(node.value, constants)
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left, right = _resolve(node.left, constants), _resolve(node.right, constants)
+        return left + right if left is not None and right is not None else None
+    # "zlib/{}".format(...)
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr == "format" \
+            and isinstance(node.func.value, ast.Constant) and isinstance(node.func.value.value, str):
+        return re.sub(r"\{[^{}]*\}", "*", node.func.value.value)
+    if isinstance(node, (ast.Subscript, ast.Call, ast.IfExp)):
+        return "*"
+    return None
+
+
+def _string_expressions(node):
+    if isinstance(node, (ast.Tuple, ast.List)):
+        for element in node.elts:
+            yield from _string_expressions(element)
+    else:
+        yield node
+
+
+def conanfile_requirements(content, filename="conanfile.py"):
+    """(kind, reference, line) of the references required by a recipe whose package name is known"""
+    tree = ast.parse(content, filename=filename)
+    constants = _recipe_constants(tree)
+    requirements = []
+    for node in ast.walk(tree):
+        # self.requires("zlib/1.2.13"), self.tool_requires(...)
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr in REQUIRES_KINDS \
+                and isinstance(node.func.value, ast.Name) and node.func.value.id == "self" and node.args:
+            kind, value = node.func.attr, node.args[0]
+        # requires = "zlib/1.2.13", "bzip2/1.0.8"
+        elif isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name) \
+                and node.targets[0].id in REQUIRES_KINDS:
+            kind, value = node.targets[0].id, node.value
+        else:
+            continue
+        for expression in _string_expressions(value):
+            reference = _resolve(expression, constants)
+            if reference and "*" not in reference.split("/")[0]:
+                requirements.append((kind, reference, expression.lineno))
+    return requirements
+
+
+def index_conanfile(path, content):
+    _, recipe, folder, _ = path.split("/")
+    try:
+        requirements = conanfile_requirements(content, path)
+    except SyntaxError:
+        requirements = []
+    return {"requires": [(path, recipe, folder, kind, reference, line) for kind, reference, line in requirements]}
+
+
+INDEXERS = {
+    "config.yml": index_config,
+    "conandata.yml": index_conandata,
+    "conanfile.py": index_conanfile,
+}
+
+
+class RecipeIndex:
+    def __init__(self, database):
+        os.makedirs(os.path.dirname(os.path.abspath(database)), exist_ok=True)
+        self.connection = sqlite3.connect(database)
+        self.connection.executescript(SCHEMA)
+        if self.connection.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+            with self.connection:
+                for table in TABLES + ["files"]:
+                    self.connection.execute(f"DELETE FROM {table}")
+                self.connection.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+
+    def update(self, root):
+        """Index the files changed since the last update, return the number of files parsed"""
+        known = {path: (mtime_ns, size, sha256) for path, mtime_ns, size, sha256 in
+                 self.connection.execute("SELECT path, mtime_ns, size, sha256 FROM files")}
+        parsed = 0
+        with self.connection:
+            current = set()
+            for pattern in FILE_PATTERNS:
+                for path in glob.glob(os.path.join(root, pattern)):
+                    path = os.path.relpath(path, root).replace(os.sep, "/")
+                    current.add(path)
+                    stat = os.stat(os.path.join(root, path))
+                    previous = known.get(path)
+                    if previous and previous[:2] == (stat.st_mtime_ns, stat.st_size):
+                        continue
+                    with open(os.path.join(root, path), "rb") as f:
+                        content = f.read()
+                    sha256 = hashlib.sha256(content).hexdigest()
+                    if not previous or previous[2] != sha256:
+                        self._replace_rows(path, INDEXERS[os.path.basename(path)](path, content.decode("utf-8")))
+                        parsed += 1
+                    self.connection.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                                            (path, stat.st_mtime_ns, stat.st_size, sha256))
+            for path in set(known) - current:
+                self._replace_rows(path, {})
+                self.connection.execute("DELETE FROM files WHERE path = ?", (path,))
+        return parsed
+
+    def _replace_rows(self, path, rows):
+        for table in TABLES:
+            self.connection.execute(f"DELETE FROM {table} WHERE path = ?", (path,))
+            values = rows.get(table, [])
+            if values:
+                placeholders = ", ".join("?" * len(values[0]))
+                self.connection.executemany(f"INSERT INTO {table} VALUES ({placeholders})", values)
+
+    def query(self, sql, parameters=()):
+        cursor = self.connection.execute(sql, parameters)
+        return [column[0] for column in cursor.description or []], cursor.fetchall()
+
+
+def _requires_query(args):
+    # "zlib" matches any version of zlib, "zlib/1.2.11" this version only (with or without user/channel/revision)
+    if "/" in args.reference:
+        condition = "(reference = ? OR reference LIKE ? || '@%' OR reference LIKE ? || '#%')"
+        parameters = [args.reference] * 3
+    else:
+        condition = "reference LIKE ? || '/%'"
+        parameters = [args.reference]
+    return f"SELECT recipe, folder, kind, reference, path, line FROM requires WHERE {condition} " \
+           "ORDER BY recipe, folder, line", parameters
+
+
+def _patches_query(args):
+    conditions, parameters = [], []
+    for column in ("patch_type", "recipe", "version"):
+        value = getattr(args, column.replace("patch_", ""))
+        if value:
+            conditions.append(f"{column} = ?")
+            parameters.append(value)
+    where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+    return "SELECT recipe, folder, version, patch_type, patch_file, patch_source, patch_description FROM patches " \
+           f"{where}ORDER BY recipe, folder, version, patch_file", parameters
+
+
+def _sources_query(args):
+    conditions, parameters = [], []
+    if args.host:
+        # The domain and its subdomains
+        conditions.append("(host = ? OR host LIKE '%.' || ?)")
+        parameters += [args.host, args.host]
+    if args.recipe:
+        conditions.append("recipe = ?")
+        parameters.append(args.recipe)
+    where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+    return f"SELECT recipe, folder, version, url, sha256 FROM sources {where}ORDER BY recipe, folder, version", \
+           parameters
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query an SQLite index of the recipes, updated incrementally.")
+    parser.add_argument("--database", default=os.path.join(os.path.expanduser("~"), ".cache", "cci-recipe-index",
+                                                           "index.sqlite"),
+                        help="path of the index (default: ~/.cache/cci-recipe-index/index.sqlite).")
+    parser.add_argument("--root", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."),
+                        help="root of the conan-center-index repository (default: the one of this script).")
+    parser.add_argument("--no-update", action="store_true", help="query the index without updating it first.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("update", help="only update the index.")
+    requires = subparsers.add_parser("requires", help="recipes requiring a package.")
+    requires.add_argument("reference", help="name (any version) or name/version of the package.")
+    patches = subparsers.add_parser("patches", help="patches of the recipes.")
+    patches.add_argument("--type", help="patch_type (e.g. vulnerability, portability, conan).")
+    patches.add_argument("--recipe", help="name of the recipe.")
+    patches.add_argument("--version", help="version of the recipe.")
+    sources = subparsers.add_parser("sources", help="sources of the recipes.")
+    sources.add_argument("--host", help="host of the URLs, including its subdomains.")
+    sources.add_argument("--recipe", help="name of the recipe.")
+    sql = subparsers.add_parser("sql", help="any SQL query, see the tables in SCHEMA.")
+    sql.add_argument("query")
+    args = parser.parse_args()
+
+    index = RecipeIndex(args.database)
+    if not args.no_update:
+        parsed = index.update(os.path.normpath(args.root))
+        print(f"{parsed} files indexed", file=sys.stderr)
+    if args.command == "update":
+        return
+
+    queries = {"requires": _requires_query, "patches": _patches_query, "sources": _sources_query}
+    if args.command == "sql":
+        columns, rows = index.query(args.query)
+    else:
+        columns, rows = index.query(*queries[args.command](args))
+    print("\t".join(columns))
+    for row in rows:
+        print("\t".join("" if value is None else str(value) for value in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""
+Measure the time and memory Conan spends loading each recipe (importing its conanfile.py), to find the recipes
+slowing down the loading of large dependency graphs:
+
+    python3 tools/recipe_load_profile.py --top 30 --flamegraph load.folded "recipes/*/*/conanfile.py"
+
+Each recipe is loaded in isolation, with the loader of Conan (which must be installed), in a process where Conan
+is already imported like when it loads a graph: the modules imported by a recipe are removed after it is loaded,
+so every recipe pays for its own imports. The time of each load is split between:
+
+- compile: the compilation of the recipe, done on every load since Conan does not write bytecode files for recipes
+  (measured by compiling it separately)
+- imports: the modules imported while loading the recipe (including the time of their own imports)
+- class body: the evaluation of the body of the classes of the recipe (attributes, dictionaries, ...)
+- module body: the rest of the module, like parsing YAML files at import
+
+The time of a recipe is the median of `--repeat` loads. Its memory is the peak of the memory allocated by a separate
+load, traced with tracemalloc (which would slow down the timed loads).
+
+The report ranks the recipes by load time. With --flamegraph, the import stacks and class bodies are written in the
+folded format of flamegraph.pl (also read by speedscope and inferno), in microseconds.
+"""
+
+import argparse
+import builtins
+import glob
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+
+class _LoadProfiler:
+    """Time the imports and class bodies of a recipe while it is loaded, as a tree of frames"""
+
+    def __init__(self, path):
+        self.path = path
+        self.frames = []  # [label, time of the children]
+        self.stacks = defaultdict(float)  # Self time by stack
+        self.imports = 0.0
+        self.class_body = 0.0
+
+    def _enter(self, label):
+        self.frames.append([label, 0.0])
+
+    def _exit(self, elapsed):
+        stack = ";".join(frame[0] for frame in self.frames)
+        _, children = self.frames.pop()
+        self.stacks[stack] += elapsed - children
+        if self.frames:
+            self.frames[-1][1] += elapsed
+
+    def __enter__(self):
+        self._import, self._build_class = builtins.__import__, builtins.__build_class__
+        builtins.__import__, builtins.__build_class__ = self._timed_import, self._timed_build_class
+        self._enter(self.path)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.total = time.perf_counter() - self._start
+        self._exit(self.total)
+        builtins.__import__, builtins.__build_class__ = self._import, self._build_class
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        self._enter(f"import {'.' * level}{name}")
+        start = time.perf_counter()
+        try:
+            return self._import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            if len(self.frames) == 2:
+                self.imports += elapsed
+            self._exit(elapsed)
+
+    def _timed_build_class(self, func, name, *args, **kwargs):
+        if func.__code__.co_filename != self.path:
+            return self._build_class(func, name, *args, **kwargs)
+        self._enter(f"class {name}")
+        start = time.perf_counter()
+        try:
+            return self._build_class(func, name, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            if len(self.frames) == 2:
+                self.class_body += elapsed
+            self._exit(elapsed)
+
+
+def _unload(modules_before):
+    """Remove the modules imported since `modules_before`, and their references from their parent packages"""
+    for name in set(sys.modules) - modules_before:
+        module = sys.modules.pop(name)
+        parent, _, child = name.rpartition(".")
+        if parent in sys.modules and getattr(sys.modules[parent], child, None) is module:
+            delattr(sys.modules[parent], child)
+
+
+def _load(path):
+    from conans.client.loader import _parse_conanfile
+
+    modules_before = set(sys.modules)
+    try:
+        _parse_conanfile(path)
+    finally:
+        _unload(modules_before)
+
+
+def profile_recipe(path, repeat):
+    """Load times of a recipe (median of `repeat` loads), with the stacks of the median load, and its memory peak"""
+    path = os.path.abspath(path)
+    try:
+        loads = []
+        for _ in range(repeat):
+            with _LoadProfiler(path) as profiler:
+                _load(path)
+            loads.append(profiler)
+        tracemalloc.start()
+        try:
+            _load(path)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    except Exception as error:  # Any error of the recipe or of Conan while loading it
+        message = str(error).strip().splitlines()
+        return {"error": f"{type(error).__name__}: {message[0] if message else ''}"}
+    with open(path, "rb") as f:
+        source = f.read()
+    compile_times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        compile(source, path, "exec", dont_inherit=True)
+        compile_times.append(time.perf_counter() - start)
+    median = sorted(loads, key=lambda load: load.total)[len(loads) // 2]
+    compile_time = min(statistics.median(compile_times), median.stacks[path])
+    stacks = dict(median.stacks)
+    stacks[path] -= compile_time
+    stacks[f"{path};compile"] = compile_time
+    return {
+        "total": statistics.median(load.total for load in loads),
+        "compile": compile_time,
+        "imports": median.imports,
+        "class_body": median.class_body,
+        "module_body": median.total - compile_time - median.imports - median.class_body,
+        "memory_peak": peak,
+        "stacks": stacks,
+    }
+
+
+def _init_worker():
+    # Modules loaded by Conan before it loads the recipes of a graph
+    import conans.client.conan_api  # noqa: F401
+    import conans.client.loader  # noqa: F401
+
+
+def _profile(args):
+    path, repeat = args
+    return path, profile_recipe(path, repeat)
+
+
+def report(results, top):
+    ranked = sorted(((path, result) for path, result in results.items() if "error" not in result),
+                    key=lambda item: -item[1]["total"])
+    columns = ["total ms", "compile", "imports", "class", "module", "peak KiB"]
+    lines = [f"{'recipe':<60} " + " ".join(f"{column:>9}" for column in columns)]
+    for path, result in ranked[:top]:
+        lines.append(f"{path:<60} {1000 * result['total']:>9.2f} {1000 * result['compile']:>9.2f} "
+                     f"{1000 * result['imports']:>9.2f} "
+                     f"{1000 * result['class_body']:>9.2f} {1000 * result['module_body']:>9.2f} "
+                     f"{result['memory_peak'] / 1024:>9.0f}")
+    total = sum(result["total"] for _, result in ranked)
+    lines.append(f"{len(ranked)} recipes loaded in {total:.2f} s")
+    return "\n".join(lines)
+
+
+def folded_stacks(results):
+    lines = []
+    for path, result in sorted(results.items()):
+        for stack, elapsed in sorted(result.get("stacks", {}).items()):
+            microseconds = round(elapsed * 1e6)
+            if microseconds > 0:
+                # The root frame is the absolute path of the recipe file, replaced by its folder in the repository
+                lines.append(";".join([os.path.dirname(path)] + stack.split(";")[1:]) + f" {microseconds}")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the time and memory Conan spends loading each recipe.")
+    parser.add_argument("paths", nargs="*", default=["recipes/*/*/conanfile.py"],
+                        help="conanfile.py files or glob patterns (default: 'recipes/*/*/conanfile.py').")
+    parser.add_argument("--root", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."),
+                        help="root of the conan-center-index repository (default: the one of this script).")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed loads of each recipe (default: 5).")
+    parser.add_argument("--top", type=int, default=50, help="number of recipes in the report (default: 50).")
+    parser.add_argument("--output", help="write the measures of all the recipes to this JSON file.")
+    parser.add_argument("--flamegraph", help="write the folded stacks of the loads to this file.")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="number of recipes profiled in parallel (default: number of CPUs).")
+    args = parser.parse_args()
+
+    root = os.path.normpath(args.root)
+    paths = sorted({path for pattern in args.paths
+                    for path in glob.glob(pattern if os.path.isabs(pattern) else os.path.join(root, pattern))})
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker) as executor:
+        results = {os.path.relpath(path, root).replace(os.sep, "/"): result for path, result in
+                   executor.map(_profile, [(path, args.repeat) for path in paths], chunksize=8)}
+
+    print(report(results, args.top))
+    for path, result in sorted(results.items()):
+        if "error" in result:
+            print(f"Could not load {path}: {result['error']}", file=sys.stderr)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+    if args.flamegraph:
+        with open(args.flamegraph, "w", encoding="utf-8") as f:
+            f.write(folded_stacks(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+Keep the sources of the recipes (the `sources` of their conandata.yml files) in a local store, addressed by their
+sha256, so that building a recipe does not download them again from upstream:
+
+    python3 tools/source_cache.py prefetch --recipe zlib openssl
+    python3 tools/source_cache.py conan-cache ~/.conan/download_cache
+    python3 tools/source_cache.py serve --port 8080
+
+`prefetch` downloads the sources missing from the store in parallel, and verifies them against their sha256 before
+adding them. Interrupted downloads are resumed from where they stopped, when the server supports it. With `--mirror`,
+the sources are first requested from another store served by `serve`, then from their URLs.
+
+`conan-cache` adds the sources of the store to a Conan download cache, with the keys `get()` and `download()` look for
+(the URL and sha256 of the source), so that they are not downloaded again. Enable the download cache with:
+
+    conan config set storage.download_cache=~/.conan/download_cache
+    echo "tools.files.download:download_cache=~/.conan/download_cache" >> ~/.conan/global.conf
+
+The sources without a sha256 in conandata.yml are not stored, since they cannot be verified.
+"""
+
+import argparse
+import glob
+import hashlib
+import os
+import shutil
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlsplit, urlunsplit
+from urllib.request import Request, urlopen
+
+import yaml
+
+from recipe_index import Loader, source_urls
+
+
+CHUNK_SIZE = 1 << 20
+
+
+def read_sources(root, recipes=None):
+    """(URL, sha256 as written in conandata.yml) of the sources of the recipes, by sha256"""
+    sources = defaultdict(list)
+    for path in sorted(glob.glob(os.path.join(root, "recipes", "*", "*", "conandata.yml"))):
+        if recipes and path.split(os.sep)[-3] not in recipes:
+            continue
+        with open(path, encoding="utf-8") as f:
+            data = yaml.load(f, Loader=Loader) or {}
+        for source in (data.get("sources") or {}).values():
+            for url, sha256 in source_urls(source):
+                if sha256 and (url, sha256) not in sources[sha256.lower()]:
+                    sources[sha256.lower()].append((url, sha256))
+    return sources
+
+
+class SourceStore:
+    def __init__(self, folder, timeout=60):
+        self.folder = folder
+        self.timeout = timeout
+
+    def path(self, sha256):
+        return os.path.join(self.folder, sha256[:2], sha256)
+
+    def __contains__(self, sha256):
+        return os.path.isfile(self.path(sha256))
+
+    def _partial_path(self, sha256):
+        return os.path.join(self.folder, "partial", sha256)
+
+    def _download(self, url, sha256):
+        """Download (or resume the download of) a source, return whether its content matches the sha256"""
+        partial_path = self._partial_path(sha256)
+        offset = os.path.getsize(partial_path) if os.path.isfile(partial_path) else 0
+        request = Request(url, headers={"Range": f"bytes={offset}-"} if offset else {})
+        try:
+            response = urlopen(request, timeout=self.timeout)
+        except HTTPError as error:
+            if error.code != 416:  # Range Not Satisfiable: the partial file is already complete, or is not the same
+                raise
+            response = None
+        checksum = hashlib.sha256()
+        with open(partial_path, "r+b" if offset else "wb") as f:
+            if response is not None and response.status != 206:
+                # The server sent the whole file
+                f.truncate()
+            else:
+                while True:
+                    chunk = f.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    checksum.update(chunk)
+            if response is not None:
+                with response:
+                    while True:
+                        chunk = response.read(CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        checksum.update(chunk)
+                        f.write(chunk)
+        return checksum.hexdigest() == sha256
+
+    def fetch(self, sha256, urls):
+        """Add a source to the store from the first of its URLs that works, return the error of each URL tried"""
+        if sha256 in self:
+            return []
+        os.makedirs(os.path.join(self.folder, "partial"), exist_ok=True)
+        errors = []
+        for url in urls:
+            try:
+                if self._download(url, sha256):
+                    os.makedirs(os.path.dirname(self.path(sha256)), exist_ok=True)
+                    os.replace(self._partial_path(sha256), self.path(sha256))
+                    return []
+                errors.append(f"{url}: sha256 mismatch")
+            except (OSError, URLError) as error:
+                errors.append(f"{url}: {error}")
+                continue
+            os.remove(self._partial_path(sha256))
+        return errors
+
+    def link(self, path, sha256):
+        """Make a source of the store available at another path, without copying it if possible"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if os.path.exists(path):
+            os.remove(path)
+        try:
+            os.link(self.path(sha256), path)
+        except OSError:
+            shutil.copyfile(self.path(sha256), path)
+
+
+class StoreRequestHandler(SimpleHTTPRequestHandler):
+    """Serve the sources of a store, but not the partial downloads of its partial/ folder"""
+
+    def send_head(self):
+        partial_folder = os.path.join(os.path.abspath(self.directory), "partial")
+        path = os.path.abspath(self.translate_path(self.path))
+        if os.path.commonpath([path, partial_folder]) == partial_folder:
+            self.send_error(404, "File not found")
+            return None
+        return super().send_head()
+
+
+def prefetch(store, sources, jobs, mirror=None):
+    """Download the sources missing from the store, return the sources which could not be downloaded"""
+    missing = {sha256: urls for sha256, urls in sources.items() if sha256 not in store}
+    failed = {}
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        futures = {}
+        for sha256, urls in missing.items():
+            candidates = ([f"{mirror.rstrip('/')}/{sha256[:2]}/{sha256}"] if mirror else []) + [url for url, _ in urls]
+            futures[sha256] = executor.submit(store.fetch, sha256, candidates)
+        for sha256, future in futures.items():
+            errors = future.result()
+            if errors:
+                failed[sha256] = errors
+    return len(missing) - len(failed), failed
+
+
+def _without_query(url):
+    """URL without its query and fragment, except the signed ones of S3 (the query is part of the file)"""
+    parts = urlsplit(url)
+    if parts.netloc.endswith(".amazonaws.com"):
+        return url
+    return urlunsplit(parts[0:3] + ("", ""))
+
+
+def conan_cache_keys(url, checksum):
+    """
+    Names of a file downloaded with a checksum in the download cache of Conan (CachedFileDownloader._get_hash).
+    The query and fragment of the URL are removed before hashing it, but not for the user downloads of Conan 1.59
+    (get() and download() of the recipes): both names are returned when they differ.
+    """
+    return sorted({hashlib.sha256((u + checksum).encode()).hexdigest() for u in (_without_query(url), url)})
+
+
+def fill_conan_cache(store, sources, cache_folder):
+    linked = 0
+    for sha256, urls in sources.items():
+        if sha256 in store:
+            for url, checksum in urls:
+                for key in conan_cache_keys(url, checksum):
+                    store.link(os.path.join(cache_folder, key), sha256)
+                linked += 1
+    return linked
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep the sources of the recipes in a local store, by sha256.")
+    parser.add_argument("--store", default=os.path.join(os.path.expanduser("~"), ".cache", "cci-sources"),
+                        help="folder of the store (default: ~/.cache/cci-sources).")
+    parser.add_argument("--root", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."),
+                        help="root of the conan-center-index repository (default: the one of this script).")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    prefetch_parser = subparsers.add_parser("prefetch", help="download the sources missing from the store.")
+    prefetch_parser.add_argument("--recipe", nargs="+", help="only the sources of these recipes.")
+    prefetch_parser.add_argument("--mirror", help="URL of a store served by the serve command, tried first.")
+    prefetch_parser.add_argument("-j", "--jobs", type=int, default=8,
+                                 help="number of parallel downloads (default: 8).")
+    prefetch_parser.add_argument("--timeout", type=float, default=60, help="timeout of the connections in seconds.")
+    conan_parser = subparsers.add_parser("conan-cache", help="add the sources of the store to a Conan download cache.")
+    conan_parser.add_argument("cache_folder", help="storage.download_cache folder of Conan.")
+    conan_parser.add_argument("--recipe", nargs="+", help="only the sources of these recipes.")
+    serve_parser = subparsers.add_parser("serve", help="serve the store over HTTP, as a mirror for prefetch.")
+    serve_parser.add_argument("--bind", default="127.0.0.1", help="address to listen on (default: 127.0.0.1).")
+    serve_parser.add_argument("--port", type=int, default=8080, help="port to listen on (default: 8080).")
+    args = parser.parse_args()
+
+    root = os.path.normpath(args.root)
+    if args.command == "prefetch":
+        store = SourceStore(args.store, args.timeout)
+        sources = read_sources(root, args.recipe)
+        downloaded, failed = prefetch(store, sources, args.jobs, args.mirror)
+        for sha256, errors in sorted(failed.items()):
+            print(f"Could not download {sha256}:", file=sys.stderr)
+            for error in errors:
+                print(f"    {error}", file=sys.stderr)
+        print(f"{len(sources)} sources, {downloaded} downloaded, {len(failed)} failed", file=sys.stderr)
+        sys.exit(1 if failed else 0)
+    elif args.command == "conan-cache":
+        store = SourceStore(args.store)
+        linked = fill_conan_cache(store, read_sources(root, args.recipe), os.path.expanduser(args.cache_folder))
+        print(f"{linked} URLs added to {args.cache_folder}", file=sys.stderr)
+    elif args.command == "serve":
+        os.makedirs(args.store, exist_ok=True)
+        handler = partial(StoreRequestHandler, directory=args.store)
+        with ThreadingHTTPServer((args.bind, args.port), handler) as server:
+            print(f"Serving {args.store} on http://{args.bind}:{args.port}", file=sys.stderr)
+            server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
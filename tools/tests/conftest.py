@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The tools are scripts importing each other from their folder
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
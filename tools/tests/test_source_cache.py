@@ -0,0 +1,185 @@
+import hashlib
+import os
+import threading
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError
+from urllib.request import urlopen
+
+import pytest
+
+from source_cache import SourceStore, StoreRequestHandler, conan_cache_keys, fill_conan_cache, prefetch
+
+CONTENT = bytes(range(256)) * 1024
+SHA256 = hashlib.sha256(CONTENT).hexdigest()
+
+
+class _SourceHandler(BaseHTTPRequestHandler):
+    """Serves CONTENT at any path, with support of the Range requests unless `ranges` is False"""
+
+    ranges = True
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(self.headers.get("Range"))
+        content, status = CONTENT, 200
+        if self.ranges and self.headers.get("Range"):
+            start = int(self.headers["Range"][len("bytes="):].rstrip("-"))
+            if start >= len(CONTENT):
+                self.send_error(416)
+                return
+            content, status = CONTENT[start:], 206
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def serve():
+    """Start an HTTP server with a handler, return its URL"""
+    servers = []
+
+    def start(handler):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def source_url(serve):
+    _SourceHandler.ranges = True
+    _SourceHandler.requests = []
+    return serve(_SourceHandler) + "/source.tar.gz"
+
+
+def _write_partial(store, sha256, content):
+    os.makedirs(os.path.join(store.folder, "partial"), exist_ok=True)
+    with open(os.path.join(store.folder, "partial", sha256), "wb") as f:
+        f.write(content)
+
+
+def _stored(store, sha256):
+    with open(store.path(sha256), "rb") as f:
+        return f.read()
+
+
+def test_fresh_download(tmp_path, source_url):
+    store = SourceStore(str(tmp_path))
+    assert store.fetch(SHA256, [source_url]) == []
+    assert SHA256 in store
+    assert _stored(store, SHA256) == CONTENT
+    assert _SourceHandler.requests == [None]
+    assert not os.listdir(tmp_path / "partial")
+    # Already in the store
+    assert store.fetch(SHA256, [source_url]) == []
+    assert _SourceHandler.requests == [None]
+
+
+def test_resume_with_range(tmp_path, source_url):
+    store = SourceStore(str(tmp_path))
+    _write_partial(store, SHA256, CONTENT[:1000])
+    assert store.fetch(SHA256, [source_url]) == []
+    assert _SourceHandler.requests == ["bytes=1000-"]
+    assert _stored(store, SHA256) == CONTENT
+
+
+def test_resume_of_complete_partial(tmp_path, source_url):
+    store = SourceStore(str(tmp_path))
+    _write_partial(store, SHA256, CONTENT)
+    assert store.fetch(SHA256, [source_url]) == []
+    assert _SourceHandler.requests == [f"bytes={len(CONTENT)}-"]
+    assert _stored(store, SHA256) == CONTENT
+
+
+def test_range_answered_with_whole_file(tmp_path, source_url):
+    _SourceHandler.ranges = False
+    store = SourceStore(str(tmp_path))
+    # The partial download is discarded, whatever its content
+    _write_partial(store, SHA256, b"x" * 5000)
+    assert store.fetch(SHA256, [source_url]) == []
+    assert _SourceHandler.requests == ["bytes=5000-"]
+    assert _stored(store, SHA256) == CONTENT
+
+
+def test_sha256_mismatch(tmp_path, source_url):
+    store = SourceStore(str(tmp_path))
+    wrong = hashlib.sha256(b"other").hexdigest()
+    assert store.fetch(wrong, [source_url]) == [f"{source_url}: sha256 mismatch"]
+    assert wrong not in store
+    assert not os.path.exists(os.path.join(store.folder, "partial", wrong))
+
+
+def test_next_url_after_error(tmp_path, source_url):
+    store = SourceStore(str(tmp_path), timeout=5)
+    assert store.fetch(SHA256, ["http://127.0.0.1:1/source.tar.gz", source_url]) == []
+    assert _stored(store, SHA256) == CONTENT
+
+
+def test_prefetch_from_mirror(tmp_path, serve, source_url):
+    mirror_store = SourceStore(str(tmp_path / "mirror"))
+    assert mirror_store.fetch(SHA256, [source_url]) == []
+    mirror = serve(partial(StoreRequestHandler, directory=mirror_store.folder))
+    store = SourceStore(str(tmp_path / "store"))
+    downloaded, failed = prefetch(store, {SHA256: [("http://127.0.0.1:1/source.tar.gz", SHA256)]}, 2, mirror)
+    assert (downloaded, failed) == (1, {})
+    assert _stored(store, SHA256) == CONTENT
+
+
+def test_serve_hides_partial_downloads(tmp_path, serve, source_url):
+    store = SourceStore(str(tmp_path))
+    assert store.fetch(SHA256, [source_url]) == []
+    _write_partial(store, "0" * 64, b"partial")
+    url = serve(partial(StoreRequestHandler, directory=store.folder))
+    with urlopen(f"{url}/{SHA256[:2]}/{SHA256}") as response:
+        assert response.read() == CONTENT
+    for path in ["/partial/", f"/partial/{'0' * 64}", f"/{SHA256[:2]}/../partial/{'0' * 64}", "/%70artial/"]:
+        with pytest.raises(HTTPError) as error:
+            urlopen(url + path)
+        assert error.value.code == 404
+
+
+def test_conan_cache_keys(tmp_path):
+    url = "https://github.com/madler/zlib/releases/download/v1.2.13/zlib-1.2.13.tar.gz"
+    assert conan_cache_keys(url, SHA256) == [hashlib.sha256((url + SHA256).encode()).hexdigest()]
+    downloaders = pytest.importorskip("conans.client.downloaders.cached_file_downloader")
+    for user_download in (True, False):
+        downloader = downloaders.CachedFileDownloader(str(tmp_path), None, user_download=user_download)
+        assert conan_cache_keys(url, SHA256) == [downloader._get_hash(url, SHA256)]
+
+
+def test_conan_cache_keys_of_url_with_query(tmp_path):
+    url = "https://sourceforge.net/projects/libpng/files/libpng-1.6.39.tar.xz/download?use_mirror=netix#files"
+    stripped = "https://sourceforge.net/projects/libpng/files/libpng-1.6.39.tar.xz/download"
+    keys = conan_cache_keys(url, SHA256)
+    assert keys == sorted(hashlib.sha256((u + SHA256).encode()).hexdigest() for u in (url, stripped))
+    downloaders = pytest.importorskip("conans.client.downloaders.cached_file_downloader")
+    for user_download in (True, False):
+        downloader = downloaders.CachedFileDownloader(str(tmp_path), None, user_download=user_download)
+        assert downloader._get_hash(url, SHA256) in keys
+
+
+def test_conan_cache_keys_of_signed_s3_url():
+    url = "https://bucket.s3.us-east-1.amazonaws.com/source.tar.gz?X-Amz-Signature=1234"
+    assert conan_cache_keys(url, SHA256) == [hashlib.sha256((url + SHA256).encode()).hexdigest()]
+
+
+def test_fill_conan_cache(tmp_path, source_url):
+    store = SourceStore(str(tmp_path / "store"))
+    assert store.fetch(SHA256, [source_url]) == []
+    cache = tmp_path / "download_cache"
+    urls = [(source_url, SHA256), (source_url + "?mirror=1", SHA256.upper())]
+    assert fill_conan_cache(store, {SHA256: urls}, str(cache)) == 2
+    assert len(os.listdir(cache)) == 3
+    for url, checksum in urls:
+        for key in conan_cache_keys(url, checksum):
+            assert (cache / key).read_bytes() == CONTENT